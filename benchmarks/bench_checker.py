@@ -0,0 +1,106 @@
+"""
+Measure pylint throughput on generated client code with and without the plugin
+
+usage: python -m benchmarks.bench_checker [--modules N] [--functions N] ... [--repeat N] [--json]
+
+Generates a protogen corpus and client modules from benchmarks.clientgen,
+then times pylint over them with and without --load-plugins=pylint_protobuf.
+The time of the same command on an empty module is subtracted, so the lines
+and astroid nodes checked per second leave out interpreter and pylint
+startup.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import astroid
+
+from . import clientgen, protogen
+
+COMMANDS = {
+    'pylint': [
+        sys.executable, '-m', 'pylint', '--persistent=n', '--jobs=1', '--score=n',
+    ],
+    'pylint + pylint_protobuf': [
+        sys.executable, '-m', 'pylint', '--persistent=n', '--jobs=1', '--score=n',
+        '--load-plugins=pylint_protobuf',
+    ],
+}
+PROTO_SPEC = protogen.BASE_SPEC._replace(fields=8)  # includes repeated message fields
+
+
+def time_command(cmd, cwd, repeat):
+    # type: (List[str], str, int) -> float
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([cwd] + sys.path))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def count_source(paths):
+    # type: (List[str]) -> Dict[str, int]
+    lines = nodes = 0
+    for path in paths:
+        with open(path) as f:
+            source = f.read()
+        lines += source.count('\n')
+        mod = astroid.parse(source, apply_transforms=False)
+        nodes += sum(1 for _ in mod.nodes_of_class(astroid.nodes.NodeNG))
+    return {'lines': lines, 'nodes': nodes}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--modules', type=int, default=10, help='client modules to lint')
+    for density in clientgen.DENSITIES:
+        parser.add_argument('--' + density, type=int,
+                            default=getattr(clientgen.BASE_CLIENT, density))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--protoc', default='protoc')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+    client = clientgen.ClientSpec(**{d: getattr(args, d) for d in clientgen.DENSITIES})
+
+    with tempfile.TemporaryDirectory() as outdir:
+        pb2 = protogen.write_corpus(PROTO_SPEC, 'bench_client', outdir, args.protoc)
+        paths = clientgen.write_clients(PROTO_SPEC, client, pb2, outdir, args.modules)
+        empty = os.path.join(outdir, 'empty.py')
+        open(empty, 'w').close()
+        size = count_source(paths)
+        results = {}  # type: Dict[str, Dict[str, float]]
+        for name, cmd in COMMANDS.items():
+            startup = time_command(cmd + [empty], outdir, args.repeat)
+            elapsed = time_command(cmd + paths, outdir, args.repeat)
+            checking = max(elapsed - startup, 1e-9)
+            results[name] = {
+                'startup': startup,
+                'time': elapsed,
+                'lines_per_second': size['lines'] / checking,
+                'nodes_per_second': size['nodes'] / checking,
+            }
+    overhead = results['pylint + pylint_protobuf']['time'] / results['pylint']['time'] - 1
+
+    if args.json:
+        print(json.dumps({'source': size, 'client': client._asdict(), 'results': results,
+                          'overhead': overhead}, indent=2))
+        return
+    print('{} modules, {} lines, {} nodes'.format(args.modules, size['lines'], size['nodes']))
+    print('{:<26} {:>11} {:>9} {:>9} {:>10}'.format(
+        'command', 'startup (s)', 'time (s)', 'lines/s', 'nodes/s'))
+    for name, r in results.items():
+        print('{:<26} {:>11.3f} {:>9.3f} {:>9.0f} {:>10.0f}'.format(
+            name, r['startup'], r['time'], r['lines_per_second'], r['nodes_per_second']))
+    print('plugin overhead: {:+.1%}'.format(overhead))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Compare wall time of pylint-protobuf-check against a full pylint run
+
+usage: python -m benchmarks.bench_cli [--repeat N] [--json] PATH...
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+COMMANDS = {
+    'pylint': [
+        sys.executable, '-m', 'pylint', '--persistent=n', '--load-plugins=pylint_protobuf',
+    ],
+    'pylint --enable=protobuf-descriptor-checker': [
+        sys.executable, '-m', 'pylint', '--persistent=n', '--load-plugins=pylint_protobuf',
+        '--disable=all', '--enable=protobuf-descriptor-checker',
+    ],
+    'pylint-protobuf-check': [
+        sys.executable, '-m', 'pylint_protobuf.cli',
+    ],
+}
+
+
+def time_command(cmd, repeat):
+    # type: (List[str], int) -> List[float]
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+
+    results = {}  # type: Dict[str, Dict[str, float]]
+    for name, cmd in COMMANDS.items():
+        timings = time_command(cmd + args.paths, args.repeat)
+        results[name] = {'min': min(timings), 'median': statistics.median(timings)}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    baseline = results['pylint']['median']
+    print('{:<45} {:>9} {:>9} {:>8}'.format('command', 'min (s)', 'med (s)', 'speedup'))
+    for name, r in results.items():
+        print('{:<45} {:>9.3f} {:>9.3f} {:>7.1f}x'.format(
+            name, r['min'], r['median'], baseline / r['median']))
+
+
+if __name__ == '__main__':
+    main()
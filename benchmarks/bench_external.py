@@ -0,0 +1,107 @@
+"""
+Measure checking of fields whose message type is defined in an imported file
+
+usage: python -m benchmarks.bench_external [--imports N] [--functions N] [--repeat N]
+                                           [--descriptors runtime|builtin]... [--json]
+
+Generates a protogen corpus where every message has a field of the Dep
+message of each of N imported files, and a client module where every
+function reads dep<k>.x and assigns an undefined dep<k>.missing. Linting the
+client shows how many of those assignments are reported and how often the
+checker gave up inferring a receiver, along with the time taken. Each run is
+a separate process, so that no module is cached between them.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from .bench_transform import DESCRIPTORS
+from .protogen import BASE_SPEC, Spec, write_corpus
+
+
+def client_source(spec, pb2, functions):
+    # type: (Spec, str, int) -> str
+    lines = ['import {} as pb2'.format(pb2)]
+    for k in range(functions):
+        dep = 'dep{}'.format(k % spec.imports)
+        lines += [
+            '', '',
+            'def func{}():'.format(k),
+            '    m = pb2.M{}()'.format(k % spec.messages),
+            '    x = m.{}.x'.format(dep),
+            '    m.{}.missing = x'.format(dep),
+            '    return m',
+        ]
+    return '\n'.join(lines) + '\n'
+
+
+def measure(outdir, client, descriptors):
+    # type: (str, str, str) -> Dict[str, Any]
+    from pylint.lint import Run
+    from pylint.reporters import CollectingReporter
+    from pylint_protobuf.events import INFERENCE_ABANDONED, subscribed
+
+    abandoned = []  # type: List[str]
+    reporter = CollectingReporter()
+    sys.path.insert(0, outdir)
+    start = time.perf_counter()
+    with subscribed(INFERENCE_ABANDONED, lambda event: abandoned.append(event.data['reason'])):
+        Run(['--load-plugins=pylint_protobuf', '--protobuf-descriptors=' + descriptors,
+             '--disable=all', '--enable=protobuf-undefined-attribute', '--persistent=n', client],
+            reporter=reporter, exit=False)
+    return {
+        'time': time.perf_counter() - start,
+        'reported': sum(
+            1 for m in reporter.messages if m.symbol == 'protobuf-undefined-attribute'),
+        'abandoned': len(abandoned),
+    }
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['measure']:
+        print(json.dumps(measure(*argv[1:4])))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--imports', type=int, default=8, help='files imported by the corpus')
+    parser.add_argument('--functions', type=int, default=200, help='functions in the client')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--descriptors', action='append', choices=DESCRIPTORS,
+                        help='how _pb2 modules are read, may be repeated (default: runtime)')
+    parser.add_argument('--protoc', default='protoc')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+    spec = BASE_SPEC._replace(imports=max(args.imports, 1))
+
+    results = {}  # type: Dict[str, Dict[str, Any]]
+    with tempfile.TemporaryDirectory() as outdir:
+        pb2 = write_corpus(spec, 'bench_external', outdir, args.protoc)
+        client = os.path.join(outdir, 'bench_external_client.py')
+        with open(client, 'w') as f:
+            f.write(client_source(spec, pb2, args.functions))
+        for descriptors in args.descriptors or ['runtime']:
+            cmd = [sys.executable, '-m', 'benchmarks.bench_external', 'measure',
+                   outdir, client, descriptors]
+            runs = [json.loads(subprocess.check_output(cmd)) for _ in range(args.repeat)]
+            results[descriptors] = min(runs, key=lambda r: r['time'])
+
+    if args.json:
+        print(json.dumps(
+            {'imports': spec.imports, 'functions': args.functions, 'results': results},
+            indent=2))
+        return
+    print('{} imported files, {} undefined fields assigned'.format(spec.imports, args.functions))
+    print('{:<10} {:>9} {:>9} {:>10}'.format('read by', 'time (s)', 'reported', 'abandoned'))
+    for descriptors, r in results.items():
+        print('{:<10} {:>9.3f} {:>9} {:>10}'.format(
+            descriptors, r['time'], r['reported'], r['abandoned']))
+
+
+if __name__ == '__main__':
+    main()
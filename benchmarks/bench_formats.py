@@ -0,0 +1,154 @@
+"""
+Compare transform cost across the _pb2 output formats of protoc releases
+
+usage: python -m benchmarks.bench_formats [--repeat N] [--descriptors runtime|builtin]...
+                                         [--prune] [--json]
+       python -m benchmarks.bench_formats generate PROTOC...
+
+benchmarks/corpus/protos holds .proto files written by benchmarks.protogen,
+and benchmarks/corpus/protoc-VERSION their _pb2 modules as compiled by that
+protoc release. Older releases spell out every Descriptor and
+FieldDescriptor, newer ones call AddSerializedFile and the builder module.
+Each format is measured in its own process because they all register the
+same files in the default descriptor pool. With more than one --descriptors
+choice, every format is measured with each, and with --prune each is also
+measured with protobuf-prune-modules.
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from pylint_protobuf.transform import transform_module, use_builtin_descriptors, use_pruned_modules
+
+from .bench_transform import DESCRIPTORS, load_module, measure
+from .protogen import BASE_SPEC, Spec, generate
+
+CORPUS = os.path.join(os.path.dirname(__file__), 'corpus')
+PROTOS = os.path.join(CORPUS, 'protos')
+SPECS = {
+    'small': BASE_SPEC,
+    'large': Spec(messages=16, fields=10, nesting=2, enum_values=16,
+                  oneofs=2, maps=2, extensions=4, imports=2),
+}
+
+
+def write_protos():
+    # type: () -> List[str]
+    os.makedirs(PROTOS, exist_ok=True)
+    files = []
+    for name, spec in SPECS.items():
+        for filename, source in generate(spec, name).items():
+            with open(os.path.join(PROTOS, filename), 'w') as f:
+                f.write(source)
+            files.append(filename)
+    return sorted(files)
+
+
+def compile_corpus(protoc, files):
+    # type: (str, List[str]) -> str
+    version = subprocess.check_output([protoc, '--version'], universal_newlines=True).split()[-1]
+    outdir = os.path.join(CORPUS, 'protoc-' + version)
+    os.makedirs(outdir, exist_ok=True)
+    subprocess.check_call([protoc, '--proto_path=' + PROTOS, '--python_out=' + outdir] + files)
+    return outdir
+
+
+def retained(directory, modname):
+    # type: (str, str) -> int
+    """
+    Returns the memory still allocated for the parsed and transformed module
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        mod = load_module(directory, modname)
+        transform_module(mod)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before
+
+
+def measure_format(directory, repeat):
+    # type: (str, int) -> List[Dict[str, Any]]
+    sys.path.insert(0, directory)  # for imports between modules of the same format
+    rows = []
+    for name in sorted(SPECS):
+        modname = name + '_pb2'
+        path = os.path.join(directory, modname + '.py')
+        parse_times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            load_module(directory, modname)
+            parse_times.append(time.perf_counter() - start)
+        row = {'module': modname, 'bytes': os.path.getsize(path), 'parse_time': min(parse_times)}
+        row.update(measure(directory, modname, repeat))
+        row['retained_bytes'] = retained(directory, modname)
+        rows.append(row)
+    return rows
+
+
+def formats():
+    # type: () -> List[str]
+    dirs = [d for d in os.listdir(CORPUS) if d.startswith('protoc-')]
+    return sorted(dirs, key=lambda d: [int(part) for part in d[len('protoc-'):].split('.')])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['generate']:
+        files = write_protos()
+        for protoc in argv[1:]:
+            print(compile_corpus(protoc, files))
+        return
+    if argv[:1] == ['measure']:
+        use_builtin_descriptors(argv[3] == 'builtin')
+        use_pruned_modules(argv[4] == 'prune')
+        print(json.dumps(measure_format(argv[1], int(argv[2]))))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--descriptors', action='append', choices=DESCRIPTORS,
+                        help='how _pb2 modules are read, may be repeated (default: runtime)')
+    parser.add_argument('--prune', action='store_true', help='also measure with pruned modules')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+    results = {}  # type: Dict[str, List[Dict[str, Any]]]
+    for fmt in formats():
+        for descriptors in args.descriptors or ['runtime']:
+            for prune in ['keep', 'prune'] if args.prune else ['keep']:
+                cmd = [sys.executable, '-m', 'benchmarks.bench_formats', 'measure',
+                       os.path.join(CORPUS, fmt), str(args.repeat), descriptors, prune]
+                rows = json.loads(subprocess.check_output(cmd))
+                for row in rows:
+                    row['descriptors'] = descriptors + ('+prune' if prune == 'prune' else '')
+                results.setdefault(fmt, []).extend(rows)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print('{:<15} {:<10} {:<14} {:>8} {:>10} {:>14} {:>9} {:>12} {:>9}  {}'.format(
+        'format', 'module', 'read by', 'KiB', 'parse (ms)', 'transform (ms)', 'peak KiB',
+        'retained KiB', 'messages', 'error'))
+    row_format = '{:<15} {:<10} {:<14} {:>8.1f} {:>10.2f} {:>14.2f} {:>9.1f} {:>12.1f} {:>9}  {}'
+    for fmt, rows in results.items():
+        for row in rows:
+            print(row_format.format(
+                fmt, row['module'], row['descriptors'], row['bytes'] / 1024,
+                row['parse_time'] * 1000, row['time'] * 1000, row['peak_bytes'] / 1024,
+                row['retained_bytes'] / 1024, row['messages'],
+                (row['exec_error'] or '').split('(')[0],
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Measure the import cost of pylint_protobuf against a budget
+
+usage: python -m benchmarks.bench_import [--repeat N] [--top N] [--json] [--update]
+
+Runs `python -X importtime -c "import pylint.lint; import pylint_protobuf"`
+so that only modules imported for the plugin, and not by pylint itself, are
+counted. Exits with status 1 if the median cumulative import time or the
+number of modules imported is over the budget in benchmarks/import_budget.json
+for this Python and pylint version, or if there is none. --update records the
+measurement and a budget MARGIN over it for this environment.
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional
+
+BUDGET = os.path.join(os.path.dirname(__file__), 'import_budget.json')
+STATEMENT = 'import pylint.lint; import pylint_protobuf'
+# medians of import time vary by up to 40% between runs, the module count not at all
+MARGIN = 1.5
+
+Import = NamedTuple('Import', [
+    ('module', str),
+    ('level', int),
+    ('self_us', int),
+    ('cumulative_us', int),
+])
+
+
+def parse_importtime(stderr):
+    # type: (str) -> List[Import]
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        module = name.strip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(Import(module, level, int(self_us), int(cumulative_us)))
+    return imports
+
+
+def plugin_imports(imports):
+    # type: (List[Import]) -> List[Import]
+    """
+    Returns the top-level pylint_protobuf import and everything it imported
+    """
+    end = max(i for i, imp in enumerate(imports)
+              if imp.module == 'pylint_protobuf' and imp.level == 0)
+    start = end
+    while start > 0 and imports[start - 1].level > 0:
+        start -= 1
+    return imports[start:end + 1]
+
+
+def measure(repeat):
+    # type: (int) -> Dict[str, Any]
+    totals = []
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', STATEMENT],
+                              stderr=subprocess.PIPE, universal_newlines=True, check=True)
+        imports = plugin_imports(parse_importtime(proc.stderr))
+        totals.append(imports[-1].cumulative_us)
+        runs.append(imports)
+    median = statistics.median(totals)
+    imports = runs[totals.index(min(totals, key=lambda t: abs(t - median)))]
+    packages = defaultdict(int)  # type: Dict[str, int]
+    for imp in imports:
+        packages[imp.module.split('.')[0]] += imp.self_us
+    return {
+        'milliseconds': median / 1000,
+        'modules': len(imports),
+        'packages': {name: us / 1000 for name, us in packages.items()},
+        'imports': [imp._asdict() for imp in imports],
+    }
+
+
+def environment():
+    # type: () -> Dict[str, str]
+    """
+    Returns the versions the import time depends on, in this interpreter
+    """
+    script = ('import json, sys, astroid, pylint, google.protobuf; print(json.dumps({'
+              '"python": sys.version.split()[0], "pylint": pylint.__version__, '
+              '"astroid": astroid.__version__, "protobuf": google.protobuf.__version__}))')
+    out = subprocess.check_output([sys.executable, '-c', script], universal_newlines=True)
+    return json.loads(out)
+
+
+def budget_key(versions):
+    # type: (Dict[str, str]) -> str
+    return 'python {}, pylint {}'.format(*(
+        '.'.join(versions[name].split('.')[:2]) for name in ('python', 'pylint')))
+
+
+def over_budget(result, budget):
+    # type: (Dict[str, Any], Optional[Dict[str, Any]]) -> List[str]
+    if budget is None:
+        return ['no budget for this environment, record one with --update']
+    return [
+        '{} {:.1f} > {}'.format(key, result[key], budget[key])
+        for key in ('milliseconds', 'modules') if result[key] > budget[key]
+    ]
+
+
+def new_budget(result, versions):
+    # type: (Dict[str, Any], Dict[str, str]) -> Dict[str, Any]
+    return {
+        'milliseconds': math.ceil(result['milliseconds'] * MARGIN),
+        'modules': result['modules'],
+        'measured': {
+            'milliseconds': round(result['milliseconds'], 1),
+            'versions': versions,
+        },
+    }
+
+
+def main(argv=None):
+    # type: (List[str]) -> int
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--top', type=int, default=10, help='slowest modules to list')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--update', action='store_true',
+                        help='record the budget for this environment from this measurement')
+    args = parser.parse_args(argv)
+
+    result = measure(args.repeat)
+    versions = environment()
+    with open(BUDGET) as f:
+        budgets = json.load(f)
+    if args.update:
+        budgets[budget_key(versions)] = new_budget(result, versions)
+        with open(BUDGET, 'w') as f:
+            json.dump(budgets, f, indent=2, sort_keys=True)
+            f.write('\n')
+    budget = budgets.get(budget_key(versions))
+    failures = over_budget(result, budget)
+
+    if args.json:
+        print(json.dumps(dict(result, budget=budget, over_budget=failures), indent=2))
+    else:
+        limits = budget or {'milliseconds': '-', 'modules': '-'}
+        print('import pylint_protobuf: {:.1f} ms (budget {}), {} modules (budget {})'.format(
+            result['milliseconds'], limits['milliseconds'], result['modules'], limits['modules']))
+        print('environment: {}'.format(budget_key(versions)))
+        print('\nself time by package:')
+        for name, ms in sorted(result['packages'].items(), key=lambda kv: -kv[1]):
+            print('  {:<24} {:>8.1f} ms'.format(name, ms))
+        print('\nslowest modules (self time):')
+        for imp in sorted(result['imports'], key=lambda imp: -imp['self_us'])[:args.top]:
+            print('  {:<48} {:>8.1f} ms'.format(imp['module'], imp['self_us'] / 1000))
+        for failure in failures:
+            print('OVER BUDGET: ' + failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Measure transform_module with lint stubs written by protoc-gen-pylint-protobuf
+
+usage: python -m benchmarks.bench_stubs [--repeat N] [--protoc PROTOC] [--json]
+
+Compiles the protos of benchmarks.bench_formats.SPECS twice, once with only
+--python_out and once with the plugin as well. Each module is then
+transformed in its own process: executed with google.protobuf ("runtime"),
+decoded with builtin descriptors ("builtin"), and loaded from its stubs
+("stubs"). The extra protoc time with the plugin is the cost moved to code
+generation.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from pylint_protobuf.transform import use_builtin_descriptors
+
+from .bench_formats import SPECS
+from .bench_transform import measure
+from .protogen import generate
+
+MODES = ('runtime', 'builtin', 'stubs')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_plugin(path):
+    # type: (str) -> str
+    with open(path, 'w') as f:
+        f.write('#!/bin/sh\nPYTHONPATH={} exec {} -m pylint_protobuf.protoc_plugin\n'.format(
+            ROOT, sys.executable))
+    os.chmod(path, 0o755)
+    return path
+
+
+def compile_protos(protoc, protos, outdir, plugin=None):
+    # type: (str, str, str, Any) -> float
+    os.makedirs(outdir)
+    files = sorted(f for f in os.listdir(protos) if f.endswith('.proto'))
+    cmd = [protoc, '--proto_path=' + protos, '--python_out=' + outdir]
+    if plugin:
+        cmd += ['--plugin=protoc-gen-pylint-protobuf=' + plugin, '--pylint-protobuf_out=' + outdir]
+    start = time.perf_counter()
+    subprocess.check_call(cmd + files)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['measure']:
+        directory, modname, repeat, mode = argv[1:5]
+        use_builtin_descriptors(mode == 'builtin')
+        sys.path.insert(0, directory)
+        print(json.dumps(measure(directory, modname, int(repeat))))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--protoc', default='protoc')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+
+    rows = []  # type: List[Dict[str, Any]]
+    with tempfile.TemporaryDirectory() as tmp:
+        protos = os.path.join(tmp, 'protos')
+        os.makedirs(protos)
+        for name, spec in SPECS.items():
+            for filename, source in generate(spec, name).items():
+                with open(os.path.join(protos, filename), 'w') as f:
+                    f.write(source)
+        files = len(os.listdir(protos))
+        plugin = write_plugin(os.path.join(tmp, 'protoc-gen-pylint-protobuf'))
+        plain, stubs = os.path.join(tmp, 'plain'), os.path.join(tmp, 'stubs')
+        generate_time = compile_protos(args.protoc, protos, stubs, plugin) - \
+            compile_protos(args.protoc, protos, plain)
+        for name in sorted(SPECS):
+            modname = name + '_pb2'
+            for mode in MODES:
+                directory = stubs if mode == 'stubs' else plain
+                cmd = [sys.executable, '-m', 'benchmarks.bench_stubs', 'measure',
+                       directory, modname, str(args.repeat), mode]
+                row = {'module': modname, 'mode': mode}  # type: Dict[str, Any]
+                row.update(json.loads(subprocess.check_output(cmd)))
+                rows.append(row)
+
+    if args.json:
+        print(json.dumps(
+            {'files': files, 'generate_time': generate_time, 'results': rows}, indent=2))
+        return
+    print('plugin adds {:.0f} ms to protoc for {} files'.format(generate_time * 1000, files))
+    print('{:<10} {:<8} {:>14} {:>9} {:>9}  {}'.format(
+        'module', 'mode', 'transform (ms)', 'peak KiB', 'messages', 'error'))
+    for r in rows:
+        print('{:<10} {:<8} {:>14.2f} {:>9.1f} {:>9}  {}'.format(
+            r['module'], r['mode'], r['time'] * 1000, r['peak_bytes'] / 1024, r['messages'],
+            r['exec_error'] or ''))
+
+
+if __name__ == '__main__':
+    main()
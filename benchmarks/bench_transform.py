@@ -0,0 +1,136 @@
+"""
+Measure transform_module time and peak memory as generated protos grow
+
+usage: python -m benchmarks.bench_transform [--dimension DIM]... [--max N] [--repeat N]
+                                             [--descriptors runtime|builtin] [--json]
+
+Each dimension of benchmarks.protogen.Spec is doubled from 1 to --max in
+turn while the others keep their BASE_SPEC values. The "slope" column is
+the growth exponent from the previous row, log(time ratio) / log(size
+ratio): about 1 is linear, about 2 is quadratic.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+import astroid
+
+from pylint_protobuf import transform
+from pylint_protobuf.events import TRANSFORM_END, subscribed
+from pylint_protobuf.prebuild import read_header
+from pylint_protobuf.trace import stub_counts
+from pylint_protobuf.transform import transform_module, use_builtin_descriptors
+
+from .protogen import BASE_SPEC, DIMENSIONS, write_corpus
+
+DESCRIPTORS = ('runtime', 'builtin')
+
+
+def load_module(directory, modname):
+    # type: (str, str) -> astroid.Module
+    path = os.path.join(directory, modname + '.py')
+    # only the header is parsed when builtin descriptors import the module
+    source = read_header(path) if transform.BUILTIN_DESCRIPTORS else None
+    if source is None:
+        with open(path) as f:
+            source = f.read()
+    return astroid.parse(source, module_name=modname, path=path, apply_transforms=False)
+
+
+def measure(directory, modname, repeat):
+    # type: (str, str, int) -> Dict[str, Any]
+    timings = []
+    for _ in range(repeat):
+        mod = load_module(directory, modname)
+        start = time.perf_counter()
+        transform_module(mod)
+        timings.append(time.perf_counter() - start)
+
+    # a separate pass, tracemalloc slows everything down
+    ends = []
+    mod = load_module(directory, modname)
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        with subscribed(TRANSFORM_END, ends.append):
+            transform_module(mod)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    end, = ends
+    messages, enums, stub_nodes = stub_counts(end.data['stubs'])
+    return {
+        'time': min(timings),
+        'peak_bytes': peak - before,
+        'messages': messages,
+        'enums': enums,
+        'stub_nodes': stub_nodes,
+        'exec_error': end.data['exec_error'],
+    }
+
+
+def sweep(dimension, sizes, outdir, repeat, protoc):
+    # type: (str, List[int], str, int, str) -> List[Dict[str, Any]]
+    rows = []
+    for size in sizes:
+        name = 'bench_{}_{}'.format(dimension, size)
+        spec = BASE_SPEC._replace(**{dimension: size})
+        modname = write_corpus(spec, name, outdir, protoc)
+        row = {'dimension': dimension, 'size': size}
+        row.update(measure(outdir, modname, repeat))
+        rows.append(row)
+    return rows
+
+
+def slope(prev, row):
+    # type: (Dict[str, Any], Dict[str, Any]) -> float
+    return math.log(row['time'] / prev['time']) / math.log(row['size'] / prev['size'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--dimension', action='append', choices=DIMENSIONS,
+                        help='dimension to vary, may be repeated (default: all)')
+    parser.add_argument('--max', type=int, default=64, help='largest size of each dimension')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--protoc', default='protoc')
+    parser.add_argument('--descriptors', choices=DESCRIPTORS, default='runtime',
+                        help='execute modules with google.protobuf, or decode their descriptors')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+    use_builtin_descriptors(args.descriptors == 'builtin')
+
+    sizes = [1 << i for i in range(args.max.bit_length()) if 1 << i <= args.max]
+    results = []  # type: List[Dict[str, Any]]
+    with tempfile.TemporaryDirectory() as outdir:
+        sys.path.insert(0, outdir)  # for imports between generated modules
+        for dimension in args.dimension or DIMENSIONS:
+            results += sweep(dimension, sizes, outdir, args.repeat, args.protoc)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print('{:<12} {:>6} {:>10} {:>6} {:>10} {:>10} {:>9}'.format(
+        'dimension', 'size', 'time (ms)', 'slope', 'peak KiB', 'stub nodes', 'messages'))
+    prev = None
+    for row in results:
+        if prev is not None and prev['dimension'] != row['dimension']:
+            prev = None
+        print('{:<12} {:>6} {:>10.2f} {:>6} {:>10.1f} {:>10} {:>9}'.format(
+            row['dimension'], row['size'], row['time'] * 1000,
+            '{:.2f}'.format(slope(prev, row)) if prev else '',
+            row['peak_bytes'] / 1024, row['stub_nodes'], row['messages'],
+        ))
+        if row['exec_error']:
+            print('{:<12} {:>6} {}'.format('', '', row['exec_error'].splitlines()[0]))
+        prev = row
+
+
+if __name__ == '__main__':
+    main()
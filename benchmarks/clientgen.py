@@ -0,0 +1,120 @@
+"""
+Generate Python client modules using a benchmarks.protogen corpus
+
+Every density of a ClientSpec is a count of statements per generated
+function, spread round-robin over the corpus' messages and fields:
+
+    functions      functions per module
+    constructions  messages constructed with a keyword argument
+    reads          field reads
+    writes         scalar field assignments
+    hasfields      HasField calls on singular fields
+    repeated       append/extend on repeated scalars and add on repeated messages
+    enums          Enum0.Value and Enum0.Name calls
+
+The generated code is correct, so the checker does its usual amount of
+inference without emitting messages.
+"""
+import itertools
+import os
+from typing import Iterator, List, NamedTuple, Tuple
+
+from .protogen import Spec, message_fields
+
+ClientSpec = NamedTuple('ClientSpec', [
+    ('functions', int),
+    ('constructions', int),
+    ('reads', int),
+    ('writes', int),
+    ('hasfields', int),
+    ('repeated', int),
+    ('enums', int),
+])
+DENSITIES = ClientSpec._fields
+BASE_CLIENT = ClientSpec(functions=20, constructions=2, reads=4, writes=4,
+                         hasfields=2, repeated=2, enums=1)
+
+VALUES = {
+    'int32': '1', 'int64': '2', 'string': "'s'", 'double': '1.5', 'bool': 'True', 'bytes': "b'b'",
+    'Enum0': 'pb2.ENUM0_V0',
+}
+
+
+def _cycle(items):
+    # type: (List[Tuple[int, str, str, str]]) -> Iterator[Tuple[int, str, str, str]]
+    if not items:
+        return iter(())
+    return itertools.cycle(items)
+
+
+def _function(spec, client, k, fields):
+    # type: (Spec, ClientSpec, int, List[Tuple[int, str, str, str]]) -> List[str]
+    scalars = [f for f in fields if f[1] == 'optional' and f[2] in VALUES]
+    singular = [f for f in fields if f[1] == 'optional']
+    repeated_scalars = [f for f in fields if f[1] == 'repeated' and f[2] in VALUES]
+    repeated_messages = [f for f in fields if f[1] == 'repeated' and f[2] not in VALUES]
+
+    lines = ['def func{}():'.format(k)]
+    used = set()
+
+    def var(i):
+        if i not in used:
+            used.add(i)
+            lines.append('    m{0} = pb2.M{0}()'.format(i))
+        return 'm{}'.format(i)
+
+    for n, (i, _, type_, name) in zip(range(client.constructions), _cycle(scalars)):
+        lines.append('    c{} = pb2.M{}({}={})'.format(n, i, name, VALUES[type_]))
+    for n, (i, _, _, name) in zip(range(client.reads), _cycle(fields)):
+        lines.append('    r{} = {}.{}'.format(n, var(i), name))
+    for _, (i, _, type_, name) in zip(range(client.writes), _cycle(scalars)):
+        lines.append('    {}.{} = {}'.format(var(i), name, VALUES[type_]))
+    for n, (i, _, _, name) in zip(range(client.hasfields), _cycle(singular)):
+        lines.append("    h{} = {}.HasField('{}')".format(n, var(i), name))
+    ops = itertools.chain.from_iterable(itertools.zip_longest(repeated_scalars, repeated_messages))
+    for n, field in zip(range(client.repeated), _cycle([f for f in ops if f is not None])):
+        i, _, type_, name = field
+        if type_ not in VALUES:
+            lines.append('    {}.{}.add()'.format(var(i), name))
+        elif n % 2:
+            lines.append('    {}.{}.extend([{}])'.format(var(i), name, VALUES[type_]))
+        else:
+            lines.append('    {}.{}.append({})'.format(var(i), name, VALUES[type_]))
+    if spec.enum_values:
+        for n in range(client.enums):
+            v = n % spec.enum_values
+            lines.append("    e{0} = pb2.Enum0.Value('ENUM0_V{1}')".format(n, v))
+            lines.append('    n{0} = pb2.Enum0.Name({1})'.format(n, v))
+    returned = ', '.join('m{}'.format(i) for i in sorted(used))
+    lines.append('    return {}'.format(returned or 'None'))
+    return lines
+
+
+def generate(spec, client, pb2):
+    # type: (Spec, ClientSpec, str) -> str
+    # interleave messages so that every density touches all of them
+    fields = [
+        (i, label, type_, name)
+        for i in range(max(spec.messages, 1))
+        for label, type_, name in message_fields(spec, i)
+    ]
+    fields.sort(key=lambda f: (int(f[3][1:]), f[0]))
+    lines = ['import {} as pb2'.format(pb2)]
+    for k in range(client.functions):
+        lines += ['', ''] + _function(spec, client, k, fields)
+    return '\n'.join(lines) + '\n'
+
+
+def write_clients(spec, client, pb2, outdir, modules):
+    # type: (Spec, ClientSpec, str, str, int) -> List[str]
+    """
+    Write the same client module under several names, returning their paths
+    """
+    source = generate(spec, client, pb2)
+    paths = []
+    for n in range(modules):
+        path = os.path.join(outdir, '{}_client{}.py'.format(pb2, n))
+        with open(path, 'w') as f:
+            f.write(source)
+        paths.append(path)
+    return paths
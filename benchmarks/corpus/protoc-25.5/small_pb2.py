@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: small.proto
+# Protobuf Python Version: 4.25.5
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bsmall.proto\x12\x05small\"4\n\x02M0\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\"4\n\x02M1\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\"4\n\x02M2\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\"4\n\x02M3\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08*?\n\x05\x45num0\x12\x0c\n\x08\x45NUM0_V0\x10\x00\x12\x0c\n\x08\x45NUM0_V1\x10\x01\x12\x0c\n\x08\x45NUM0_V2\x10\x02\x12\x0c\n\x08\x45NUM0_V3\x10\x03')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'small_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_ENUM0']._serialized_start=238
+  _globals['_ENUM0']._serialized_end=301
+  _globals['_M0']._serialized_start=22
+  _globals['_M0']._serialized_end=74
+  _globals['_M1']._serialized_start=76
+  _globals['_M1']._serialized_end=128
+  _globals['_M2']._serialized_start=130
+  _globals['_M2']._serialized_end=182
+  _globals['_M3']._serialized_start=184
+  _globals['_M3']._serialized_end=236
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: large.proto
+# Protobuf Python Version: 5.28.3
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    28,
+    3,
+    '',
+    'large.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import large_dep0_pb2 as large__dep0__pb2
+import large_dep1_pb2 as large__dep1__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0blarge.proto\x12\x05large\x1a\x10large_dep0.proto\x1a\x10large_dep1.proto\"\xa9\x04\n\x02M0\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\n\n\x02\x66\x37\x18\x08 \x01(\x05\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M0.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M0.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M0.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M0.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05*\t\x08\xe8\x07\x10\x80\x80\x80\x80\x02\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M1\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M0\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M1.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M1.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M1.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M1.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M2\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M1\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M2.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M2.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M2.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M2.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M3\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M2\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M3.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M3.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M3.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M3.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M4\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M3\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M4.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M4.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M4.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M4.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M5\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M4\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M5.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M5.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M5.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M5.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M6\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M5\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M6.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M6.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M6.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M6.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M7\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M6\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M7.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M7.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M7.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M7.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M8\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M7\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M8.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M8.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M8.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M8.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M9\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M8\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M9.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M9.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M9.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M9.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xae\x04\n\x03M10\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M9\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M10.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M10.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M10.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M10.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M11\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M10\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M11.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M11.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M11.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M11.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M12\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M11\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M12.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M12.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M12.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M12.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M13\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M12\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M13.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M13.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M13.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M13.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M14\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M13\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M14.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M14.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M14.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M14.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M15\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M14\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M15.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M15.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M15.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M15.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1*\xed\x01\n\x05\x45num0\x12\x0c\n\x08\x45NUM0_V0\x10\x00\x12\x0c\n\x08\x45NUM0_V1\x10\x01\x12\x0c\n\x08\x45NUM0_V2\x10\x02\x12\x0c\n\x08\x45NUM0_V3\x10\x03\x12\x0c\n\x08\x45NUM0_V4\x10\x04\x12\x0c\n\x08\x45NUM0_V5\x10\x05\x12\x0c\n\x08\x45NUM0_V6\x10\x06\x12\x0c\n\x08\x45NUM0_V7\x10\x07\x12\x0c\n\x08\x45NUM0_V8\x10\x08\x12\x0c\n\x08\x45NUM0_V9\x10\t\x12\r\n\tENUM0_V10\x10\n\x12\r\n\tENUM0_V11\x10\x0b\x12\r\n\tENUM0_V12\x10\x0c\x12\r\n\tENUM0_V13\x10\r\x12\r\n\tENUM0_V14\x10\x0e\x12\r\n\tENUM0_V15\x10\x0f:\x18\n\x04\x65xt0\x12\t.large.M0\x18\xe8\x07 \x01(\x05:\x18\n\x04\x65xt1\x12\t.large.M0\x18\xe9\x07 \x01(\x05:\x18\n\x04\x65xt2\x12\t.large.M0\x18\xea\x07 \x01(\x05:\x18\n\x04\x65xt3\x12\t.large.M0\x18\xeb\x07 \x01(\x05')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'large_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_M0_MAP0ENTRY']._loaded_options = None
+  _globals['_M0_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M0_MAP1ENTRY']._loaded_options = None
+  _globals['_M0_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M1_MAP0ENTRY']._loaded_options = None
+  _globals['_M1_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M1_MAP1ENTRY']._loaded_options = None
+  _globals['_M1_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M2_MAP0ENTRY']._loaded_options = None
+  _globals['_M2_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M2_MAP1ENTRY']._loaded_options = None
+  _globals['_M2_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M3_MAP0ENTRY']._loaded_options = None
+  _globals['_M3_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M3_MAP1ENTRY']._loaded_options = None
+  _globals['_M3_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M4_MAP0ENTRY']._loaded_options = None
+  _globals['_M4_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M4_MAP1ENTRY']._loaded_options = None
+  _globals['_M4_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M5_MAP0ENTRY']._loaded_options = None
+  _globals['_M5_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M5_MAP1ENTRY']._loaded_options = None
+  _globals['_M5_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M6_MAP0ENTRY']._loaded_options = None
+  _globals['_M6_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M6_MAP1ENTRY']._loaded_options = None
+  _globals['_M6_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M7_MAP0ENTRY']._loaded_options = None
+  _globals['_M7_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M7_MAP1ENTRY']._loaded_options = None
+  _globals['_M7_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M8_MAP0ENTRY']._loaded_options = None
+  _globals['_M8_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M8_MAP1ENTRY']._loaded_options = None
+  _globals['_M8_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M9_MAP0ENTRY']._loaded_options = None
+  _globals['_M9_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M9_MAP1ENTRY']._loaded_options = None
+  _globals['_M9_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M10_MAP0ENTRY']._loaded_options = None
+  _globals['_M10_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M10_MAP1ENTRY']._loaded_options = None
+  _globals['_M10_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M11_MAP0ENTRY']._loaded_options = None
+  _globals['_M11_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M11_MAP1ENTRY']._loaded_options = None
+  _globals['_M11_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M12_MAP0ENTRY']._loaded_options = None
+  _globals['_M12_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M12_MAP1ENTRY']._loaded_options = None
+  _globals['_M12_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M13_MAP0ENTRY']._loaded_options = None
+  _globals['_M13_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M13_MAP1ENTRY']._loaded_options = None
+  _globals['_M13_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M14_MAP0ENTRY']._loaded_options = None
+  _globals['_M14_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M14_MAP1ENTRY']._loaded_options = None
+  _globals['_M14_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_M15_MAP0ENTRY']._loaded_options = None
+  _globals['_M15_MAP0ENTRY']._serialized_options = b'8\001'
+  _globals['_M15_MAP1ENTRY']._loaded_options = None
+  _globals['_M15_MAP1ENTRY']._serialized_options = b'8\001'
+  _globals['_ENUM0']._serialized_start=8990
+  _globals['_ENUM0']._serialized_end=9227
+  _globals['_M0']._serialized_start=59
+  _globals['_M0']._serialized_end=612
+  _globals['_M0_MAP0ENTRY']._serialized_start=425
+  _globals['_M0_MAP0ENTRY']._serialized_end=468
+  _globals['_M0_MAP1ENTRY']._serialized_start=470
+  _globals['_M0_MAP1ENTRY']._serialized_end=513
+  _globals['_M0_N1']._serialized_start=515
+  _globals['_M0_N1']._serialized_end=579
+  _globals['_M0_N1_N2']._serialized_start=564
+  _globals['_M0_N1_N2']._serialized_end=579
+  _globals['_M1']._serialized_start=615
+  _globals['_M1']._serialized_end=1168
+  _globals['_M1_MAP0ENTRY']._serialized_start=425
+  _globals['_M1_MAP0ENTRY']._serialized_end=468
+  _globals['_M1_MAP1ENTRY']._serialized_start=470
+  _globals['_M1_MAP1ENTRY']._serialized_end=513
+  _globals['_M1_N1']._serialized_start=1082
+  _globals['_M1_N1']._serialized_end=1146
+  _globals['_M1_N1_N2']._serialized_start=564
+  _globals['_M1_N1_N2']._serialized_end=579
+  _globals['_M2']._serialized_start=1171
+  _globals['_M2']._serialized_end=1724
+  _globals['_M2_MAP0ENTRY']._serialized_start=425
+  _globals['_M2_MAP0ENTRY']._serialized_end=468
+  _globals['_M2_MAP1ENTRY']._serialized_start=470
+  _globals['_M2_MAP1ENTRY']._serialized_end=513
+  _globals['_M2_N1']._serialized_start=1638
+  _globals['_M2_N1']._serialized_end=1702
+  _globals['_M2_N1_N2']._serialized_start=564
+  _globals['_M2_N1_N2']._serialized_end=579
+  _globals['_M3']._serialized_start=1727
+  _globals['_M3']._serialized_end=2280
+  _globals['_M3_MAP0ENTRY']._serialized_start=425
+  _globals['_M3_MAP0ENTRY']._serialized_end=468
+  _globals['_M3_MAP1ENTRY']._serialized_start=470
+  _globals['_M3_MAP1ENTRY']._serialized_end=513
+  _globals['_M3_N1']._serialized_start=2194
+  _globals['_M3_N1']._serialized_end=2258
+  _globals['_M3_N1_N2']._serialized_start=564
+  _globals['_M3_N1_N2']._serialized_end=579
+  _globals['_M4']._serialized_start=2283
+  _globals['_M4']._serialized_end=2836
+  _globals['_M4_MAP0ENTRY']._serialized_start=425
+  _globals['_M4_MAP0ENTRY']._serialized_end=468
+  _globals['_M4_MAP1ENTRY']._serialized_start=470
+  _globals['_M4_MAP1ENTRY']._serialized_end=513
+  _globals['_M4_N1']._serialized_start=2750
+  _globals['_M4_N1']._serialized_end=2814
+  _globals['_M4_N1_N2']._serialized_start=564
+  _globals['_M4_N1_N2']._serialized_end=579
+  _globals['_M5']._serialized_start=2839
+  _globals['_M5']._serialized_end=3392
+  _globals['_M5_MAP0ENTRY']._serialized_start=425
+  _globals['_M5_MAP0ENTRY']._serialized_end=468
+  _globals['_M5_MAP1ENTRY']._serialized_start=470
+  _globals['_M5_MAP1ENTRY']._serialized_end=513
+  _globals['_M5_N1']._serialized_start=3306
+  _globals['_M5_N1']._serialized_end=3370
+  _globals['_M5_N1_N2']._serialized_start=564
+  _globals['_M5_N1_N2']._serialized_end=579
+  _globals['_M6']._serialized_start=3395
+  _globals['_M6']._serialized_end=3948
+  _globals['_M6_MAP0ENTRY']._serialized_start=425
+  _globals['_M6_MAP0ENTRY']._serialized_end=468
+  _globals['_M6_MAP1ENTRY']._serialized_start=470
+  _globals['_M6_MAP1ENTRY']._serialized_end=513
+  _globals['_M6_N1']._serialized_start=3862
+  _globals['_M6_N1']._serialized_end=3926
+  _globals['_M6_N1_N2']._serialized_start=564
+  _globals['_M6_N1_N2']._serialized_end=579
+  _globals['_M7']._serialized_start=3951
+  _globals['_M7']._serialized_end=4504
+  _globals['_M7_MAP0ENTRY']._serialized_start=425
+  _globals['_M7_MAP0ENTRY']._serialized_end=468
+  _globals['_M7_MAP1ENTRY']._serialized_start=470
+  _globals['_M7_MAP1ENTRY']._serialized_end=513
+  _globals['_M7_N1']._serialized_start=4418
+  _globals['_M7_N1']._serialized_end=4482
+  _globals['_M7_N1_N2']._serialized_start=564
+  _globals['_M7_N1_N2']._serialized_end=579
+  _globals['_M8']._serialized_start=4507
+  _globals['_M8']._serialized_end=5060
+  _globals['_M8_MAP0ENTRY']._serialized_start=425
+  _globals['_M8_MAP0ENTRY']._serialized_end=468
+  _globals['_M8_MAP1ENTRY']._serialized_start=470
+  _globals['_M8_MAP1ENTRY']._serialized_end=513
+  _globals['_M8_N1']._serialized_start=4974
+  _globals['_M8_N1']._serialized_end=5038
+  _globals['_M8_N1_N2']._serialized_start=564
+  _globals['_M8_N1_N2']._serialized_end=579
+  _globals['_M9']._serialized_start=5063
+  _globals['_M9']._serialized_end=5616
+  _globals['_M9_MAP0ENTRY']._serialized_start=425
+  _globals['_M9_MAP0ENTRY']._serialized_end=468
+  _globals['_M9_MAP1ENTRY']._serialized_start=470
+  _globals['_M9_MAP1ENTRY']._serialized_end=513
+  _globals['_M9_N1']._serialized_start=5530
+  _globals['_M9_N1']._serialized_end=5594
+  _globals['_M9_N1_N2']._serialized_start=564
+  _globals['_M9_N1_N2']._serialized_end=579
+  _globals['_M10']._serialized_start=5619
+  _globals['_M10']._serialized_end=6177
+  _globals['_M10_MAP0ENTRY']._serialized_start=425
+  _globals['_M10_MAP0ENTRY']._serialized_end=468
+  _globals['_M10_MAP1ENTRY']._serialized_start=470
+  _globals['_M10_MAP1ENTRY']._serialized_end=513
+  _globals['_M10_N1']._serialized_start=6090
+  _globals['_M10_N1']._serialized_end=6155
+  _globals['_M10_N1_N2']._serialized_start=564
+  _globals['_M10_N1_N2']._serialized_end=579
+  _globals['_M11']._serialized_start=6180
+  _globals['_M11']._serialized_end=6739
+  _globals['_M11_MAP0ENTRY']._serialized_start=425
+  _globals['_M11_MAP0ENTRY']._serialized_end=468
+  _globals['_M11_MAP1ENTRY']._serialized_start=470
+  _globals['_M11_MAP1ENTRY']._serialized_end=513
+  _globals['_M11_N1']._serialized_start=6652
+  _globals['_M11_N1']._serialized_end=6717
+  _globals['_M11_N1_N2']._serialized_start=564
+  _globals['_M11_N1_N2']._serialized_end=579
+  _globals['_M12']._serialized_start=6742
+  _globals['_M12']._serialized_end=7301
+  _globals['_M12_MAP0ENTRY']._serialized_start=425
+  _globals['_M12_MAP0ENTRY']._serialized_end=468
+  _globals['_M12_MAP1ENTRY']._serialized_start=470
+  _globals['_M12_MAP1ENTRY']._serialized_end=513
+  _globals['_M12_N1']._serialized_start=7214
+  _globals['_M12_N1']._serialized_end=7279
+  _globals['_M12_N1_N2']._serialized_start=564
+  _globals['_M12_N1_N2']._serialized_end=579
+  _globals['_M13']._serialized_start=7304
+  _globals['_M13']._serialized_end=7863
+  _globals['_M13_MAP0ENTRY']._serialized_start=425
+  _globals['_M13_MAP0ENTRY']._serialized_end=468
+  _globals['_M13_MAP1ENTRY']._serialized_start=470
+  _globals['_M13_MAP1ENTRY']._serialized_end=513
+  _globals['_M13_N1']._serialized_start=7776
+  _globals['_M13_N1']._serialized_end=7841
+  _globals['_M13_N1_N2']._serialized_start=564
+  _globals['_M13_N1_N2']._serialized_end=579
+  _globals['_M14']._serialized_start=7866
+  _globals['_M14']._serialized_end=8425
+  _globals['_M14_MAP0ENTRY']._serialized_start=425
+  _globals['_M14_MAP0ENTRY']._serialized_end=468
+  _globals['_M14_MAP1ENTRY']._serialized_start=470
+  _globals['_M14_MAP1ENTRY']._serialized_end=513
+  _globals['_M14_N1']._serialized_start=8338
+  _globals['_M14_N1']._serialized_end=8403
+  _globals['_M14_N1_N2']._serialized_start=564
+  _globals['_M14_N1_N2']._serialized_end=579
+  _globals['_M15']._serialized_start=8428
+  _globals['_M15']._serialized_end=8987
+  _globals['_M15_MAP0ENTRY']._serialized_start=425
+  _globals['_M15_MAP0ENTRY']._serialized_end=468
+  _globals['_M15_MAP1ENTRY']._serialized_start=470
+  _globals['_M15_MAP1ENTRY']._serialized_end=513
+  _globals['_M15_N1']._serialized_start=8900
+  _globals['_M15_N1']._serialized_end=8965
+  _globals['_M15_N1_N2']._serialized_start=564
+  _globals['_M15_N1_N2']._serialized_end=579
+# @@protoc_insertion_point(module_scope)
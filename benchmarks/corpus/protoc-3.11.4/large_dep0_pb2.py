@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: large_dep0.proto
+
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='large_dep0.proto',
+  package='large_dep0',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=b'\n\x10large_dep0.proto\x12\nlarge_dep0\"\x10\n\x03\x44\x65p\x12\t\n\x01x\x18\x01 \x01(\x05'
+)
+
+
+
+
+_DEP = _descriptor.Descriptor(
+  name='Dep',
+  full_name='large_dep0.Dep',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large_dep0.Dep.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=32,
+  serialized_end=48,
+)
+
+DESCRIPTOR.message_types_by_name['Dep'] = _DEP
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Dep = _reflection.GeneratedProtocolMessageType('Dep', (_message.Message,), {
+  'DESCRIPTOR' : _DEP,
+  '__module__' : 'large_dep0_pb2'
+  # @@protoc_insertion_point(class_scope:large_dep0.Dep)
+  })
+_sym_db.RegisterMessage(Dep)
+
+
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,6088 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: large.proto
+
+from google.protobuf.internal import enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import large_dep0_pb2 as large__dep0__pb2
+import large_dep1_pb2 as large__dep1__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='large.proto',
+  package='large',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=b'\n\x0blarge.proto\x12\x05large\x1a\x10large_dep0.proto\x1a\x10large_dep1.proto\"\xa9\x04\n\x02M0\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\n\n\x02\x66\x37\x18\x08 \x01(\x05\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M0.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M0.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M0.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M0.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05*\t\x08\xe8\x07\x10\x80\x80\x80\x80\x02\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M1\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M0\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M1.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M1.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M1.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M1.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M2\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M1\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M2.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M2.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M2.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M2.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M3\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M2\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M3.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M3.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M3.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M3.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M4\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M3\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M4.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M4.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M4.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M4.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M5\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M4\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M5.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M5.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M5.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M5.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M6\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M5\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M6.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M6.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M6.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M6.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M7\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M6\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M7.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M7.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M7.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M7.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M8\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M7\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M8.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M8.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M8.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M8.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M9\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M8\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M9.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M9.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M9.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M9.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xae\x04\n\x03M10\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M9\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M10.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M10.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M10.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M10.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M11\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M10\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M11.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M11.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M11.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M11.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M12\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M11\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M12.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M12.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M12.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M12.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M13\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M12\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M13.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M13.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M13.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M13.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M14\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M13\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M14.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M14.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M14.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M14.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M15\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M14\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M15.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M15.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M15.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M15.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1*\xed\x01\n\x05\x45num0\x12\x0c\n\x08\x45NUM0_V0\x10\x00\x12\x0c\n\x08\x45NUM0_V1\x10\x01\x12\x0c\n\x08\x45NUM0_V2\x10\x02\x12\x0c\n\x08\x45NUM0_V3\x10\x03\x12\x0c\n\x08\x45NUM0_V4\x10\x04\x12\x0c\n\x08\x45NUM0_V5\x10\x05\x12\x0c\n\x08\x45NUM0_V6\x10\x06\x12\x0c\n\x08\x45NUM0_V7\x10\x07\x12\x0c\n\x08\x45NUM0_V8\x10\x08\x12\x0c\n\x08\x45NUM0_V9\x10\t\x12\r\n\tENUM0_V10\x10\n\x12\r\n\tENUM0_V11\x10\x0b\x12\r\n\tENUM0_V12\x10\x0c\x12\r\n\tENUM0_V13\x10\r\x12\r\n\tENUM0_V14\x10\x0e\x12\r\n\tENUM0_V15\x10\x0f:\x18\n\x04\x65xt0\x12\t.large.M0\x18\xe8\x07 \x01(\x05:\x18\n\x04\x65xt1\x12\t.large.M0\x18\xe9\x07 \x01(\x05:\x18\n\x04\x65xt2\x12\t.large.M0\x18\xea\x07 \x01(\x05:\x18\n\x04\x65xt3\x12\t.large.M0\x18\xeb\x07 \x01(\x05'
+  ,
+  dependencies=[large__dep0__pb2.DESCRIPTOR,large__dep1__pb2.DESCRIPTOR,])
+
+_ENUM0 = _descriptor.EnumDescriptor(
+  name='Enum0',
+  full_name='large.Enum0',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V0', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V1', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V2', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V3', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V4', index=4, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V5', index=5, number=5,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V6', index=6, number=6,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V7', index=7, number=7,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V8', index=8, number=8,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V9', index=9, number=9,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V10', index=10, number=10,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V11', index=11, number=11,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V12', index=12, number=12,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V13', index=13, number=13,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V14', index=14, number=14,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENUM0_V15', index=15, number=15,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=8990,
+  serialized_end=9227,
+)
+_sym_db.RegisterEnumDescriptor(_ENUM0)
+
+Enum0 = enum_type_wrapper.EnumTypeWrapper(_ENUM0)
+ENUM0_V0 = 0
+ENUM0_V1 = 1
+ENUM0_V2 = 2
+ENUM0_V3 = 3
+ENUM0_V4 = 4
+ENUM0_V5 = 5
+ENUM0_V6 = 6
+ENUM0_V7 = 7
+ENUM0_V8 = 8
+ENUM0_V9 = 9
+ENUM0_V10 = 10
+ENUM0_V11 = 11
+ENUM0_V12 = 12
+ENUM0_V13 = 13
+ENUM0_V14 = 14
+ENUM0_V15 = 15
+
+EXT0_FIELD_NUMBER = 1000
+ext0 = _descriptor.FieldDescriptor(
+  name='ext0', full_name='large.ext0', index=0,
+  number=1000, type=5, cpp_type=1, label=1,
+  has_default_value=False, default_value=0,
+  message_type=None, enum_type=None, containing_type=None,
+  is_extension=True, extension_scope=None,
+  serialized_options=None, file=DESCRIPTOR)
+EXT1_FIELD_NUMBER = 1001
+ext1 = _descriptor.FieldDescriptor(
+  name='ext1', full_name='large.ext1', index=1,
+  number=1001, type=5, cpp_type=1, label=1,
+  has_default_value=False, default_value=0,
+  message_type=None, enum_type=None, containing_type=None,
+  is_extension=True, extension_scope=None,
+  serialized_options=None, file=DESCRIPTOR)
+EXT2_FIELD_NUMBER = 1002
+ext2 = _descriptor.FieldDescriptor(
+  name='ext2', full_name='large.ext2', index=2,
+  number=1002, type=5, cpp_type=1, label=1,
+  has_default_value=False, default_value=0,
+  message_type=None, enum_type=None, containing_type=None,
+  is_extension=True, extension_scope=None,
+  serialized_options=None, file=DESCRIPTOR)
+EXT3_FIELD_NUMBER = 1003
+ext3 = _descriptor.FieldDescriptor(
+  name='ext3', full_name='large.ext3', index=3,
+  number=1003, type=5, cpp_type=1, label=1,
+  has_default_value=False, default_value=0,
+  message_type=None, enum_type=None, containing_type=None,
+  is_extension=True, extension_scope=None,
+  serialized_options=None, file=DESCRIPTOR)
+
+
+_M0_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M0.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M0.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M0.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M0_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M0.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M0.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M0.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M0_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M0.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M0.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M0_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M0.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M0.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M0.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M0_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=515,
+  serialized_end=579,
+)
+
+_M0 = _descriptor.Descriptor(
+  name='M0',
+  full_name='large.M0',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M0.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M0.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M0.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M0.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M0.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M0.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M0.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M0.f7', index=7,
+      number=8, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M0.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M0.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M0.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M0.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M0.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M0.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M0.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M0.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M0.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M0.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M0.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M0_MAP0ENTRY, _M0_MAP1ENTRY, _M0_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=True,
+  syntax='proto2',
+  extension_ranges=[(1000, 536870912), ],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M0.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M0.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=59,
+  serialized_end=612,
+)
+
+
+_M1_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M1.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M1.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M1.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M1_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M1.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M1.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M1.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M1_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M1.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M1.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M1_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M1.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M1.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M1.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M1_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1082,
+  serialized_end=1146,
+)
+
+_M1 = _descriptor.Descriptor(
+  name='M1',
+  full_name='large.M1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M1.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M1.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M1.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M1.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M1.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M1.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M1.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M1.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M1.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M1.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M1.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M1.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M1.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M1.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M1.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M1.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M1.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M1.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M1.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M1_MAP0ENTRY, _M1_MAP1ENTRY, _M1_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M1.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M1.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=615,
+  serialized_end=1168,
+)
+
+
+_M2_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M2.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M2.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M2.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M2_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M2.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M2.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M2.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M2_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M2.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M2.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M2_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M2.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M2.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M2.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M2_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1638,
+  serialized_end=1702,
+)
+
+_M2 = _descriptor.Descriptor(
+  name='M2',
+  full_name='large.M2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M2.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M2.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M2.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M2.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M2.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M2.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M2.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M2.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M2.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M2.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M2.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M2.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M2.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M2.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M2.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M2.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M2.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M2.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M2.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M2_MAP0ENTRY, _M2_MAP1ENTRY, _M2_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M2.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M2.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=1171,
+  serialized_end=1724,
+)
+
+
+_M3_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M3.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M3.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M3.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M3_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M3.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M3.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M3.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M3_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M3.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M3.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M3_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M3.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M3.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M3.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M3_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2194,
+  serialized_end=2258,
+)
+
+_M3 = _descriptor.Descriptor(
+  name='M3',
+  full_name='large.M3',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M3.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M3.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M3.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M3.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M3.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M3.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M3.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M3.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M3.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M3.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M3.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M3.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M3.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M3.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M3.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M3.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M3.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M3.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M3.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M3_MAP0ENTRY, _M3_MAP1ENTRY, _M3_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M3.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M3.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=1727,
+  serialized_end=2280,
+)
+
+
+_M4_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M4.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M4.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M4.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M4_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M4.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M4.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M4.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M4_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M4.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M4.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M4_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M4.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M4.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M4.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M4_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2750,
+  serialized_end=2814,
+)
+
+_M4 = _descriptor.Descriptor(
+  name='M4',
+  full_name='large.M4',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M4.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M4.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M4.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M4.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M4.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M4.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M4.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M4.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M4.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M4.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M4.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M4.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M4.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M4.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M4.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M4.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M4.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M4.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M4.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M4_MAP0ENTRY, _M4_MAP1ENTRY, _M4_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M4.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M4.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=2283,
+  serialized_end=2836,
+)
+
+
+_M5_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M5.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M5.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M5.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M5_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M5.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M5.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M5.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M5_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M5.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M5.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M5_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M5.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M5.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M5.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M5_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3306,
+  serialized_end=3370,
+)
+
+_M5 = _descriptor.Descriptor(
+  name='M5',
+  full_name='large.M5',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M5.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M5.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M5.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M5.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M5.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M5.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M5.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M5.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M5.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M5.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M5.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M5.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M5.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M5.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M5.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M5.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M5.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M5.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M5.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M5_MAP0ENTRY, _M5_MAP1ENTRY, _M5_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M5.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M5.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=2839,
+  serialized_end=3392,
+)
+
+
+_M6_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M6.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M6.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M6.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M6_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M6.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M6.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M6.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M6_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M6.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M6.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M6_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M6.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M6.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M6.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M6_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3862,
+  serialized_end=3926,
+)
+
+_M6 = _descriptor.Descriptor(
+  name='M6',
+  full_name='large.M6',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M6.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M6.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M6.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M6.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M6.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M6.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M6.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M6.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M6.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M6.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M6.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M6.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M6.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M6.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M6.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M6.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M6.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M6.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M6.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M6_MAP0ENTRY, _M6_MAP1ENTRY, _M6_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M6.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M6.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=3395,
+  serialized_end=3948,
+)
+
+
+_M7_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M7.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M7.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M7.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M7_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M7.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M7.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M7.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M7_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M7.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M7.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M7_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M7.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M7.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M7.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M7_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4418,
+  serialized_end=4482,
+)
+
+_M7 = _descriptor.Descriptor(
+  name='M7',
+  full_name='large.M7',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M7.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M7.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M7.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M7.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M7.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M7.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M7.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M7.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M7.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M7.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M7.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M7.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M7.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M7.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M7.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M7.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M7.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M7.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M7.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M7_MAP0ENTRY, _M7_MAP1ENTRY, _M7_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M7.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M7.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=3951,
+  serialized_end=4504,
+)
+
+
+_M8_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M8.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M8.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M8.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M8_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M8.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M8.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M8.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M8_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M8.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M8.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M8_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M8.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M8.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M8.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M8_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4974,
+  serialized_end=5038,
+)
+
+_M8 = _descriptor.Descriptor(
+  name='M8',
+  full_name='large.M8',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M8.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M8.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M8.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M8.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M8.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M8.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M8.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M8.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M8.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M8.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M8.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M8.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M8.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M8.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M8.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M8.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M8.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M8.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M8.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M8_MAP0ENTRY, _M8_MAP1ENTRY, _M8_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M8.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M8.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=4507,
+  serialized_end=5060,
+)
+
+
+_M9_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M9.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M9.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M9.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M9_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M9.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M9.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M9.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M9_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M9.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M9.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M9_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M9.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M9.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M9.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M9_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5530,
+  serialized_end=5594,
+)
+
+_M9 = _descriptor.Descriptor(
+  name='M9',
+  full_name='large.M9',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M9.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M9.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M9.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M9.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M9.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M9.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M9.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M9.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M9.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M9.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M9.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M9.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M9.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M9.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M9.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M9.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M9.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M9.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M9.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M9_MAP0ENTRY, _M9_MAP1ENTRY, _M9_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M9.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M9.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=5063,
+  serialized_end=5616,
+)
+
+
+_M10_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M10.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M10.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M10.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M10_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M10.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M10.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M10.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M10_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M10.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M10.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M10_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M10.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M10.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M10.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M10_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6090,
+  serialized_end=6155,
+)
+
+_M10 = _descriptor.Descriptor(
+  name='M10',
+  full_name='large.M10',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M10.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M10.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M10.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M10.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M10.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M10.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M10.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M10.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M10.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M10.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M10.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M10.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M10.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M10.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M10.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M10.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M10.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M10.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M10.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M10_MAP0ENTRY, _M10_MAP1ENTRY, _M10_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M10.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M10.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=5619,
+  serialized_end=6177,
+)
+
+
+_M11_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M11.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M11.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M11.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M11_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M11.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M11.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M11.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M11_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M11.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M11.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M11_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M11.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M11.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M11.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M11_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6652,
+  serialized_end=6717,
+)
+
+_M11 = _descriptor.Descriptor(
+  name='M11',
+  full_name='large.M11',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M11.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M11.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M11.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M11.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M11.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M11.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M11.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M11.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M11.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M11.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M11.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M11.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M11.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M11.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M11.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M11.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M11.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M11.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M11.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M11_MAP0ENTRY, _M11_MAP1ENTRY, _M11_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M11.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M11.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=6180,
+  serialized_end=6739,
+)
+
+
+_M12_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M12.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M12.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M12.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M12_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M12.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M12.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M12.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M12_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M12.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M12.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M12_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M12.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M12.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M12.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M12_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7214,
+  serialized_end=7279,
+)
+
+_M12 = _descriptor.Descriptor(
+  name='M12',
+  full_name='large.M12',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M12.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M12.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M12.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M12.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M12.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M12.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M12.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M12.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M12.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M12.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M12.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M12.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M12.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M12.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M12.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M12.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M12.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M12.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M12.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M12_MAP0ENTRY, _M12_MAP1ENTRY, _M12_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M12.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M12.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=6742,
+  serialized_end=7301,
+)
+
+
+_M13_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M13.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M13.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M13.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M13_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M13.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M13.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M13.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M13_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M13.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M13.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M13_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M13.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M13.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M13.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M13_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7776,
+  serialized_end=7841,
+)
+
+_M13 = _descriptor.Descriptor(
+  name='M13',
+  full_name='large.M13',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M13.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M13.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M13.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M13.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M13.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M13.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M13.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M13.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M13.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M13.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M13.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M13.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M13.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M13.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M13.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M13.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M13.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M13.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M13.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M13_MAP0ENTRY, _M13_MAP1ENTRY, _M13_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M13.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M13.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=7304,
+  serialized_end=7863,
+)
+
+
+_M14_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M14.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M14.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M14.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M14_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M14.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M14.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M14.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M14_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M14.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M14.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M14_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M14.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M14.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M14.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M14_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8338,
+  serialized_end=8403,
+)
+
+_M14 = _descriptor.Descriptor(
+  name='M14',
+  full_name='large.M14',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M14.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M14.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M14.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M14.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M14.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M14.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M14.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M14.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M14.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M14.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M14.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M14.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M14.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M14.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M14.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M14.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M14.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M14.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M14.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M14_MAP0ENTRY, _M14_MAP1ENTRY, _M14_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M14.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M14.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=7866,
+  serialized_end=8425,
+)
+
+
+_M15_MAP0ENTRY = _descriptor.Descriptor(
+  name='Map0Entry',
+  full_name='large.M15.Map0Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M15.Map0Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M15.Map0Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=425,
+  serialized_end=468,
+)
+
+_M15_MAP1ENTRY = _descriptor.Descriptor(
+  name='Map1Entry',
+  full_name='large.M15.Map1Entry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='large.M15.Map1Entry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='large.M15.Map1Entry.value', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=470,
+  serialized_end=513,
+)
+
+_M15_N1_N2 = _descriptor.Descriptor(
+  name='N2',
+  full_name='large.M15.N1.N2',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M15.N1.N2.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=564,
+  serialized_end=579,
+)
+
+_M15_N1 = _descriptor.Descriptor(
+  name='N1',
+  full_name='large.M15.N1',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='x', full_name='large.M15.N1.x', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='child', full_name='large.M15.N1.child', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M15_N1_N2, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8900,
+  serialized_end=8965,
+)
+
+_M15 = _descriptor.Descriptor(
+  name='M15',
+  full_name='large.M15',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='f0', full_name='large.M15.f0', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f1', full_name='large.M15.f1', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f2', full_name='large.M15.f2', index=2,
+      number=3, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f3', full_name='large.M15.f3', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f4', full_name='large.M15.f4', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f5', full_name='large.M15.f5', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f6', full_name='large.M15.f6', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f7', full_name='large.M15.f7', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f8', full_name='large.M15.f8', index=8,
+      number=9, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='f9', full_name='large.M15.f9', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_a', full_name='large.M15.o0_a', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o0_b', full_name='large.M15.o0_b', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_a', full_name='large.M15.o1_a', index=12,
+      number=13, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='o1_b', full_name='large.M15.o1_b', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map0', full_name='large.M15.map0', index=14,
+      number=15, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map1', full_name='large.M15.map1', index=15,
+      number=16, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep0', full_name='large.M15.dep0', index=16,
+      number=17, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dep1', full_name='large.M15.dep1', index=17,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested', full_name='large.M15.nested', index=18,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_M15_MAP0ENTRY, _M15_MAP1ENTRY, _M15_N1, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='choice0', full_name='large.M15.choice0',
+      index=0, containing_type=None, fields=[]),
+    _descriptor.OneofDescriptor(
+      name='choice1', full_name='large.M15.choice1',
+      index=1, containing_type=None, fields=[]),
+  ],
+  serialized_start=8428,
+  serialized_end=8987,
+)
+
+_M0_MAP0ENTRY.containing_type = _M0
+_M0_MAP1ENTRY.containing_type = _M0
+_M0_N1_N2.containing_type = _M0_N1
+_M0_N1.fields_by_name['child'].message_type = _M0_N1_N2
+_M0_N1.containing_type = _M0
+_M0.fields_by_name['f6'].enum_type = _ENUM0
+_M0.fields_by_name['map0'].message_type = _M0_MAP0ENTRY
+_M0.fields_by_name['map1'].message_type = _M0_MAP1ENTRY
+_M0.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M0.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M0.fields_by_name['nested'].message_type = _M0_N1
+_M0.oneofs_by_name['choice0'].fields.append(
+  _M0.fields_by_name['o0_a'])
+_M0.fields_by_name['o0_a'].containing_oneof = _M0.oneofs_by_name['choice0']
+_M0.oneofs_by_name['choice0'].fields.append(
+  _M0.fields_by_name['o0_b'])
+_M0.fields_by_name['o0_b'].containing_oneof = _M0.oneofs_by_name['choice0']
+_M0.oneofs_by_name['choice1'].fields.append(
+  _M0.fields_by_name['o1_a'])
+_M0.fields_by_name['o1_a'].containing_oneof = _M0.oneofs_by_name['choice1']
+_M0.oneofs_by_name['choice1'].fields.append(
+  _M0.fields_by_name['o1_b'])
+_M0.fields_by_name['o1_b'].containing_oneof = _M0.oneofs_by_name['choice1']
+_M1_MAP0ENTRY.containing_type = _M1
+_M1_MAP1ENTRY.containing_type = _M1
+_M1_N1_N2.containing_type = _M1_N1
+_M1_N1.fields_by_name['child'].message_type = _M1_N1_N2
+_M1_N1.containing_type = _M1
+_M1.fields_by_name['f6'].enum_type = _ENUM0
+_M1.fields_by_name['f7'].message_type = _M0
+_M1.fields_by_name['map0'].message_type = _M1_MAP0ENTRY
+_M1.fields_by_name['map1'].message_type = _M1_MAP1ENTRY
+_M1.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M1.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M1.fields_by_name['nested'].message_type = _M1_N1
+_M1.oneofs_by_name['choice0'].fields.append(
+  _M1.fields_by_name['o0_a'])
+_M1.fields_by_name['o0_a'].containing_oneof = _M1.oneofs_by_name['choice0']
+_M1.oneofs_by_name['choice0'].fields.append(
+  _M1.fields_by_name['o0_b'])
+_M1.fields_by_name['o0_b'].containing_oneof = _M1.oneofs_by_name['choice0']
+_M1.oneofs_by_name['choice1'].fields.append(
+  _M1.fields_by_name['o1_a'])
+_M1.fields_by_name['o1_a'].containing_oneof = _M1.oneofs_by_name['choice1']
+_M1.oneofs_by_name['choice1'].fields.append(
+  _M1.fields_by_name['o1_b'])
+_M1.fields_by_name['o1_b'].containing_oneof = _M1.oneofs_by_name['choice1']
+_M2_MAP0ENTRY.containing_type = _M2
+_M2_MAP1ENTRY.containing_type = _M2
+_M2_N1_N2.containing_type = _M2_N1
+_M2_N1.fields_by_name['child'].message_type = _M2_N1_N2
+_M2_N1.containing_type = _M2
+_M2.fields_by_name['f6'].enum_type = _ENUM0
+_M2.fields_by_name['f7'].message_type = _M1
+_M2.fields_by_name['map0'].message_type = _M2_MAP0ENTRY
+_M2.fields_by_name['map1'].message_type = _M2_MAP1ENTRY
+_M2.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M2.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M2.fields_by_name['nested'].message_type = _M2_N1
+_M2.oneofs_by_name['choice0'].fields.append(
+  _M2.fields_by_name['o0_a'])
+_M2.fields_by_name['o0_a'].containing_oneof = _M2.oneofs_by_name['choice0']
+_M2.oneofs_by_name['choice0'].fields.append(
+  _M2.fields_by_name['o0_b'])
+_M2.fields_by_name['o0_b'].containing_oneof = _M2.oneofs_by_name['choice0']
+_M2.oneofs_by_name['choice1'].fields.append(
+  _M2.fields_by_name['o1_a'])
+_M2.fields_by_name['o1_a'].containing_oneof = _M2.oneofs_by_name['choice1']
+_M2.oneofs_by_name['choice1'].fields.append(
+  _M2.fields_by_name['o1_b'])
+_M2.fields_by_name['o1_b'].containing_oneof = _M2.oneofs_by_name['choice1']
+_M3_MAP0ENTRY.containing_type = _M3
+_M3_MAP1ENTRY.containing_type = _M3
+_M3_N1_N2.containing_type = _M3_N1
+_M3_N1.fields_by_name['child'].message_type = _M3_N1_N2
+_M3_N1.containing_type = _M3
+_M3.fields_by_name['f6'].enum_type = _ENUM0
+_M3.fields_by_name['f7'].message_type = _M2
+_M3.fields_by_name['map0'].message_type = _M3_MAP0ENTRY
+_M3.fields_by_name['map1'].message_type = _M3_MAP1ENTRY
+_M3.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M3.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M3.fields_by_name['nested'].message_type = _M3_N1
+_M3.oneofs_by_name['choice0'].fields.append(
+  _M3.fields_by_name['o0_a'])
+_M3.fields_by_name['o0_a'].containing_oneof = _M3.oneofs_by_name['choice0']
+_M3.oneofs_by_name['choice0'].fields.append(
+  _M3.fields_by_name['o0_b'])
+_M3.fields_by_name['o0_b'].containing_oneof = _M3.oneofs_by_name['choice0']
+_M3.oneofs_by_name['choice1'].fields.append(
+  _M3.fields_by_name['o1_a'])
+_M3.fields_by_name['o1_a'].containing_oneof = _M3.oneofs_by_name['choice1']
+_M3.oneofs_by_name['choice1'].fields.append(
+  _M3.fields_by_name['o1_b'])
+_M3.fields_by_name['o1_b'].containing_oneof = _M3.oneofs_by_name['choice1']
+_M4_MAP0ENTRY.containing_type = _M4
+_M4_MAP1ENTRY.containing_type = _M4
+_M4_N1_N2.containing_type = _M4_N1
+_M4_N1.fields_by_name['child'].message_type = _M4_N1_N2
+_M4_N1.containing_type = _M4
+_M4.fields_by_name['f6'].enum_type = _ENUM0
+_M4.fields_by_name['f7'].message_type = _M3
+_M4.fields_by_name['map0'].message_type = _M4_MAP0ENTRY
+_M4.fields_by_name['map1'].message_type = _M4_MAP1ENTRY
+_M4.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M4.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M4.fields_by_name['nested'].message_type = _M4_N1
+_M4.oneofs_by_name['choice0'].fields.append(
+  _M4.fields_by_name['o0_a'])
+_M4.fields_by_name['o0_a'].containing_oneof = _M4.oneofs_by_name['choice0']
+_M4.oneofs_by_name['choice0'].fields.append(
+  _M4.fields_by_name['o0_b'])
+_M4.fields_by_name['o0_b'].containing_oneof = _M4.oneofs_by_name['choice0']
+_M4.oneofs_by_name['choice1'].fields.append(
+  _M4.fields_by_name['o1_a'])
+_M4.fields_by_name['o1_a'].containing_oneof = _M4.oneofs_by_name['choice1']
+_M4.oneofs_by_name['choice1'].fields.append(
+  _M4.fields_by_name['o1_b'])
+_M4.fields_by_name['o1_b'].containing_oneof = _M4.oneofs_by_name['choice1']
+_M5_MAP0ENTRY.containing_type = _M5
+_M5_MAP1ENTRY.containing_type = _M5
+_M5_N1_N2.containing_type = _M5_N1
+_M5_N1.fields_by_name['child'].message_type = _M5_N1_N2
+_M5_N1.containing_type = _M5
+_M5.fields_by_name['f6'].enum_type = _ENUM0
+_M5.fields_by_name['f7'].message_type = _M4
+_M5.fields_by_name['map0'].message_type = _M5_MAP0ENTRY
+_M5.fields_by_name['map1'].message_type = _M5_MAP1ENTRY
+_M5.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M5.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M5.fields_by_name['nested'].message_type = _M5_N1
+_M5.oneofs_by_name['choice0'].fields.append(
+  _M5.fields_by_name['o0_a'])
+_M5.fields_by_name['o0_a'].containing_oneof = _M5.oneofs_by_name['choice0']
+_M5.oneofs_by_name['choice0'].fields.append(
+  _M5.fields_by_name['o0_b'])
+_M5.fields_by_name['o0_b'].containing_oneof = _M5.oneofs_by_name['choice0']
+_M5.oneofs_by_name['choice1'].fields.append(
+  _M5.fields_by_name['o1_a'])
+_M5.fields_by_name['o1_a'].containing_oneof = _M5.oneofs_by_name['choice1']
+_M5.oneofs_by_name['choice1'].fields.append(
+  _M5.fields_by_name['o1_b'])
+_M5.fields_by_name['o1_b'].containing_oneof = _M5.oneofs_by_name['choice1']
+_M6_MAP0ENTRY.containing_type = _M6
+_M6_MAP1ENTRY.containing_type = _M6
+_M6_N1_N2.containing_type = _M6_N1
+_M6_N1.fields_by_name['child'].message_type = _M6_N1_N2
+_M6_N1.containing_type = _M6
+_M6.fields_by_name['f6'].enum_type = _ENUM0
+_M6.fields_by_name['f7'].message_type = _M5
+_M6.fields_by_name['map0'].message_type = _M6_MAP0ENTRY
+_M6.fields_by_name['map1'].message_type = _M6_MAP1ENTRY
+_M6.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M6.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M6.fields_by_name['nested'].message_type = _M6_N1
+_M6.oneofs_by_name['choice0'].fields.append(
+  _M6.fields_by_name['o0_a'])
+_M6.fields_by_name['o0_a'].containing_oneof = _M6.oneofs_by_name['choice0']
+_M6.oneofs_by_name['choice0'].fields.append(
+  _M6.fields_by_name['o0_b'])
+_M6.fields_by_name['o0_b'].containing_oneof = _M6.oneofs_by_name['choice0']
+_M6.oneofs_by_name['choice1'].fields.append(
+  _M6.fields_by_name['o1_a'])
+_M6.fields_by_name['o1_a'].containing_oneof = _M6.oneofs_by_name['choice1']
+_M6.oneofs_by_name['choice1'].fields.append(
+  _M6.fields_by_name['o1_b'])
+_M6.fields_by_name['o1_b'].containing_oneof = _M6.oneofs_by_name['choice1']
+_M7_MAP0ENTRY.containing_type = _M7
+_M7_MAP1ENTRY.containing_type = _M7
+_M7_N1_N2.containing_type = _M7_N1
+_M7_N1.fields_by_name['child'].message_type = _M7_N1_N2
+_M7_N1.containing_type = _M7
+_M7.fields_by_name['f6'].enum_type = _ENUM0
+_M7.fields_by_name['f7'].message_type = _M6
+_M7.fields_by_name['map0'].message_type = _M7_MAP0ENTRY
+_M7.fields_by_name['map1'].message_type = _M7_MAP1ENTRY
+_M7.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M7.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M7.fields_by_name['nested'].message_type = _M7_N1
+_M7.oneofs_by_name['choice0'].fields.append(
+  _M7.fields_by_name['o0_a'])
+_M7.fields_by_name['o0_a'].containing_oneof = _M7.oneofs_by_name['choice0']
+_M7.oneofs_by_name['choice0'].fields.append(
+  _M7.fields_by_name['o0_b'])
+_M7.fields_by_name['o0_b'].containing_oneof = _M7.oneofs_by_name['choice0']
+_M7.oneofs_by_name['choice1'].fields.append(
+  _M7.fields_by_name['o1_a'])
+_M7.fields_by_name['o1_a'].containing_oneof = _M7.oneofs_by_name['choice1']
+_M7.oneofs_by_name['choice1'].fields.append(
+  _M7.fields_by_name['o1_b'])
+_M7.fields_by_name['o1_b'].containing_oneof = _M7.oneofs_by_name['choice1']
+_M8_MAP0ENTRY.containing_type = _M8
+_M8_MAP1ENTRY.containing_type = _M8
+_M8_N1_N2.containing_type = _M8_N1
+_M8_N1.fields_by_name['child'].message_type = _M8_N1_N2
+_M8_N1.containing_type = _M8
+_M8.fields_by_name['f6'].enum_type = _ENUM0
+_M8.fields_by_name['f7'].message_type = _M7
+_M8.fields_by_name['map0'].message_type = _M8_MAP0ENTRY
+_M8.fields_by_name['map1'].message_type = _M8_MAP1ENTRY
+_M8.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M8.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M8.fields_by_name['nested'].message_type = _M8_N1
+_M8.oneofs_by_name['choice0'].fields.append(
+  _M8.fields_by_name['o0_a'])
+_M8.fields_by_name['o0_a'].containing_oneof = _M8.oneofs_by_name['choice0']
+_M8.oneofs_by_name['choice0'].fields.append(
+  _M8.fields_by_name['o0_b'])
+_M8.fields_by_name['o0_b'].containing_oneof = _M8.oneofs_by_name['choice0']
+_M8.oneofs_by_name['choice1'].fields.append(
+  _M8.fields_by_name['o1_a'])
+_M8.fields_by_name['o1_a'].containing_oneof = _M8.oneofs_by_name['choice1']
+_M8.oneofs_by_name['choice1'].fields.append(
+  _M8.fields_by_name['o1_b'])
+_M8.fields_by_name['o1_b'].containing_oneof = _M8.oneofs_by_name['choice1']
+_M9_MAP0ENTRY.containing_type = _M9
+_M9_MAP1ENTRY.containing_type = _M9
+_M9_N1_N2.containing_type = _M9_N1
+_M9_N1.fields_by_name['child'].message_type = _M9_N1_N2
+_M9_N1.containing_type = _M9
+_M9.fields_by_name['f6'].enum_type = _ENUM0
+_M9.fields_by_name['f7'].message_type = _M8
+_M9.fields_by_name['map0'].message_type = _M9_MAP0ENTRY
+_M9.fields_by_name['map1'].message_type = _M9_MAP1ENTRY
+_M9.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M9.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M9.fields_by_name['nested'].message_type = _M9_N1
+_M9.oneofs_by_name['choice0'].fields.append(
+  _M9.fields_by_name['o0_a'])
+_M9.fields_by_name['o0_a'].containing_oneof = _M9.oneofs_by_name['choice0']
+_M9.oneofs_by_name['choice0'].fields.append(
+  _M9.fields_by_name['o0_b'])
+_M9.fields_by_name['o0_b'].containing_oneof = _M9.oneofs_by_name['choice0']
+_M9.oneofs_by_name['choice1'].fields.append(
+  _M9.fields_by_name['o1_a'])
+_M9.fields_by_name['o1_a'].containing_oneof = _M9.oneofs_by_name['choice1']
+_M9.oneofs_by_name['choice1'].fields.append(
+  _M9.fields_by_name['o1_b'])
+_M9.fields_by_name['o1_b'].containing_oneof = _M9.oneofs_by_name['choice1']
+_M10_MAP0ENTRY.containing_type = _M10
+_M10_MAP1ENTRY.containing_type = _M10
+_M10_N1_N2.containing_type = _M10_N1
+_M10_N1.fields_by_name['child'].message_type = _M10_N1_N2
+_M10_N1.containing_type = _M10
+_M10.fields_by_name['f6'].enum_type = _ENUM0
+_M10.fields_by_name['f7'].message_type = _M9
+_M10.fields_by_name['map0'].message_type = _M10_MAP0ENTRY
+_M10.fields_by_name['map1'].message_type = _M10_MAP1ENTRY
+_M10.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M10.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M10.fields_by_name['nested'].message_type = _M10_N1
+_M10.oneofs_by_name['choice0'].fields.append(
+  _M10.fields_by_name['o0_a'])
+_M10.fields_by_name['o0_a'].containing_oneof = _M10.oneofs_by_name['choice0']
+_M10.oneofs_by_name['choice0'].fields.append(
+  _M10.fields_by_name['o0_b'])
+_M10.fields_by_name['o0_b'].containing_oneof = _M10.oneofs_by_name['choice0']
+_M10.oneofs_by_name['choice1'].fields.append(
+  _M10.fields_by_name['o1_a'])
+_M10.fields_by_name['o1_a'].containing_oneof = _M10.oneofs_by_name['choice1']
+_M10.oneofs_by_name['choice1'].fields.append(
+  _M10.fields_by_name['o1_b'])
+_M10.fields_by_name['o1_b'].containing_oneof = _M10.oneofs_by_name['choice1']
+_M11_MAP0ENTRY.containing_type = _M11
+_M11_MAP1ENTRY.containing_type = _M11
+_M11_N1_N2.containing_type = _M11_N1
+_M11_N1.fields_by_name['child'].message_type = _M11_N1_N2
+_M11_N1.containing_type = _M11
+_M11.fields_by_name['f6'].enum_type = _ENUM0
+_M11.fields_by_name['f7'].message_type = _M10
+_M11.fields_by_name['map0'].message_type = _M11_MAP0ENTRY
+_M11.fields_by_name['map1'].message_type = _M11_MAP1ENTRY
+_M11.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M11.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M11.fields_by_name['nested'].message_type = _M11_N1
+_M11.oneofs_by_name['choice0'].fields.append(
+  _M11.fields_by_name['o0_a'])
+_M11.fields_by_name['o0_a'].containing_oneof = _M11.oneofs_by_name['choice0']
+_M11.oneofs_by_name['choice0'].fields.append(
+  _M11.fields_by_name['o0_b'])
+_M11.fields_by_name['o0_b'].containing_oneof = _M11.oneofs_by_name['choice0']
+_M11.oneofs_by_name['choice1'].fields.append(
+  _M11.fields_by_name['o1_a'])
+_M11.fields_by_name['o1_a'].containing_oneof = _M11.oneofs_by_name['choice1']
+_M11.oneofs_by_name['choice1'].fields.append(
+  _M11.fields_by_name['o1_b'])
+_M11.fields_by_name['o1_b'].containing_oneof = _M11.oneofs_by_name['choice1']
+_M12_MAP0ENTRY.containing_type = _M12
+_M12_MAP1ENTRY.containing_type = _M12
+_M12_N1_N2.containing_type = _M12_N1
+_M12_N1.fields_by_name['child'].message_type = _M12_N1_N2
+_M12_N1.containing_type = _M12
+_M12.fields_by_name['f6'].enum_type = _ENUM0
+_M12.fields_by_name['f7'].message_type = _M11
+_M12.fields_by_name['map0'].message_type = _M12_MAP0ENTRY
+_M12.fields_by_name['map1'].message_type = _M12_MAP1ENTRY
+_M12.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M12.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M12.fields_by_name['nested'].message_type = _M12_N1
+_M12.oneofs_by_name['choice0'].fields.append(
+  _M12.fields_by_name['o0_a'])
+_M12.fields_by_name['o0_a'].containing_oneof = _M12.oneofs_by_name['choice0']
+_M12.oneofs_by_name['choice0'].fields.append(
+  _M12.fields_by_name['o0_b'])
+_M12.fields_by_name['o0_b'].containing_oneof = _M12.oneofs_by_name['choice0']
+_M12.oneofs_by_name['choice1'].fields.append(
+  _M12.fields_by_name['o1_a'])
+_M12.fields_by_name['o1_a'].containing_oneof = _M12.oneofs_by_name['choice1']
+_M12.oneofs_by_name['choice1'].fields.append(
+  _M12.fields_by_name['o1_b'])
+_M12.fields_by_name['o1_b'].containing_oneof = _M12.oneofs_by_name['choice1']
+_M13_MAP0ENTRY.containing_type = _M13
+_M13_MAP1ENTRY.containing_type = _M13
+_M13_N1_N2.containing_type = _M13_N1
+_M13_N1.fields_by_name['child'].message_type = _M13_N1_N2
+_M13_N1.containing_type = _M13
+_M13.fields_by_name['f6'].enum_type = _ENUM0
+_M13.fields_by_name['f7'].message_type = _M12
+_M13.fields_by_name['map0'].message_type = _M13_MAP0ENTRY
+_M13.fields_by_name['map1'].message_type = _M13_MAP1ENTRY
+_M13.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M13.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M13.fields_by_name['nested'].message_type = _M13_N1
+_M13.oneofs_by_name['choice0'].fields.append(
+  _M13.fields_by_name['o0_a'])
+_M13.fields_by_name['o0_a'].containing_oneof = _M13.oneofs_by_name['choice0']
+_M13.oneofs_by_name['choice0'].fields.append(
+  _M13.fields_by_name['o0_b'])
+_M13.fields_by_name['o0_b'].containing_oneof = _M13.oneofs_by_name['choice0']
+_M13.oneofs_by_name['choice1'].fields.append(
+  _M13.fields_by_name['o1_a'])
+_M13.fields_by_name['o1_a'].containing_oneof = _M13.oneofs_by_name['choice1']
+_M13.oneofs_by_name['choice1'].fields.append(
+  _M13.fields_by_name['o1_b'])
+_M13.fields_by_name['o1_b'].containing_oneof = _M13.oneofs_by_name['choice1']
+_M14_MAP0ENTRY.containing_type = _M14
+_M14_MAP1ENTRY.containing_type = _M14
+_M14_N1_N2.containing_type = _M14_N1
+_M14_N1.fields_by_name['child'].message_type = _M14_N1_N2
+_M14_N1.containing_type = _M14
+_M14.fields_by_name['f6'].enum_type = _ENUM0
+_M14.fields_by_name['f7'].message_type = _M13
+_M14.fields_by_name['map0'].message_type = _M14_MAP0ENTRY
+_M14.fields_by_name['map1'].message_type = _M14_MAP1ENTRY
+_M14.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M14.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M14.fields_by_name['nested'].message_type = _M14_N1
+_M14.oneofs_by_name['choice0'].fields.append(
+  _M14.fields_by_name['o0_a'])
+_M14.fields_by_name['o0_a'].containing_oneof = _M14.oneofs_by_name['choice0']
+_M14.oneofs_by_name['choice0'].fields.append(
+  _M14.fields_by_name['o0_b'])
+_M14.fields_by_name['o0_b'].containing_oneof = _M14.oneofs_by_name['choice0']
+_M14.oneofs_by_name['choice1'].fields.append(
+  _M14.fields_by_name['o1_a'])
+_M14.fields_by_name['o1_a'].containing_oneof = _M14.oneofs_by_name['choice1']
+_M14.oneofs_by_name['choice1'].fields.append(
+  _M14.fields_by_name['o1_b'])
+_M14.fields_by_name['o1_b'].containing_oneof = _M14.oneofs_by_name['choice1']
+_M15_MAP0ENTRY.containing_type = _M15
+_M15_MAP1ENTRY.containing_type = _M15
+_M15_N1_N2.containing_type = _M15_N1
+_M15_N1.fields_by_name['child'].message_type = _M15_N1_N2
+_M15_N1.containing_type = _M15
+_M15.fields_by_name['f6'].enum_type = _ENUM0
+_M15.fields_by_name['f7'].message_type = _M14
+_M15.fields_by_name['map0'].message_type = _M15_MAP0ENTRY
+_M15.fields_by_name['map1'].message_type = _M15_MAP1ENTRY
+_M15.fields_by_name['dep0'].message_type = large__dep0__pb2._DEP
+_M15.fields_by_name['dep1'].message_type = large__dep1__pb2._DEP
+_M15.fields_by_name['nested'].message_type = _M15_N1
+_M15.oneofs_by_name['choice0'].fields.append(
+  _M15.fields_by_name['o0_a'])
+_M15.fields_by_name['o0_a'].containing_oneof = _M15.oneofs_by_name['choice0']
+_M15.oneofs_by_name['choice0'].fields.append(
+  _M15.fields_by_name['o0_b'])
+_M15.fields_by_name['o0_b'].containing_oneof = _M15.oneofs_by_name['choice0']
+_M15.oneofs_by_name['choice1'].fields.append(
+  _M15.fields_by_name['o1_a'])
+_M15.fields_by_name['o1_a'].containing_oneof = _M15.oneofs_by_name['choice1']
+_M15.oneofs_by_name['choice1'].fields.append(
+  _M15.fields_by_name['o1_b'])
+_M15.fields_by_name['o1_b'].containing_oneof = _M15.oneofs_by_name['choice1']
+DESCRIPTOR.message_types_by_name['M0'] = _M0
+DESCRIPTOR.message_types_by_name['M1'] = _M1
+DESCRIPTOR.message_types_by_name['M2'] = _M2
+DESCRIPTOR.message_types_by_name['M3'] = _M3
+DESCRIPTOR.message_types_by_name['M4'] = _M4
+DESCRIPTOR.message_types_by_name['M5'] = _M5
+DESCRIPTOR.message_types_by_name['M6'] = _M6
+DESCRIPTOR.message_types_by_name['M7'] = _M7
+DESCRIPTOR.message_types_by_name['M8'] = _M8
+DESCRIPTOR.message_types_by_name['M9'] = _M9
+DESCRIPTOR.message_types_by_name['M10'] = _M10
+DESCRIPTOR.message_types_by_name['M11'] = _M11
+DESCRIPTOR.message_types_by_name['M12'] = _M12
+DESCRIPTOR.message_types_by_name['M13'] = _M13
+DESCRIPTOR.message_types_by_name['M14'] = _M14
+DESCRIPTOR.message_types_by_name['M15'] = _M15
+DESCRIPTOR.enum_types_by_name['Enum0'] = _ENUM0
+DESCRIPTOR.extensions_by_name['ext0'] = ext0
+DESCRIPTOR.extensions_by_name['ext1'] = ext1
+DESCRIPTOR.extensions_by_name['ext2'] = ext2
+DESCRIPTOR.extensions_by_name['ext3'] = ext3
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+M0 = _reflection.GeneratedProtocolMessageType('M0', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M0_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M0.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M0_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M0.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M0_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M0.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M0_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M0.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M0,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M0)
+  })
+_sym_db.RegisterMessage(M0)
+_sym_db.RegisterMessage(M0.Map0Entry)
+_sym_db.RegisterMessage(M0.Map1Entry)
+_sym_db.RegisterMessage(M0.N1)
+_sym_db.RegisterMessage(M0.N1.N2)
+
+M1 = _reflection.GeneratedProtocolMessageType('M1', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M1_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M1.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M1_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M1.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M1_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M1.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M1_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M1.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M1,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M1)
+  })
+_sym_db.RegisterMessage(M1)
+_sym_db.RegisterMessage(M1.Map0Entry)
+_sym_db.RegisterMessage(M1.Map1Entry)
+_sym_db.RegisterMessage(M1.N1)
+_sym_db.RegisterMessage(M1.N1.N2)
+
+M2 = _reflection.GeneratedProtocolMessageType('M2', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M2_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M2.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M2_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M2.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M2_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M2.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M2_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M2.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M2,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M2)
+  })
+_sym_db.RegisterMessage(M2)
+_sym_db.RegisterMessage(M2.Map0Entry)
+_sym_db.RegisterMessage(M2.Map1Entry)
+_sym_db.RegisterMessage(M2.N1)
+_sym_db.RegisterMessage(M2.N1.N2)
+
+M3 = _reflection.GeneratedProtocolMessageType('M3', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M3_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M3.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M3_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M3.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M3_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M3.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M3_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M3.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M3,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M3)
+  })
+_sym_db.RegisterMessage(M3)
+_sym_db.RegisterMessage(M3.Map0Entry)
+_sym_db.RegisterMessage(M3.Map1Entry)
+_sym_db.RegisterMessage(M3.N1)
+_sym_db.RegisterMessage(M3.N1.N2)
+
+M4 = _reflection.GeneratedProtocolMessageType('M4', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M4_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M4.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M4_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M4.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M4_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M4.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M4_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M4.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M4,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M4)
+  })
+_sym_db.RegisterMessage(M4)
+_sym_db.RegisterMessage(M4.Map0Entry)
+_sym_db.RegisterMessage(M4.Map1Entry)
+_sym_db.RegisterMessage(M4.N1)
+_sym_db.RegisterMessage(M4.N1.N2)
+
+M5 = _reflection.GeneratedProtocolMessageType('M5', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M5_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M5.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M5_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M5.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M5_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M5.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M5_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M5.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M5,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M5)
+  })
+_sym_db.RegisterMessage(M5)
+_sym_db.RegisterMessage(M5.Map0Entry)
+_sym_db.RegisterMessage(M5.Map1Entry)
+_sym_db.RegisterMessage(M5.N1)
+_sym_db.RegisterMessage(M5.N1.N2)
+
+M6 = _reflection.GeneratedProtocolMessageType('M6', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M6_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M6.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M6_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M6.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M6_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M6.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M6_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M6.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M6,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M6)
+  })
+_sym_db.RegisterMessage(M6)
+_sym_db.RegisterMessage(M6.Map0Entry)
+_sym_db.RegisterMessage(M6.Map1Entry)
+_sym_db.RegisterMessage(M6.N1)
+_sym_db.RegisterMessage(M6.N1.N2)
+
+M7 = _reflection.GeneratedProtocolMessageType('M7', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M7_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M7.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M7_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M7.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M7_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M7.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M7_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M7.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M7,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M7)
+  })
+_sym_db.RegisterMessage(M7)
+_sym_db.RegisterMessage(M7.Map0Entry)
+_sym_db.RegisterMessage(M7.Map1Entry)
+_sym_db.RegisterMessage(M7.N1)
+_sym_db.RegisterMessage(M7.N1.N2)
+
+M8 = _reflection.GeneratedProtocolMessageType('M8', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M8_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M8.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M8_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M8.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M8_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M8.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M8_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M8.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M8,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M8)
+  })
+_sym_db.RegisterMessage(M8)
+_sym_db.RegisterMessage(M8.Map0Entry)
+_sym_db.RegisterMessage(M8.Map1Entry)
+_sym_db.RegisterMessage(M8.N1)
+_sym_db.RegisterMessage(M8.N1.N2)
+
+M9 = _reflection.GeneratedProtocolMessageType('M9', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M9_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M9.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M9_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M9.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M9_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M9.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M9_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M9.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M9,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M9)
+  })
+_sym_db.RegisterMessage(M9)
+_sym_db.RegisterMessage(M9.Map0Entry)
+_sym_db.RegisterMessage(M9.Map1Entry)
+_sym_db.RegisterMessage(M9.N1)
+_sym_db.RegisterMessage(M9.N1.N2)
+
+M10 = _reflection.GeneratedProtocolMessageType('M10', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M10_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M10.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M10_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M10.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M10_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M10.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M10_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M10.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M10,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M10)
+  })
+_sym_db.RegisterMessage(M10)
+_sym_db.RegisterMessage(M10.Map0Entry)
+_sym_db.RegisterMessage(M10.Map1Entry)
+_sym_db.RegisterMessage(M10.N1)
+_sym_db.RegisterMessage(M10.N1.N2)
+
+M11 = _reflection.GeneratedProtocolMessageType('M11', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M11_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M11.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M11_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M11.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M11_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M11.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M11_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M11.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M11,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M11)
+  })
+_sym_db.RegisterMessage(M11)
+_sym_db.RegisterMessage(M11.Map0Entry)
+_sym_db.RegisterMessage(M11.Map1Entry)
+_sym_db.RegisterMessage(M11.N1)
+_sym_db.RegisterMessage(M11.N1.N2)
+
+M12 = _reflection.GeneratedProtocolMessageType('M12', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M12_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M12.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M12_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M12.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M12_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M12.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M12_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M12.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M12,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M12)
+  })
+_sym_db.RegisterMessage(M12)
+_sym_db.RegisterMessage(M12.Map0Entry)
+_sym_db.RegisterMessage(M12.Map1Entry)
+_sym_db.RegisterMessage(M12.N1)
+_sym_db.RegisterMessage(M12.N1.N2)
+
+M13 = _reflection.GeneratedProtocolMessageType('M13', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M13_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M13.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M13_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M13.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M13_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M13.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M13_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M13.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M13,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M13)
+  })
+_sym_db.RegisterMessage(M13)
+_sym_db.RegisterMessage(M13.Map0Entry)
+_sym_db.RegisterMessage(M13.Map1Entry)
+_sym_db.RegisterMessage(M13.N1)
+_sym_db.RegisterMessage(M13.N1.N2)
+
+M14 = _reflection.GeneratedProtocolMessageType('M14', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M14_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M14.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M14_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M14.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M14_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M14.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M14_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M14.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M14,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M14)
+  })
+_sym_db.RegisterMessage(M14)
+_sym_db.RegisterMessage(M14.Map0Entry)
+_sym_db.RegisterMessage(M14.Map1Entry)
+_sym_db.RegisterMessage(M14.N1)
+_sym_db.RegisterMessage(M14.N1.N2)
+
+M15 = _reflection.GeneratedProtocolMessageType('M15', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M15_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M15.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M15_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M15.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M15_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M15.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M15_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M15.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M15,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M15)
+  })
+_sym_db.RegisterMessage(M15)
+_sym_db.RegisterMessage(M15.Map0Entry)
+_sym_db.RegisterMessage(M15.Map1Entry)
+_sym_db.RegisterMessage(M15.N1)
+_sym_db.RegisterMessage(M15.N1.N2)
+
+M0.RegisterExtension(ext0)
+M0.RegisterExtension(ext1)
+M0.RegisterExtension(ext2)
+M0.RegisterExtension(ext3)
+
+_M0_MAP0ENTRY._options = None
+_M0_MAP1ENTRY._options = None
+_M1_MAP0ENTRY._options = None
+_M1_MAP1ENTRY._options = None
+_M2_MAP0ENTRY._options = None
+_M2_MAP1ENTRY._options = None
+_M3_MAP0ENTRY._options = None
+_M3_MAP1ENTRY._options = None
+_M4_MAP0ENTRY._options = None
+_M4_MAP1ENTRY._options = None
+_M5_MAP0ENTRY._options = None
+_M5_MAP1ENTRY._options = None
+_M6_MAP0ENTRY._options = None
+_M6_MAP1ENTRY._options = None
+_M7_MAP0ENTRY._options = None
+_M7_MAP1ENTRY._options = None
+_M8_MAP0ENTRY._options = None
+_M8_MAP1ENTRY._options = None
+_M9_MAP0ENTRY._options = None
+_M9_MAP1ENTRY._options = None
+_M10_MAP0ENTRY._options = None
+_M10_MAP1ENTRY._options = None
+_M11_MAP0ENTRY._options = None
+_M11_MAP1ENTRY._options = None
+_M12_MAP0ENTRY._options = None
+_M12_MAP1ENTRY._options = None
+_M13_MAP0ENTRY._options = None
+_M13_MAP1ENTRY._options = None
+_M14_MAP0ENTRY._options = None
+_M14_MAP1ENTRY._options = None
+_M15_MAP0ENTRY._options = None
+_M15_MAP1ENTRY._options = None
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: large_dep1.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10large_dep1.proto\x12\nlarge_dep1\"\x10\n\x03\x44\x65p\x12\t\n\x01x\x18\x01 \x01(\x05')
+
+
+
+_DEP = DESCRIPTOR.message_types_by_name['Dep']
+Dep = _reflection.GeneratedProtocolMessageType('Dep', (_message.Message,), {
+  'DESCRIPTOR' : _DEP,
+  '__module__' : 'large_dep1_pb2'
+  # @@protoc_insertion_point(class_scope:large_dep1.Dep)
+  })
+_sym_db.RegisterMessage(Dep)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _DEP._serialized_start=32
+  _DEP._serialized_end=48
+# @@protoc_insertion_point(module_scope)
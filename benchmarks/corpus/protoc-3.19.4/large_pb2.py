@@ -0,0 +1,987 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: large.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import large_dep0_pb2 as large__dep0__pb2
+import large_dep1_pb2 as large__dep1__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0blarge.proto\x12\x05large\x1a\x10large_dep0.proto\x1a\x10large_dep1.proto\"\xa9\x04\n\x02M0\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\n\n\x02\x66\x37\x18\x08 \x01(\x05\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M0.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M0.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M0.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M0.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05*\t\x08\xe8\x07\x10\x80\x80\x80\x80\x02\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M1\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M0\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M1.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M1.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M1.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M1.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M2\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M1\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M2.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M2.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M2.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M2.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M3\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M2\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M3.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M3.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M3.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M3.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M4\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M3\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M4.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M4.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M4.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M4.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M5\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M4\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M5.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M5.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M5.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M5.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M6\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M5\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M6.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M6.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M6.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M6.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M7\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M6\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M7.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M7.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M7.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M7.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M8\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M7\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M8.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M8.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M8.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M8.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xa9\x04\n\x02M9\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M8\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12!\n\x04map0\x18\x0f \x03(\x0b\x32\x13.large.M9.Map0Entry\x12!\n\x04map1\x18\x10 \x03(\x0b\x32\x13.large.M9.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1c\n\x06nested\x18\x13 \x01(\x0b\x32\x0c.large.M9.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a@\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1e\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x0f.large.M9.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xae\x04\n\x03M10\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x15\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\t.large.M9\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M10.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M10.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M10.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M10.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M11\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M10\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M11.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M11.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M11.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M11.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M12\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M11\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M12.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M12.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M12.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M12.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M13\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M12\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M13.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M13.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M13.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M13.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M14\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M13\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M14.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M14.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M14.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M14.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1\"\xaf\x04\n\x03M15\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\x12\n\n\x02\x66\x34\x18\x05 \x01(\x0c\x12\n\n\x02\x66\x35\x18\x06 \x03(\x03\x12\x18\n\x02\x66\x36\x18\x07 \x01(\x0e\x32\x0c.large.Enum0\x12\x16\n\x02\x66\x37\x18\x08 \x01(\x0b\x32\n.large.M14\x12\n\n\x02\x66\x38\x18\t \x03(\x05\x12\n\n\x02\x66\x39\x18\n \x01(\t\x12\x0e\n\x04o0_a\x18\x0b \x01(\x05H\x00\x12\x0e\n\x04o0_b\x18\x0c \x01(\tH\x00\x12\x0e\n\x04o1_a\x18\r \x01(\x05H\x01\x12\x0e\n\x04o1_b\x18\x0e \x01(\tH\x01\x12\"\n\x04map0\x18\x0f \x03(\x0b\x32\x14.large.M15.Map0Entry\x12\"\n\x04map1\x18\x10 \x03(\x0b\x32\x14.large.M15.Map1Entry\x12\x1d\n\x04\x64\x65p0\x18\x11 \x01(\x0b\x32\x0f.large_dep0.Dep\x12\x1d\n\x04\x64\x65p1\x18\x12 \x01(\x0b\x32\x0f.large_dep1.Dep\x12\x1d\n\x06nested\x18\x13 \x01(\x0b\x32\r.large.M15.N1\x1a+\n\tMap0Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a+\n\tMap1Entry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x41\n\x02N1\x12\t\n\x01x\x18\x01 \x01(\x05\x12\x1f\n\x05\x63hild\x18\x02 \x01(\x0b\x32\x10.large.M15.N1.N2\x1a\x0f\n\x02N2\x12\t\n\x01x\x18\x01 \x01(\x05\x42\t\n\x07\x63hoice0B\t\n\x07\x63hoice1*\xed\x01\n\x05\x45num0\x12\x0c\n\x08\x45NUM0_V0\x10\x00\x12\x0c\n\x08\x45NUM0_V1\x10\x01\x12\x0c\n\x08\x45NUM0_V2\x10\x02\x12\x0c\n\x08\x45NUM0_V3\x10\x03\x12\x0c\n\x08\x45NUM0_V4\x10\x04\x12\x0c\n\x08\x45NUM0_V5\x10\x05\x12\x0c\n\x08\x45NUM0_V6\x10\x06\x12\x0c\n\x08\x45NUM0_V7\x10\x07\x12\x0c\n\x08\x45NUM0_V8\x10\x08\x12\x0c\n\x08\x45NUM0_V9\x10\t\x12\r\n\tENUM0_V10\x10\n\x12\r\n\tENUM0_V11\x10\x0b\x12\r\n\tENUM0_V12\x10\x0c\x12\r\n\tENUM0_V13\x10\r\x12\r\n\tENUM0_V14\x10\x0e\x12\r\n\tENUM0_V15\x10\x0f:\x18\n\x04\x65xt0\x12\t.large.M0\x18\xe8\x07 \x01(\x05:\x18\n\x04\x65xt1\x12\t.large.M0\x18\xe9\x07 \x01(\x05:\x18\n\x04\x65xt2\x12\t.large.M0\x18\xea\x07 \x01(\x05:\x18\n\x04\x65xt3\x12\t.large.M0\x18\xeb\x07 \x01(\x05')
+
+_ENUM0 = DESCRIPTOR.enum_types_by_name['Enum0']
+Enum0 = enum_type_wrapper.EnumTypeWrapper(_ENUM0)
+ENUM0_V0 = 0
+ENUM0_V1 = 1
+ENUM0_V2 = 2
+ENUM0_V3 = 3
+ENUM0_V4 = 4
+ENUM0_V5 = 5
+ENUM0_V6 = 6
+ENUM0_V7 = 7
+ENUM0_V8 = 8
+ENUM0_V9 = 9
+ENUM0_V10 = 10
+ENUM0_V11 = 11
+ENUM0_V12 = 12
+ENUM0_V13 = 13
+ENUM0_V14 = 14
+ENUM0_V15 = 15
+
+EXT0_FIELD_NUMBER = 1000
+ext0 = DESCRIPTOR.extensions_by_name['ext0']
+EXT1_FIELD_NUMBER = 1001
+ext1 = DESCRIPTOR.extensions_by_name['ext1']
+EXT2_FIELD_NUMBER = 1002
+ext2 = DESCRIPTOR.extensions_by_name['ext2']
+EXT3_FIELD_NUMBER = 1003
+ext3 = DESCRIPTOR.extensions_by_name['ext3']
+
+_M0 = DESCRIPTOR.message_types_by_name['M0']
+_M0_MAP0ENTRY = _M0.nested_types_by_name['Map0Entry']
+_M0_MAP1ENTRY = _M0.nested_types_by_name['Map1Entry']
+_M0_N1 = _M0.nested_types_by_name['N1']
+_M0_N1_N2 = _M0_N1.nested_types_by_name['N2']
+_M1 = DESCRIPTOR.message_types_by_name['M1']
+_M1_MAP0ENTRY = _M1.nested_types_by_name['Map0Entry']
+_M1_MAP1ENTRY = _M1.nested_types_by_name['Map1Entry']
+_M1_N1 = _M1.nested_types_by_name['N1']
+_M1_N1_N2 = _M1_N1.nested_types_by_name['N2']
+_M2 = DESCRIPTOR.message_types_by_name['M2']
+_M2_MAP0ENTRY = _M2.nested_types_by_name['Map0Entry']
+_M2_MAP1ENTRY = _M2.nested_types_by_name['Map1Entry']
+_M2_N1 = _M2.nested_types_by_name['N1']
+_M2_N1_N2 = _M2_N1.nested_types_by_name['N2']
+_M3 = DESCRIPTOR.message_types_by_name['M3']
+_M3_MAP0ENTRY = _M3.nested_types_by_name['Map0Entry']
+_M3_MAP1ENTRY = _M3.nested_types_by_name['Map1Entry']
+_M3_N1 = _M3.nested_types_by_name['N1']
+_M3_N1_N2 = _M3_N1.nested_types_by_name['N2']
+_M4 = DESCRIPTOR.message_types_by_name['M4']
+_M4_MAP0ENTRY = _M4.nested_types_by_name['Map0Entry']
+_M4_MAP1ENTRY = _M4.nested_types_by_name['Map1Entry']
+_M4_N1 = _M4.nested_types_by_name['N1']
+_M4_N1_N2 = _M4_N1.nested_types_by_name['N2']
+_M5 = DESCRIPTOR.message_types_by_name['M5']
+_M5_MAP0ENTRY = _M5.nested_types_by_name['Map0Entry']
+_M5_MAP1ENTRY = _M5.nested_types_by_name['Map1Entry']
+_M5_N1 = _M5.nested_types_by_name['N1']
+_M5_N1_N2 = _M5_N1.nested_types_by_name['N2']
+_M6 = DESCRIPTOR.message_types_by_name['M6']
+_M6_MAP0ENTRY = _M6.nested_types_by_name['Map0Entry']
+_M6_MAP1ENTRY = _M6.nested_types_by_name['Map1Entry']
+_M6_N1 = _M6.nested_types_by_name['N1']
+_M6_N1_N2 = _M6_N1.nested_types_by_name['N2']
+_M7 = DESCRIPTOR.message_types_by_name['M7']
+_M7_MAP0ENTRY = _M7.nested_types_by_name['Map0Entry']
+_M7_MAP1ENTRY = _M7.nested_types_by_name['Map1Entry']
+_M7_N1 = _M7.nested_types_by_name['N1']
+_M7_N1_N2 = _M7_N1.nested_types_by_name['N2']
+_M8 = DESCRIPTOR.message_types_by_name['M8']
+_M8_MAP0ENTRY = _M8.nested_types_by_name['Map0Entry']
+_M8_MAP1ENTRY = _M8.nested_types_by_name['Map1Entry']
+_M8_N1 = _M8.nested_types_by_name['N1']
+_M8_N1_N2 = _M8_N1.nested_types_by_name['N2']
+_M9 = DESCRIPTOR.message_types_by_name['M9']
+_M9_MAP0ENTRY = _M9.nested_types_by_name['Map0Entry']
+_M9_MAP1ENTRY = _M9.nested_types_by_name['Map1Entry']
+_M9_N1 = _M9.nested_types_by_name['N1']
+_M9_N1_N2 = _M9_N1.nested_types_by_name['N2']
+_M10 = DESCRIPTOR.message_types_by_name['M10']
+_M10_MAP0ENTRY = _M10.nested_types_by_name['Map0Entry']
+_M10_MAP1ENTRY = _M10.nested_types_by_name['Map1Entry']
+_M10_N1 = _M10.nested_types_by_name['N1']
+_M10_N1_N2 = _M10_N1.nested_types_by_name['N2']
+_M11 = DESCRIPTOR.message_types_by_name['M11']
+_M11_MAP0ENTRY = _M11.nested_types_by_name['Map0Entry']
+_M11_MAP1ENTRY = _M11.nested_types_by_name['Map1Entry']
+_M11_N1 = _M11.nested_types_by_name['N1']
+_M11_N1_N2 = _M11_N1.nested_types_by_name['N2']
+_M12 = DESCRIPTOR.message_types_by_name['M12']
+_M12_MAP0ENTRY = _M12.nested_types_by_name['Map0Entry']
+_M12_MAP1ENTRY = _M12.nested_types_by_name['Map1Entry']
+_M12_N1 = _M12.nested_types_by_name['N1']
+_M12_N1_N2 = _M12_N1.nested_types_by_name['N2']
+_M13 = DESCRIPTOR.message_types_by_name['M13']
+_M13_MAP0ENTRY = _M13.nested_types_by_name['Map0Entry']
+_M13_MAP1ENTRY = _M13.nested_types_by_name['Map1Entry']
+_M13_N1 = _M13.nested_types_by_name['N1']
+_M13_N1_N2 = _M13_N1.nested_types_by_name['N2']
+_M14 = DESCRIPTOR.message_types_by_name['M14']
+_M14_MAP0ENTRY = _M14.nested_types_by_name['Map0Entry']
+_M14_MAP1ENTRY = _M14.nested_types_by_name['Map1Entry']
+_M14_N1 = _M14.nested_types_by_name['N1']
+_M14_N1_N2 = _M14_N1.nested_types_by_name['N2']
+_M15 = DESCRIPTOR.message_types_by_name['M15']
+_M15_MAP0ENTRY = _M15.nested_types_by_name['Map0Entry']
+_M15_MAP1ENTRY = _M15.nested_types_by_name['Map1Entry']
+_M15_N1 = _M15.nested_types_by_name['N1']
+_M15_N1_N2 = _M15_N1.nested_types_by_name['N2']
+M0 = _reflection.GeneratedProtocolMessageType('M0', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M0_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M0.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M0_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M0.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M0_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M0.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M0_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M0.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M0,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M0)
+  })
+_sym_db.RegisterMessage(M0)
+_sym_db.RegisterMessage(M0.Map0Entry)
+_sym_db.RegisterMessage(M0.Map1Entry)
+_sym_db.RegisterMessage(M0.N1)
+_sym_db.RegisterMessage(M0.N1.N2)
+
+M1 = _reflection.GeneratedProtocolMessageType('M1', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M1_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M1.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M1_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M1.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M1_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M1.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M1_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M1.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M1,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M1)
+  })
+_sym_db.RegisterMessage(M1)
+_sym_db.RegisterMessage(M1.Map0Entry)
+_sym_db.RegisterMessage(M1.Map1Entry)
+_sym_db.RegisterMessage(M1.N1)
+_sym_db.RegisterMessage(M1.N1.N2)
+
+M2 = _reflection.GeneratedProtocolMessageType('M2', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M2_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M2.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M2_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M2.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M2_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M2.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M2_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M2.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M2,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M2)
+  })
+_sym_db.RegisterMessage(M2)
+_sym_db.RegisterMessage(M2.Map0Entry)
+_sym_db.RegisterMessage(M2.Map1Entry)
+_sym_db.RegisterMessage(M2.N1)
+_sym_db.RegisterMessage(M2.N1.N2)
+
+M3 = _reflection.GeneratedProtocolMessageType('M3', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M3_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M3.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M3_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M3.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M3_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M3.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M3_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M3.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M3,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M3)
+  })
+_sym_db.RegisterMessage(M3)
+_sym_db.RegisterMessage(M3.Map0Entry)
+_sym_db.RegisterMessage(M3.Map1Entry)
+_sym_db.RegisterMessage(M3.N1)
+_sym_db.RegisterMessage(M3.N1.N2)
+
+M4 = _reflection.GeneratedProtocolMessageType('M4', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M4_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M4.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M4_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M4.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M4_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M4.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M4_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M4.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M4,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M4)
+  })
+_sym_db.RegisterMessage(M4)
+_sym_db.RegisterMessage(M4.Map0Entry)
+_sym_db.RegisterMessage(M4.Map1Entry)
+_sym_db.RegisterMessage(M4.N1)
+_sym_db.RegisterMessage(M4.N1.N2)
+
+M5 = _reflection.GeneratedProtocolMessageType('M5', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M5_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M5.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M5_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M5.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M5_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M5.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M5_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M5.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M5,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M5)
+  })
+_sym_db.RegisterMessage(M5)
+_sym_db.RegisterMessage(M5.Map0Entry)
+_sym_db.RegisterMessage(M5.Map1Entry)
+_sym_db.RegisterMessage(M5.N1)
+_sym_db.RegisterMessage(M5.N1.N2)
+
+M6 = _reflection.GeneratedProtocolMessageType('M6', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M6_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M6.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M6_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M6.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M6_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M6.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M6_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M6.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M6,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M6)
+  })
+_sym_db.RegisterMessage(M6)
+_sym_db.RegisterMessage(M6.Map0Entry)
+_sym_db.RegisterMessage(M6.Map1Entry)
+_sym_db.RegisterMessage(M6.N1)
+_sym_db.RegisterMessage(M6.N1.N2)
+
+M7 = _reflection.GeneratedProtocolMessageType('M7', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M7_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M7.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M7_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M7.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M7_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M7.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M7_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M7.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M7,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M7)
+  })
+_sym_db.RegisterMessage(M7)
+_sym_db.RegisterMessage(M7.Map0Entry)
+_sym_db.RegisterMessage(M7.Map1Entry)
+_sym_db.RegisterMessage(M7.N1)
+_sym_db.RegisterMessage(M7.N1.N2)
+
+M8 = _reflection.GeneratedProtocolMessageType('M8', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M8_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M8.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M8_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M8.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M8_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M8.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M8_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M8.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M8,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M8)
+  })
+_sym_db.RegisterMessage(M8)
+_sym_db.RegisterMessage(M8.Map0Entry)
+_sym_db.RegisterMessage(M8.Map1Entry)
+_sym_db.RegisterMessage(M8.N1)
+_sym_db.RegisterMessage(M8.N1.N2)
+
+M9 = _reflection.GeneratedProtocolMessageType('M9', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M9_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M9.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M9_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M9.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M9_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M9.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M9_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M9.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M9,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M9)
+  })
+_sym_db.RegisterMessage(M9)
+_sym_db.RegisterMessage(M9.Map0Entry)
+_sym_db.RegisterMessage(M9.Map1Entry)
+_sym_db.RegisterMessage(M9.N1)
+_sym_db.RegisterMessage(M9.N1.N2)
+
+M10 = _reflection.GeneratedProtocolMessageType('M10', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M10_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M10.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M10_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M10.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M10_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M10.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M10_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M10.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M10,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M10)
+  })
+_sym_db.RegisterMessage(M10)
+_sym_db.RegisterMessage(M10.Map0Entry)
+_sym_db.RegisterMessage(M10.Map1Entry)
+_sym_db.RegisterMessage(M10.N1)
+_sym_db.RegisterMessage(M10.N1.N2)
+
+M11 = _reflection.GeneratedProtocolMessageType('M11', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M11_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M11.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M11_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M11.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M11_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M11.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M11_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M11.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M11,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M11)
+  })
+_sym_db.RegisterMessage(M11)
+_sym_db.RegisterMessage(M11.Map0Entry)
+_sym_db.RegisterMessage(M11.Map1Entry)
+_sym_db.RegisterMessage(M11.N1)
+_sym_db.RegisterMessage(M11.N1.N2)
+
+M12 = _reflection.GeneratedProtocolMessageType('M12', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M12_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M12.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M12_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M12.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M12_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M12.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M12_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M12.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M12,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M12)
+  })
+_sym_db.RegisterMessage(M12)
+_sym_db.RegisterMessage(M12.Map0Entry)
+_sym_db.RegisterMessage(M12.Map1Entry)
+_sym_db.RegisterMessage(M12.N1)
+_sym_db.RegisterMessage(M12.N1.N2)
+
+M13 = _reflection.GeneratedProtocolMessageType('M13', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M13_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M13.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M13_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M13.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M13_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M13.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M13_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M13.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M13,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M13)
+  })
+_sym_db.RegisterMessage(M13)
+_sym_db.RegisterMessage(M13.Map0Entry)
+_sym_db.RegisterMessage(M13.Map1Entry)
+_sym_db.RegisterMessage(M13.N1)
+_sym_db.RegisterMessage(M13.N1.N2)
+
+M14 = _reflection.GeneratedProtocolMessageType('M14', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M14_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M14.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M14_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M14.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M14_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M14.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M14_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M14.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M14,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M14)
+  })
+_sym_db.RegisterMessage(M14)
+_sym_db.RegisterMessage(M14.Map0Entry)
+_sym_db.RegisterMessage(M14.Map1Entry)
+_sym_db.RegisterMessage(M14.N1)
+_sym_db.RegisterMessage(M14.N1.N2)
+
+M15 = _reflection.GeneratedProtocolMessageType('M15', (_message.Message,), {
+
+  'Map0Entry' : _reflection.GeneratedProtocolMessageType('Map0Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M15_MAP0ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M15.Map0Entry)
+    })
+  ,
+
+  'Map1Entry' : _reflection.GeneratedProtocolMessageType('Map1Entry', (_message.Message,), {
+    'DESCRIPTOR' : _M15_MAP1ENTRY,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M15.Map1Entry)
+    })
+  ,
+
+  'N1' : _reflection.GeneratedProtocolMessageType('N1', (_message.Message,), {
+
+    'N2' : _reflection.GeneratedProtocolMessageType('N2', (_message.Message,), {
+      'DESCRIPTOR' : _M15_N1_N2,
+      '__module__' : 'large_pb2'
+      # @@protoc_insertion_point(class_scope:large.M15.N1.N2)
+      })
+    ,
+    'DESCRIPTOR' : _M15_N1,
+    '__module__' : 'large_pb2'
+    # @@protoc_insertion_point(class_scope:large.M15.N1)
+    })
+  ,
+  'DESCRIPTOR' : _M15,
+  '__module__' : 'large_pb2'
+  # @@protoc_insertion_point(class_scope:large.M15)
+  })
+_sym_db.RegisterMessage(M15)
+_sym_db.RegisterMessage(M15.Map0Entry)
+_sym_db.RegisterMessage(M15.Map1Entry)
+_sym_db.RegisterMessage(M15.N1)
+_sym_db.RegisterMessage(M15.N1.N2)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+  M0.RegisterExtension(ext0)
+  M0.RegisterExtension(ext1)
+  M0.RegisterExtension(ext2)
+  M0.RegisterExtension(ext3)
+
+  DESCRIPTOR._options = None
+  _M0_MAP0ENTRY._options = None
+  _M0_MAP0ENTRY._serialized_options = b'8\001'
+  _M0_MAP1ENTRY._options = None
+  _M0_MAP1ENTRY._serialized_options = b'8\001'
+  _M1_MAP0ENTRY._options = None
+  _M1_MAP0ENTRY._serialized_options = b'8\001'
+  _M1_MAP1ENTRY._options = None
+  _M1_MAP1ENTRY._serialized_options = b'8\001'
+  _M2_MAP0ENTRY._options = None
+  _M2_MAP0ENTRY._serialized_options = b'8\001'
+  _M2_MAP1ENTRY._options = None
+  _M2_MAP1ENTRY._serialized_options = b'8\001'
+  _M3_MAP0ENTRY._options = None
+  _M3_MAP0ENTRY._serialized_options = b'8\001'
+  _M3_MAP1ENTRY._options = None
+  _M3_MAP1ENTRY._serialized_options = b'8\001'
+  _M4_MAP0ENTRY._options = None
+  _M4_MAP0ENTRY._serialized_options = b'8\001'
+  _M4_MAP1ENTRY._options = None
+  _M4_MAP1ENTRY._serialized_options = b'8\001'
+  _M5_MAP0ENTRY._options = None
+  _M5_MAP0ENTRY._serialized_options = b'8\001'
+  _M5_MAP1ENTRY._options = None
+  _M5_MAP1ENTRY._serialized_options = b'8\001'
+  _M6_MAP0ENTRY._options = None
+  _M6_MAP0ENTRY._serialized_options = b'8\001'
+  _M6_MAP1ENTRY._options = None
+  _M6_MAP1ENTRY._serialized_options = b'8\001'
+  _M7_MAP0ENTRY._options = None
+  _M7_MAP0ENTRY._serialized_options = b'8\001'
+  _M7_MAP1ENTRY._options = None
+  _M7_MAP1ENTRY._serialized_options = b'8\001'
+  _M8_MAP0ENTRY._options = None
+  _M8_MAP0ENTRY._serialized_options = b'8\001'
+  _M8_MAP1ENTRY._options = None
+  _M8_MAP1ENTRY._serialized_options = b'8\001'
+  _M9_MAP0ENTRY._options = None
+  _M9_MAP0ENTRY._serialized_options = b'8\001'
+  _M9_MAP1ENTRY._options = None
+  _M9_MAP1ENTRY._serialized_options = b'8\001'
+  _M10_MAP0ENTRY._options = None
+  _M10_MAP0ENTRY._serialized_options = b'8\001'
+  _M10_MAP1ENTRY._options = None
+  _M10_MAP1ENTRY._serialized_options = b'8\001'
+  _M11_MAP0ENTRY._options = None
+  _M11_MAP0ENTRY._serialized_options = b'8\001'
+  _M11_MAP1ENTRY._options = None
+  _M11_MAP1ENTRY._serialized_options = b'8\001'
+  _M12_MAP0ENTRY._options = None
+  _M12_MAP0ENTRY._serialized_options = b'8\001'
+  _M12_MAP1ENTRY._options = None
+  _M12_MAP1ENTRY._serialized_options = b'8\001'
+  _M13_MAP0ENTRY._options = None
+  _M13_MAP0ENTRY._serialized_options = b'8\001'
+  _M13_MAP1ENTRY._options = None
+  _M13_MAP1ENTRY._serialized_options = b'8\001'
+  _M14_MAP0ENTRY._options = None
+  _M14_MAP0ENTRY._serialized_options = b'8\001'
+  _M14_MAP1ENTRY._options = None
+  _M14_MAP1ENTRY._serialized_options = b'8\001'
+  _M15_MAP0ENTRY._options = None
+  _M15_MAP0ENTRY._serialized_options = b'8\001'
+  _M15_MAP1ENTRY._options = None
+  _M15_MAP1ENTRY._serialized_options = b'8\001'
+  _ENUM0._serialized_start=8990
+  _ENUM0._serialized_end=9227
+  _M0._serialized_start=59
+  _M0._serialized_end=612
+  _M0_MAP0ENTRY._serialized_start=425
+  _M0_MAP0ENTRY._serialized_end=468
+  _M0_MAP1ENTRY._serialized_start=470
+  _M0_MAP1ENTRY._serialized_end=513
+  _M0_N1._serialized_start=515
+  _M0_N1._serialized_end=579
+  _M0_N1_N2._serialized_start=564
+  _M0_N1_N2._serialized_end=579
+  _M1._serialized_start=615
+  _M1._serialized_end=1168
+  _M1_MAP0ENTRY._serialized_start=425
+  _M1_MAP0ENTRY._serialized_end=468
+  _M1_MAP1ENTRY._serialized_start=470
+  _M1_MAP1ENTRY._serialized_end=513
+  _M1_N1._serialized_start=1082
+  _M1_N1._serialized_end=1146
+  _M1_N1_N2._serialized_start=564
+  _M1_N1_N2._serialized_end=579
+  _M2._serialized_start=1171
+  _M2._serialized_end=1724
+  _M2_MAP0ENTRY._serialized_start=425
+  _M2_MAP0ENTRY._serialized_end=468
+  _M2_MAP1ENTRY._serialized_start=470
+  _M2_MAP1ENTRY._serialized_end=513
+  _M2_N1._serialized_start=1638
+  _M2_N1._serialized_end=1702
+  _M2_N1_N2._serialized_start=564
+  _M2_N1_N2._serialized_end=579
+  _M3._serialized_start=1727
+  _M3._serialized_end=2280
+  _M3_MAP0ENTRY._serialized_start=425
+  _M3_MAP0ENTRY._serialized_end=468
+  _M3_MAP1ENTRY._serialized_start=470
+  _M3_MAP1ENTRY._serialized_end=513
+  _M3_N1._serialized_start=2194
+  _M3_N1._serialized_end=2258
+  _M3_N1_N2._serialized_start=564
+  _M3_N1_N2._serialized_end=579
+  _M4._serialized_start=2283
+  _M4._serialized_end=2836
+  _M4_MAP0ENTRY._serialized_start=425
+  _M4_MAP0ENTRY._serialized_end=468
+  _M4_MAP1ENTRY._serialized_start=470
+  _M4_MAP1ENTRY._serialized_end=513
+  _M4_N1._serialized_start=2750
+  _M4_N1._serialized_end=2814
+  _M4_N1_N2._serialized_start=564
+  _M4_N1_N2._serialized_end=579
+  _M5._serialized_start=2839
+  _M5._serialized_end=3392
+  _M5_MAP0ENTRY._serialized_start=425
+  _M5_MAP0ENTRY._serialized_end=468
+  _M5_MAP1ENTRY._serialized_start=470
+  _M5_MAP1ENTRY._serialized_end=513
+  _M5_N1._serialized_start=3306
+  _M5_N1._serialized_end=3370
+  _M5_N1_N2._serialized_start=564
+  _M5_N1_N2._serialized_end=579
+  _M6._serialized_start=3395
+  _M6._serialized_end=3948
+  _M6_MAP0ENTRY._serialized_start=425
+  _M6_MAP0ENTRY._serialized_end=468
+  _M6_MAP1ENTRY._serialized_start=470
+  _M6_MAP1ENTRY._serialized_end=513
+  _M6_N1._serialized_start=3862
+  _M6_N1._serialized_end=3926
+  _M6_N1_N2._serialized_start=564
+  _M6_N1_N2._serialized_end=579
+  _M7._serialized_start=3951
+  _M7._serialized_end=4504
+  _M7_MAP0ENTRY._serialized_start=425
+  _M7_MAP0ENTRY._serialized_end=468
+  _M7_MAP1ENTRY._serialized_start=470
+  _M7_MAP1ENTRY._serialized_end=513
+  _M7_N1._serialized_start=4418
+  _M7_N1._serialized_end=4482
+  _M7_N1_N2._serialized_start=564
+  _M7_N1_N2._serialized_end=579
+  _M8._serialized_start=4507
+  _M8._serialized_end=5060
+  _M8_MAP0ENTRY._serialized_start=425
+  _M8_MAP0ENTRY._serialized_end=468
+  _M8_MAP1ENTRY._serialized_start=470
+  _M8_MAP1ENTRY._serialized_end=513
+  _M8_N1._serialized_start=4974
+  _M8_N1._serialized_end=5038
+  _M8_N1_N2._serialized_start=564
+  _M8_N1_N2._serialized_end=579
+  _M9._serialized_start=5063
+  _M9._serialized_end=5616
+  _M9_MAP0ENTRY._serialized_start=425
+  _M9_MAP0ENTRY._serialized_end=468
+  _M9_MAP1ENTRY._serialized_start=470
+  _M9_MAP1ENTRY._serialized_end=513
+  _M9_N1._serialized_start=5530
+  _M9_N1._serialized_end=5594
+  _M9_N1_N2._serialized_start=564
+  _M9_N1_N2._serialized_end=579
+  _M10._serialized_start=5619
+  _M10._serialized_end=6177
+  _M10_MAP0ENTRY._serialized_start=425
+  _M10_MAP0ENTRY._serialized_end=468
+  _M10_MAP1ENTRY._serialized_start=470
+  _M10_MAP1ENTRY._serialized_end=513
+  _M10_N1._serialized_start=6090
+  _M10_N1._serialized_end=6155
+  _M10_N1_N2._serialized_start=564
+  _M10_N1_N2._serialized_end=579
+  _M11._serialized_start=6180
+  _M11._serialized_end=6739
+  _M11_MAP0ENTRY._serialized_start=425
+  _M11_MAP0ENTRY._serialized_end=468
+  _M11_MAP1ENTRY._serialized_start=470
+  _M11_MAP1ENTRY._serialized_end=513
+  _M11_N1._serialized_start=6652
+  _M11_N1._serialized_end=6717
+  _M11_N1_N2._serialized_start=564
+  _M11_N1_N2._serialized_end=579
+  _M12._serialized_start=6742
+  _M12._serialized_end=7301
+  _M12_MAP0ENTRY._serialized_start=425
+  _M12_MAP0ENTRY._serialized_end=468
+  _M12_MAP1ENTRY._serialized_start=470
+  _M12_MAP1ENTRY._serialized_end=513
+  _M12_N1._serialized_start=7214
+  _M12_N1._serialized_end=7279
+  _M12_N1_N2._serialized_start=564
+  _M12_N1_N2._serialized_end=579
+  _M13._serialized_start=7304
+  _M13._serialized_end=7863
+  _M13_MAP0ENTRY._serialized_start=425
+  _M13_MAP0ENTRY._serialized_end=468
+  _M13_MAP1ENTRY._serialized_start=470
+  _M13_MAP1ENTRY._serialized_end=513
+  _M13_N1._serialized_start=7776
+  _M13_N1._serialized_end=7841
+  _M13_N1_N2._serialized_start=564
+  _M13_N1_N2._serialized_end=579
+  _M14._serialized_start=7866
+  _M14._serialized_end=8425
+  _M14_MAP0ENTRY._serialized_start=425
+  _M14_MAP0ENTRY._serialized_end=468
+  _M14_MAP1ENTRY._serialized_start=470
+  _M14_MAP1ENTRY._serialized_end=513
+  _M14_N1._serialized_start=8338
+  _M14_N1._serialized_end=8403
+  _M14_N1_N2._serialized_start=564
+  _M14_N1_N2._serialized_end=579
+  _M15._serialized_start=8428
+  _M15._serialized_end=8987
+  _M15_MAP0ENTRY._serialized_start=425
+  _M15_MAP0ENTRY._serialized_end=468
+  _M15_MAP1ENTRY._serialized_start=470
+  _M15_MAP1ENTRY._serialized_end=513
+  _M15_N1._serialized_start=8900
+  _M15_N1._serialized_end=8965
+  _M15_N1_N2._serialized_start=564
+  _M15_N1_N2._serialized_end=579
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: small.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bsmall.proto\x12\x05small\"4\n\x02M0\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\"4\n\x02M1\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\"4\n\x02M2\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08\"4\n\x02M3\x12\n\n\x02\x66\x30\x18\x01 \x01(\x05\x12\n\n\x02\x66\x31\x18\x02 \x01(\t\x12\n\n\x02\x66\x32\x18\x03 \x03(\x01\x12\n\n\x02\x66\x33\x18\x04 \x01(\x08*?\n\x05\x45num0\x12\x0c\n\x08\x45NUM0_V0\x10\x00\x12\x0c\n\x08\x45NUM0_V1\x10\x01\x12\x0c\n\x08\x45NUM0_V2\x10\x02\x12\x0c\n\x08\x45NUM0_V3\x10\x03')
+
+_ENUM0 = DESCRIPTOR.enum_types_by_name['Enum0']
+Enum0 = enum_type_wrapper.EnumTypeWrapper(_ENUM0)
+ENUM0_V0 = 0
+ENUM0_V1 = 1
+ENUM0_V2 = 2
+ENUM0_V3 = 3
+
+
+_M0 = DESCRIPTOR.message_types_by_name['M0']
+_M1 = DESCRIPTOR.message_types_by_name['M1']
+_M2 = DESCRIPTOR.message_types_by_name['M2']
+_M3 = DESCRIPTOR.message_types_by_name['M3']
+M0 = _reflection.GeneratedProtocolMessageType('M0', (_message.Message,), {
+  'DESCRIPTOR' : _M0,
+  '__module__' : 'small_pb2'
+  # @@protoc_insertion_point(class_scope:small.M0)
+  })
+_sym_db.RegisterMessage(M0)
+
+M1 = _reflection.GeneratedProtocolMessageType('M1', (_message.Message,), {
+  'DESCRIPTOR' : _M1,
+  '__module__' : 'small_pb2'
+  # @@protoc_insertion_point(class_scope:small.M1)
+  })
+_sym_db.RegisterMessage(M1)
+
+M2 = _reflection.GeneratedProtocolMessageType('M2', (_message.Message,), {
+  'DESCRIPTOR' : _M2,
+  '__module__' : 'small_pb2'
+  # @@protoc_insertion_point(class_scope:small.M2)
+  })
+_sym_db.RegisterMessage(M2)
+
+M3 = _reflection.GeneratedProtocolMessageType('M3', (_message.Message,), {
+  'DESCRIPTOR' : _M3,
+  '__module__' : 'small_pb2'
+  # @@protoc_insertion_point(class_scope:small.M3)
+  })
+_sym_db.RegisterMessage(M3)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _ENUM0._serialized_start=238
+  _ENUM0._serialized_end=301
+  _M0._serialized_start=22
+  _M0._serialized_end=74
+  _M1._serialized_start=76
+  _M1._serialized_end=128
+  _M2._serialized_start=130
+  _M2._serialized_end=182
+  _M3._serialized_start=184
+  _M3._serialized_end=236
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,168 @@
+"""
+Generate synthetic .proto files for benchmarks
+
+usage: python -m benchmarks.protogen [--messages N] [--fields N] ... NAME OUTDIR
+
+Every dimension of a Spec scales one feature of the generated file:
+
+    messages     top-level messages
+    fields       scalar, enum and message fields per message
+    nesting      depth of a chain of nested messages in each message
+    enum_values  values in the file's enum (no enum when 0)
+    oneofs       two-field oneofs per message
+    maps         map<string, int32> fields per message
+    extensions   extensions of the first message
+    imports      files imported, each providing a message used as a field
+"""
+import argparse
+import os
+import subprocess
+from typing import Dict, List, NamedTuple, Tuple
+
+Spec = NamedTuple('Spec', [
+    ('messages', int),
+    ('fields', int),
+    ('nesting', int),
+    ('enum_values', int),
+    ('oneofs', int),
+    ('maps', int),
+    ('extensions', int),
+    ('imports', int),
+])
+DIMENSIONS = Spec._fields
+BASE_SPEC = Spec(messages=4, fields=4, nesting=0, enum_values=4,
+                 oneofs=0, maps=0, extensions=0, imports=0)
+
+SCALAR_TYPES = ('int32', 'string', 'double', 'bool', 'bytes', 'int64')
+
+
+def _dependency(name, i):
+    # type: (str, int) -> str
+    return '{}_dep{}'.format(name, i)
+
+
+def _nested(depth, level=1):
+    # type: (int, int) -> List[str]
+    if level > depth:
+        return []
+    inner = _nested(depth, level + 1)
+    lines = ['message N{} {{'.format(level), '  optional int32 x = 1;']
+    if inner:
+        lines.append('  optional N{} child = 2;'.format(level + 1))
+        lines += ['  ' + line for line in inner]
+    lines.append('}')
+    return lines
+
+
+def message_fields(spec, i):
+    # type: (Spec, int) -> List[Tuple[str, str, str]]
+    """
+    Returns (label, type, name) of the plain fields of message M<i>
+    """
+    fields = []
+    for j in range(spec.fields):
+        kind = j % (len(SCALAR_TYPES) + 2)
+        if kind < len(SCALAR_TYPES):
+            type_ = SCALAR_TYPES[kind]
+        elif kind == len(SCALAR_TYPES) and spec.enum_values:
+            type_ = 'Enum0'
+        else:
+            type_ = 'M{}'.format(i - 1) if i else 'int32'
+        label = 'repeated' if j % 3 == 2 else 'optional'
+        fields.append((label, type_, 'f{}'.format(j)))
+    return fields
+
+
+def _message(spec, name, i):
+    # type: (Spec, str, int) -> List[str]
+    lines = ['message M{} {{'.format(i)]
+    number = 0
+
+    def field(decl):
+        nonlocal number
+        number += 1
+        lines.append('  {} = {};'.format(decl, number))
+
+    for label, type_, field_name in message_fields(spec, i):
+        field('{} {} {}'.format(label, type_, field_name))
+    for k in range(spec.oneofs):
+        lines.append('  oneof choice{} {{'.format(k))
+        field('  int32 o{}_a'.format(k))
+        field('  string o{}_b'.format(k))
+        lines.append('  }')
+    for k in range(spec.maps):
+        field('map<string, int32> map{}'.format(k))
+    for k in range(spec.imports):
+        dep = _dependency(name, k)
+        field('optional {}.Dep dep{}'.format(dep, k))
+    if spec.nesting:
+        lines += ['  ' + line for line in _nested(spec.nesting)]
+        field('optional N1 nested')
+    if spec.extensions and i == 0:
+        lines.append('  extensions 1000 to max;')
+    lines.append('}')
+    return lines
+
+
+def generate(spec, name):
+    # type: (Spec, str) -> Dict[str, str]
+    """
+    Returns the source of name.proto and the files it imports, by file name
+    """
+    files = {}  # type: Dict[str, str]
+    lines = ['syntax = "proto2";', 'package {};'.format(name)]
+    for k in range(spec.imports):
+        dep = _dependency(name, k)
+        files[dep + '.proto'] = '\n'.join([
+            'syntax = "proto2";',
+            'package {};'.format(dep),
+            'message Dep {',
+            '  optional int32 x = 1;',
+            '}',
+        ]) + '\n'
+        lines.append('import "{}.proto";'.format(dep))
+    if spec.enum_values:
+        lines.append('enum Enum0 {')
+        lines += ['  ENUM0_V{0} = {0};'.format(v) for v in range(spec.enum_values)]
+        lines.append('}')
+    for i in range(max(spec.messages, 1)):
+        lines += _message(spec, name, i)
+    if spec.extensions:
+        lines.append('extend M0 {')
+        lines += [
+            '  optional int32 ext{} = {};'.format(k, 1000 + k) for k in range(spec.extensions)
+        ]
+        lines.append('}')
+    files[name + '.proto'] = '\n'.join(lines) + '\n'
+    return files
+
+
+def write_corpus(spec, name, outdir, protoc='protoc'):
+    # type: (Spec, str, str, str) -> str
+    """
+    Write and compile name.proto and its imports, returning the _pb2 module name
+    """
+    files = generate(spec, name)
+    os.makedirs(outdir, exist_ok=True)
+    for filename, source in files.items():
+        with open(os.path.join(outdir, filename), 'w') as f:
+            f.write(source)
+    subprocess.check_call([protoc, '--python_out=.'] + sorted(files), cwd=outdir)
+    return name + '_pb2'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('name')
+    parser.add_argument('outdir')
+    parser.add_argument('--protoc', default='protoc')
+    for dim in DIMENSIONS:
+        parser.add_argument('--' + dim.replace('_', '-'), type=int,
+                            default=getattr(BASE_SPEC, dim))
+    args = parser.parse_args(argv)
+    spec = Spec(**{dim: getattr(args, dim) for dim in DIMENSIONS})
+    print(write_corpus(spec, args.name, args.outdir, args.protoc))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""
+Run the benchmarks in each tox env and compare against checked-in baselines
+
+usage: python -m benchmarks.regress [--env ENV]... [--threshold F] [--memory-threshold F]
+                                   [--update]
+       python -m benchmarks.regress run [--output FILE]
+
+Without a subcommand, each env (default: every env from `tox -l`) runs
+`tox -e ENV-bench`, which runs the "run" subcommand inside the env. The
+results are compared against benchmarks/baseline.json, and the exit status
+is 1 if any time or memory metric is more than its threshold above the
+baseline, or if an env has no baseline. Timings are noisier than
+tracemalloc peaks, hence the separate thresholds. --env local runs in the
+current interpreter instead of tox. --update writes the new results into
+the baseline instead of comparing.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+RESULTS_DIR = '.benchmarks'
+LOCAL = 'local'
+TRANSFORM_ARGS = ['--max', '16', '--repeat', '10']
+CHECKER_ARGS = ['--modules', '4', '--repeat', '5']
+MIN_TIME_DELTA = 0.002  # seconds, smaller differences are timer noise
+
+Results = Dict[str, Any]
+
+
+def _versions():
+    # type: () -> Dict[str, str]
+    import astroid
+    import google.protobuf
+    import pylint
+    return {
+        'python': '.'.join(map(str, sys.version_info[:3])),
+        'astroid': astroid.__version__,
+        'pylint': pylint.__version__,
+        'protobuf': google.protobuf.__version__,
+    }
+
+
+def _run_json(module, args, protoc):
+    # type: (str, List[str], Optional[str]) -> Any
+    cmd = [sys.executable, '-m', module, '--json'] + args
+    if protoc:
+        cmd += ['--protoc', protoc]
+    # bench_import exits 1 when over its own budget, the threshold applies here
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE)
+    return json.loads(proc.stdout)
+
+
+def collect(protoc='protoc'):
+    # type: (str) -> Results
+    """
+    Run the benchmark suites in this interpreter, all metrics lower is better
+    """
+    metrics = {}  # type: Dict[str, float]
+    rows = _run_json('benchmarks.bench_transform', TRANSFORM_ARGS, protoc)
+    largest = {}  # type: Dict[str, Dict[str, Any]]
+    for row in rows:
+        if row['size'] >= largest.get(row['dimension'], {'size': 0})['size']:
+            largest[row['dimension']] = row
+    for dimension, row in sorted(largest.items()):
+        metrics['transform.{}.time'.format(dimension)] = row['time']
+        metrics['transform.{}.peak_bytes'.format(dimension)] = row['peak_bytes']
+    checker = _run_json('benchmarks.bench_checker', CHECKER_ARGS, protoc)
+    plugin = checker['results']['pylint + pylint_protobuf']
+    metrics['checker.startup'] = plugin['startup']
+    metrics['checker.time'] = plugin['time'] - plugin['startup']
+    imports = _run_json('benchmarks.bench_import', [], protoc=None)
+    metrics['import.time'] = imports['milliseconds'] / 1000
+    metrics['import.modules'] = imports['modules']
+    return {'versions': _versions(), 'metrics': metrics}
+
+
+def run_env(env, protoc):
+    # type: (str, str) -> Results
+    if env == LOCAL:
+        return collect(protoc)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output = os.path.join(RESULTS_DIR, env + '.json')
+    subprocess.check_call(
+        ['tox', '-e', env + '-bench', '--', '--output', output, '--protoc', protoc])
+    with open(output) as f:
+        return json.load(f)
+
+
+def tox_envs():
+    # type: () -> List[str]
+    out = subprocess.check_output(['tox', '-l'], universal_newlines=True)
+    return [line.strip() for line in out.splitlines() if line.strip()]
+
+
+def compare(env, results, baseline, threshold, memory_threshold):
+    # type: (str, Results, Optional[Results], float, float) -> List[str]
+    """
+    Print each metric against its baseline, returning the regressed metrics,
+    or the env itself when it has no baseline
+    """
+    versions = sorted(results['versions'].items())
+    print('{} ({})'.format(env, ', '.join('{} {}'.format(k, v) for k, v in versions)))
+    if baseline is None:
+        print('  no baseline, run with --update to record one')
+        return ['{}: no baseline'.format(env)]
+    regressions = []
+    for name, value in sorted(results['metrics'].items()):
+        old = baseline['metrics'].get(name)
+        if old is None:
+            print('  {:<36} {:>14.6g} {:>14} {:>8}'.format(name, value, '-', 'new'))
+            continue
+        change = value / old - 1 if old else 0.0
+        if name.endswith('_bytes'):
+            regressed = change > memory_threshold
+        else:
+            regressed = change > threshold and value - old >= MIN_TIME_DELTA
+        if regressed:
+            regressions.append('{}: {}'.format(env, name))
+        print('  {:<36} {:>14.6g} {:>14.6g} {:>+7.1%}{}'.format(
+            name, value, old, change, '  REGRESSED' if regressed else ''))
+    return regressions
+
+
+def main(argv=None):
+    # type: (Optional[List[str]]) -> int
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--protoc', default='protoc')
+    if argv[:1] == ['run']:
+        parser.add_argument('--output', help='write results to this file instead of stdout')
+        args = parser.parse_args(argv[1:])
+        results = json.dumps(collect(args.protoc), indent=2, sort_keys=True)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(results + '\n')
+        else:
+            print(results)
+        return 0
+    parser.add_argument('--env', action='append', help='tox env, or "local", may be repeated')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed fractional increase in time')
+    parser.add_argument('--memory-threshold', type=float, default=0.05,
+                        help='allowed fractional increase in peak memory')
+    parser.add_argument('--update', action='store_true',
+                        help='record results as the new baselines')
+    parser.add_argument('--baseline', default=BASELINE)
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.baseline) as f:
+            baselines = json.load(f)  # type: Dict[str, Results]
+    except FileNotFoundError:
+        baselines = {}
+    envs = args.env or tox_envs()
+    results = {env: run_env(env, args.protoc) for env in envs}
+
+    if args.update:
+        baselines.update(results)
+        with open(args.baseline, 'w') as f:
+            f.write(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+        return 0
+
+    regressions = []
+    for env, env_results in results.items():
+        regressions += compare(
+            env, env_results, baselines.get(env), args.threshold, args.memory_threshold)
+    if len(results) > 1:
+        print('fastest first by checker time:')
+        for env in sorted(results, key=lambda e: results[e]['metrics']['checker.time']):
+            print('  {:<24} {:.3f}s'.format(env, results[env]['metrics']['checker.time']))
+    if regressions:
+        print('regressions:\n  {}'.format('\n  '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
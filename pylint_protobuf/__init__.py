@@ -1,21 +1,49 @@
 import builtins
-from typing import Union, Optional, List, Any
+import time
+from functools import wraps
+from typing import Union, Optional, List, Any, Callable
 
 import astroid
 from pylint.checkers import BaseChecker, utils
+from pylint.constants import WarningScope
 from pylint.exceptions import UnknownMessageError
 
 from .transform import transform_module, is_some_protobuf_module, to_pytype, is_composite, is_repeated, is_oneof
 from .transform import SimpleDescriptor, PROTOBUF_IMPLICIT_ATTRS, PROTOBUF_ENUM_IMPLICIT_ATTRS
+from .transform import use_builtin_descriptors, use_pruned_modules, use_folded_duplicates
+from .transform import use_location_index
+from .transform import prebuild_imports, use_worker_pool
+from .prebuild import build_whole_module
+from .events import (
+    Event, EVENTS, subscribe, unsubscribe, subscribed,
+    TRANSFORM_START, TRANSFORM_END, EXEC_FAILURE, CACHE_HIT, CACHE_MISS, CHECK,
+    INFERENCE_ABANDONED,
+)
+from .events import SUBSCRIBERS, emit
+from .stats import STATS, SLOW_NODES, timed_check
+from .trace import TRACE, TRACE_ENV
+from .memory import MEMORY
+from .metrics import METRICS
+from .profiling import PROFILER
+from .reporter import report_stats, report_slow_nodes, report_memory, ProtobufJSONReporter
 
 try:
-    from pylint.interfaces import IAstroidChecker
+    from pylint.interfaces import IAstroidChecker, IRawChecker
 except ImportError:
     # compat shim for astroid 2.x
     # TODO: remove in pylint-protobuf 1.x after a period of deprecation
     class IAstroidChecker:
         pass
 
+    class IRawChecker:
+        pass
+
+try:
+    from pylint.checkers import BaseRawFileChecker
+except ImportError:
+    # pylint < 2.14 finds raw checkers by __implements__
+    BaseRawFileChecker = BaseChecker
+
 try:
     from astroid import Index as IndexNode
 except ImportError:
@@ -89,13 +117,33 @@ MESSAGES = {
 Node = astroid.node_classes.NodeNG
 
 
+def _inference_abandoned(site, node, reason, start):
+    # type: (str, Node, str, float) -> None
+    if SUBSCRIBERS[INFERENCE_ABANDONED]:
+        emit(INFERENCE_ABANDONED, time.perf_counter() - start, site=site, node=node, reason=reason)
+
+
+def _timed_inference(site, infer):
+    # type: (str, Callable[[], List[Node]]) -> List[Node]
+    if not STATS.time_checks:
+        return infer()
+    with STATS.timed('inference', site):
+        return infer()
+
+
 def _get_inferred_values(node):
     # type: (Node) -> List[Node]
+    start = time.perf_counter() if SUBSCRIBERS[INFERENCE_ABANDONED] else 0.0
     try:
-        vals = list(node.infer())  # not the same as node.inferred() for astroid.Instance
+        # not the same as node.inferred() for astroid.Instance
+        vals = _timed_inference('_get_inferred_values', lambda: list(node.infer()))
     except astroid.InferenceError:
+        _inference_abandoned('_get_inferred_values', node, 'error', start)
         return []
-    return [v for v in vals if v is not astroid.Uninferable]
+    vals = [v for v in vals if v is not astroid.Uninferable]
+    if not vals:
+        _inference_abandoned('_get_inferred_values', node, 'uninferable', start)
+    return vals
 
 
 def _get_protobuf_descriptor(node):
@@ -119,6 +167,71 @@ def _get_protobuf_descriptor(node):
     return cls_def._protobuf_descriptor  # type: SimpleDescriptor
 
 
+def _classify_receiver(node):
+    # type: (Node) -> str
+    try:
+        vals = node.inferred()
+    except astroid.InferenceError:
+        return 'uninferable'
+    known = [v for v in vals if v is not astroid.Uninferable]
+    if not known:
+        return 'uninferable'
+    if len(vals) > 1:
+        return 'ambiguous'
+    val = known[0]
+    cls_def = getattr(val, '_proxied', val)
+    if getattr(cls_def, '_is_protobuf_class', False):
+        return 'protobuf'
+    return 'non-protobuf'
+
+
+def _attribute_receiver(node):
+    # type: (Union[astroid.Attribute, astroid.AssignAttr]) -> Node
+    return node.expr
+
+
+def _call_receiver(node):
+    # type: (astroid.Call) -> Node
+    func = node.func
+    return func.expr if isinstance(func, astroid.Attribute) else func
+
+
+def _subscript_receiver(node):
+    # type: (astroid.Subscript) -> Node
+    value = node.value
+    return value.expr if isinstance(value, astroid.Attribute) else value
+
+
+def tracks_slow_nodes(receiver):
+    # type: (Callable[[Node], Node]) -> Callable
+    """
+    Record inference time spent visiting a node when SLOW_NODES is enabled
+
+    The receiver is only classified for nodes that make it into the report.
+    """
+    def decorator(visit):
+        @wraps(visit)
+        def wrapper(self, node):
+            if not SLOW_NODES.enabled:
+                return visit(self, node)
+            before = STATS.total('inference')
+            visit(self, node)
+            elapsed = STATS.total('inference') - before
+            if SLOW_NODES.would_keep(elapsed):
+                expression = receiver(node).as_string()
+                if len(expression) > 60:
+                    expression = expression[:57] + '...'
+                SLOW_NODES.add({
+                    'time': elapsed,
+                    'location': '{}:{}'.format(node.root().file, node.lineno),
+                    'expression': expression,
+                    'kind': _classify_receiver(receiver(node)),
+                    'visit': visit.__name__,
+                })
+        return wrapper
+    return decorator
+
+
 def _scalar_typecheck(val, val_type):
     # type: (Union[type, Any], type) -> bool
     # NOTE: transform.to_pytype returns {bool, int, float, str, <other>}
@@ -149,20 +262,221 @@ def _resolve_builtin(inst):
     return getattr(builtins, typename, None)  # eh...
 
 
-class ProtobufDescriptorChecker(BaseChecker):
-    __implements__ = IAstroidChecker
-    msgs = MESSAGES
+class ProtobufDescriptorChecker(BaseRawFileChecker):
+    __implements__ = (IAstroidChecker, IRawChecker)
+    # the messages of raw checkers are about lines unless they say otherwise
+    msgs = {msgid: msg + ({'scope': WarningScope.NODE},) for msgid, msg in MESSAGES.items()}
     name = 'protobuf-descriptor-checker'
     priority = 0  # need to be higher than builtin typecheck lint
+    reports = (
+        ('RP5901', 'Protobuf checker statistics', report_stats),
+        ('RP5902', 'Slowest protobuf inference sites', report_slow_nodes),
+        ('RP5903', 'Protobuf module memory', report_memory),
+    )
+    options = (
+        ('protobuf-trace', {
+            'default': '', 'type': 'string', 'metavar': '<file>',
+            'help': 'Append a JSON line describing the cost of each transformed '
+                    '_pb2 module to this file. Defaults to the value of the '
+                    '{} environment variable.'.format(TRACE_ENV),
+        }),
+        ('protobuf-slow-nodes', {
+            'default': 0, 'type': 'int', 'metavar': '<n>',
+            'help': 'Report the n source locations where the most time was spent '
+                    'inferring receivers of attributes, calls and subscripts.',
+        }),
+        ('protobuf-memory', {
+            'default': 0, 'type': 'int', 'metavar': '<n>',
+            'help': 'Trace memory allocations with tracemalloc and report the n '
+                    '_pb2 modules retaining the most memory after transformation.',
+        }),
+        ('protobuf-profile', {
+            'default': '', 'type': 'string', 'metavar': '<prefix>',
+            'help': 'Profile the module transform and this checker\'s visitors '
+                    'with cProfile, writing <prefix>.<pid>.pstats per process and '
+                    'printing the top functions at exit.',
+        }),
+        ('protobuf-metrics', {
+            'default': '', 'type': 'string', 'metavar': '<file>',
+            'help': 'Write OpenMetrics counters and histograms for the run to '
+                    'this file, e.g. for the node-exporter textfile collector.',
+        }),
+        ('protobuf-descriptors', {
+            'default': 'runtime', 'type': 'choice', 'choices': ('runtime', 'builtin', 'worker'),
+            'metavar': '<runtime, builtin or worker>',
+            'help': 'Read _pb2 modules by executing them with the installed '
+                    'protobuf runtime, by decoding their serialized '
+                    'descriptors without it, or by importing them in helper '
+                    'processes that send their descriptors back. builtin is '
+                    'used when google.protobuf is not installed.',
+        }),
+        ('protobuf-workers', {
+            'default': 1, 'type': 'int', 'metavar': '<n>',
+            'help': 'Number of helper processes importing _pb2 modules with '
+                    'protobuf-descriptors=worker.',
+        }),
+        ('protobuf-worker-max-modules', {
+            'default': 500, 'type': 'int', 'metavar': '<n>',
+            'help': 'Replace a helper process after it has imported this many '
+                    '_pb2 modules, to bound its memory. 0 never replaces them.',
+        }),
+        ('protobuf-worker-timeout', {
+            'default': 60, 'type': 'int', 'metavar': '<seconds>',
+            'help': 'Kill a helper process that takes longer than this to '
+                    'import a _pb2 module, which is then decoded instead. 0 '
+                    'waits forever.',
+        }),
+        ('protobuf-prune-modules', {
+            'default': False, 'type': 'yn', 'metavar': '<y or n>',
+            'help': 'Remove the generated descriptor code from _pb2 modules '
+                    'once their stubs are installed, keeping imports and the '
+                    'names not replaced by stubs, to reduce memory use.',
+        }),
+        ('protobuf-fold-duplicates', {
+            'default': False, 'type': 'yn', 'metavar': '<y or n>',
+            'help': 'Transform _pb2 modules with identical serialized '
+                    'descriptors, such as vendored copies of the same .proto, '
+                    'once per run and share their stubs, which stay parented '
+                    'to the first copy. Folded modules are counted as '
+                    '"folded_modules" in the statistics report.',
+        }),
+        ('protobuf-index-roots', {
+            'default': (), 'type': 'csv', 'metavar': '<dirs>',
+            'help': 'Index the _pb2 modules under these source roots once per '
+                    'run, and use the index to find imported _pb2 modules and '
+                    'the modules of .proto dependencies instead of searching '
+                    'the path.',
+        }),
+        ('protobuf-index-file', {
+            'default': '', 'type': 'string', 'metavar': '<file>',
+            'help': 'Keep the index of protobuf-index-roots in this file between '
+                    'runs, listing only the directories that changed.',
+        }),
+    )
+    _location_index = None  # type: Any
+    _worker_pool = None  # type: Any
 
-    def __init__(self, linter):
-        self.linter = linter
-
+    def _option(self, name):
+        try:
+            return getattr(self.linter.config, name)
+        except AttributeError:
+            return getattr(self.config, name)  # pylint < 2.14
+
+    def open(self):
+        use_builtin_descriptors(self._option('protobuf_descriptors') == 'builtin')
+        use_pruned_modules(self._option('protobuf_prune_modules'))
+        use_folded_duplicates(self._option('protobuf_fold_duplicates'))
+        STATS.reset()
+        self._configure_location_index()
+        self._configure_worker_pool()
+        SLOW_NODES.reset(self._option('protobuf_slow_nodes'))
+        MEMORY.configure(self._option('protobuf_memory'))
+        TRACE.configure(self._option('protobuf_trace'))
+        self._configure_run_outputs()
+        STATS.time_checks = self._check_times_used()
+
+    def process_module(self, node):
+        # raw checkers run before any checker visits the module; pylint gets
+        # a _pb2 module that is linted after a file importing it from the
+        # astroid cache, as built from its header for that import
+        build_whole_module(node)
+
+    def _configure_location_index(self):
+        # with -j, open is called for every file; index once per checker
+        roots = list(self._option('protobuf_index_roots'))
+        if not roots:
+            self._location_index = None
+        elif self._location_index is None:
+            from .locations import build_index
+            with STATS.timed('transform', 'index'):
+                self._location_index = build_index(
+                    roots, self._option('protobuf_index_file') or None)
+        use_location_index(self._location_index)
+
+    def _configure_worker_pool(self):
+        # like the index, the pool outlives the files of a -j worker, and
+        # its helpers are stopped at exit
+        if self._option('protobuf_descriptors') != 'worker':
+            use_worker_pool(None)
+            return
+        if self._worker_pool is None:
+            from .workers import WorkerPool
+            self._worker_pool = WorkerPool(
+                self._option('protobuf_workers'), self._option('protobuf_worker_max_modules'),
+                self._option('protobuf_worker_timeout'),
+            )
+        use_worker_pool(self._worker_pool)
+
+    def _configure_run_outputs(self):
+        PROFILER.configure(self._option('protobuf_profile'))
+        METRICS.configure(self._option('protobuf_metrics'), (
+            (msgid, symbol) for msgid, (_, symbol, _) in MESSAGES.items()
+        ))
+
+    def _check_times_used(self):
+        # -j workers have their own reporter, but the options of the parent;
+        # the test linter of pylint < 2.13 has neither
+        reporter = getattr(self.linter, 'reporter', None)
+        config = getattr(self.linter, 'config', None)
+        json_output = any(
+            isinstance(r, ProtobufJSONReporter)
+            for r in getattr(reporter, '_sub_reporters', [reporter])
+        ) or ProtobufJSONReporter.name in str(getattr(config, 'output_format', ''))
+        return bool(getattr(config, 'reports', False) or json_output
+                    or METRICS.enabled or SLOW_NODES.enabled)
+
+    def _parallel(self):
+        # with -j, checkers are opened and closed around every file in the
+        # worker processes, and never in the parent
+        return self._option('jobs') > 1 and not self._option('from_stdin')
+
+    def close(self):
+        MEMORY.stop()
+        if self._worker_pool is not None and not self._parallel():
+            self._worker_pool.close()
+        if METRICS.enabled and not self._parallel():
+            METRICS.write()
+
+    def add_message(self, msgid, *args, **kwargs):
+        super().add_message(msgid, *args, **kwargs)
+        if METRICS.enabled:
+            node = kwargs.get('node')
+            line = kwargs.get('line', node.fromlineno if node is not None else None)
+            if self.linter.is_message_enabled(msgid, line):
+                msg, = self.linter.msgs_store.get_message_definitions(msgid)
+                METRICS.inc('lint_messages', msgid=msg.msgid, symbol=msg.symbol)
+
+    def get_map_data(self):
+        # collected in each worker process after every file with -j
+        data = {
+            'stats': STATS.as_dict(), 'slow_nodes': SLOW_NODES.entries(), 'memory': MEMORY.records,
+            'metrics': METRICS.samples, 'profile': PROFILER.dump(),
+        }
+        STATS.reset()
+        SLOW_NODES.reset()
+        MEMORY.records = []
+        METRICS.reset()
+        return data
+
+    def reduce_map_data(self, linter, data):
+        self._configure_run_outputs()
+        for worker_data in data:
+            STATS.merge(worker_data['stats'])
+            SLOW_NODES.merge(worker_data['slow_nodes'])
+            MEMORY.merge(worker_data['memory'])
+            METRICS.merge(worker_data['metrics'])
+            if worker_data['profile']:
+                PROFILER.worker_files.add(worker_data['profile'])
+        if METRICS.enabled:
+            METRICS.write()
+
+    @PROFILER.scoped
     def visit_import(self, node):
         # type: (astroid.Import) -> None
         for modname, _ in node.names:
             self._check_import(node, modname)
 
+    @PROFILER.scoped
     def visit_importfrom(self, node):
         # type: (astroid.ImportFrom) -> None
         self._check_import(node, node.modname)
@@ -176,6 +490,8 @@ class ProtobufDescriptorChecker(BaseChecker):
         except astroid.AstroidBuildingError:
             assert not _MISSING_IMPORT_IS_ERROR, 'expected to import module "{}"'.format(modname)
 
+    @PROFILER.scoped
+    @tracks_slow_nodes(_call_receiver)
     def visit_call(self, node):
         self._check_enum_values(node)
         self._check_init_posargs(node)
@@ -184,6 +500,7 @@ class ProtobufDescriptorChecker(BaseChecker):
         self._check_repeated_composite(node)
         self._check_hasfield(node)
 
+    @timed_check
     @check_messages('protobuf-enum-value')
     def _check_enum_values(self, node):
         if len(node.args) != 1:
@@ -209,16 +526,19 @@ class ProtobufDescriptorChecker(BaseChecker):
                 self.add_message('protobuf-enum-value', args=(val, desc.name), node=node)
                 break  # should we continue to check?
 
+    @timed_check
     def _check_init_posargs(self, node):
         # type: (astroid.Call) -> None
         desc = _get_protobuf_descriptor(node.func)
         self._check_posargs(desc, node)
 
+    @timed_check
     def _check_init_kwargs(self, node):
         # type: (astroid.Call) -> None
         desc = _get_protobuf_descriptor(node.func)
         self._check_kwargs(desc, node)
 
+    @timed_check
     def _check_repeated_composite(self, node):
         # type: (astroid.Call) -> None
         func = node.func
@@ -232,12 +552,14 @@ class ProtobufDescriptorChecker(BaseChecker):
         self._check_posargs(desc, node)
         self._check_kwargs(desc, node)
 
+    @timed_check
     @check_messages('protobuf-no-posargs')
     def _check_posargs(self, desc, node):
         # type: (Optional[SimpleDescriptor], astroid.Call) -> None
         if desc is not None and len(node.args) > 0:
             self.add_message('protobuf-no-posargs', node=node)
 
+    @timed_check
     @check_messages('protobuf-type-error', 'unexpected-keyword-arg')
     def _check_kwargs(self, desc, node):
         # type: (Optional[SimpleDescriptor], astroid.Call) -> None
@@ -324,6 +646,7 @@ class ProtobufDescriptorChecker(BaseChecker):
                                      args=(desc_name, arg_name, arg_type.__name__, val))
                 break
 
+    @timed_check
     @check_messages('protobuf-type-error')
     def _check_repeated_scalar(self, node):
         # type: (astroid.Call) -> None
@@ -381,6 +704,7 @@ class ProtobufDescriptorChecker(BaseChecker):
         for val in vals:
             check_arg(val)
 
+    @timed_check
     @check_messages(
         'protobuf-undefined-attribute',
         'protobuf-no-repeated-membership',
@@ -412,27 +736,34 @@ class ProtobufDescriptorChecker(BaseChecker):
                         self.add_message('protobuf-no-proto3-membership', node=node, args=(val.value,))
                         continue
 
+    @PROFILER.scoped
     @check_messages('protobuf-undefined-attribute')
     def visit_assignattr(self, node):
         # type: (astroid.AssignAttr) -> None
         self._assignattr(node)
 
+    @PROFILER.scoped
+    @tracks_slow_nodes(_attribute_receiver)
     @check_messages('protobuf-undefined-attribute')
     def visit_attribute(self, node):
         # type: (astroid.Attribute) -> None
         self._assignattr(node)
 
+    @timed_check
     def _assignattr(self, node):
         # type: (Union[astroid.Attribute, astroid.AssignAttr]) -> None
+        start = time.perf_counter() if SUBSCRIBERS[INFERENCE_ABANDONED] else 0.0
         try:
-            vals = node.expr.inferred()
+            vals = _timed_inference('_assignattr', node.expr.inferred)
         except astroid.InferenceError:
+            _inference_abandoned('_assignattr', node.expr, 'error', start)
             return  # TODO: warn or redo
         descriptors = []  # type: List[SimpleDescriptor]
         # Look for any version of the inferred type to be a Protobuf class
         for val in vals:
             cls_def = None
             if val is astroid.Uninferable:
+                _inference_abandoned('_assignattr', node.expr, 'uninferable', start)
                 return  # break early (ref #44 and astroid 03d15b0)
             if hasattr(val, '_proxied'):
                 cls_def = val._proxied  # type: astroid.ClassDef
@@ -458,6 +789,7 @@ class ProtobufDescriptorChecker(BaseChecker):
             self._check_type_error(node, found)
             self._check_no_assign(node, found)
 
+    @timed_check
     @check_messages('protobuf-type-error')
     def _check_type_error(self, node, desc):
         # type: (Node, SimpleDescriptor) -> None
@@ -477,6 +809,7 @@ class ProtobufDescriptorChecker(BaseChecker):
                 self.add_message('protobuf-type-error', node=node, args=(desc.name, attr, type_.__name__, val))
                 break
 
+    @timed_check
     @check_messages('protobuf-no-assignment')
     def _check_no_assign(self, node, desc):
         # type: (Node, SimpleDescriptor) -> None
@@ -487,9 +820,12 @@ class ProtobufDescriptorChecker(BaseChecker):
         if is_composite(fd) or is_repeated(fd):
             self.add_message('protobuf-no-assignment', node=node, args=(desc.name, attr))
 
+    @PROFILER.scoped
+    @tracks_slow_nodes(_subscript_receiver)
     def visit_subscript(self, node):
         self._check_extension_getitem(node)
 
+    @timed_check
     @check_messages('protobuf-wrong-extension-scope')
     def _check_extension_getitem(self, node):
         # type: (astroid.Subscript) -> None
@@ -519,6 +855,9 @@ class ProtobufDescriptorChecker(BaseChecker):
 
 def register(linter):
     linter.register_checker(ProtobufDescriptorChecker(linter))
+    linter.register_reporter(ProtobufJSONReporter)
 
 
 astroid.MANAGER.register_transform(astroid.Module, transform_module, is_some_protobuf_module)
+astroid.MANAGER.register_transform(astroid.Import, prebuild_imports)
+astroid.MANAGER.register_transform(astroid.ImportFrom, prebuild_imports)
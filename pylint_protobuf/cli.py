@@ -0,0 +1,77 @@
+"""
+pylint-protobuf-check: run only the protobuf checker
+
+Builds a PyLinter with none of pylint's built-in checkers registered, for
+pre-commit hooks and other places where only the E59xx messages matter.
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from pylint.lint import PyLinter
+from pylint.reporters.text import TextReporter, ParseableTextReporter, ColorizedTextReporter
+
+import pylint_protobuf
+
+REPORTERS = {
+    'text': TextReporter,
+    'parseable': ParseableTextReporter,
+    'colorized': ColorizedTextReporter,
+}
+
+
+def _borrow_message_definitions(linter):
+    # type: (PyLinter) -> None
+    # _check_kwargs reports pylint's own unexpected-keyword-arg, which is
+    # defined by the typecheck checker. Register its message definitions
+    # without registering the checker itself so that none of its visitors run.
+    from pylint.checkers.typecheck import TypeChecker
+    linter.msgs_store.register_messages_from_checker(TypeChecker(linter))
+
+
+def make_linter(reporter=None):
+    # type: (Optional[TextReporter]) -> PyLinter
+    linter = PyLinter()
+    linter.set_reporter(reporter or TextReporter())
+    _borrow_message_definitions(linter)
+    pylint_protobuf.register(linter)  # the module transform is registered on import
+    return linter
+
+
+def main(argv=None):
+    # type: (Optional[List[str]]) -> int
+    parser = argparse.ArgumentParser(
+        prog='pylint-protobuf-check',
+        description='Lint files with only the pylint-protobuf checker enabled.',
+    )
+    parser.add_argument('files', nargs='*',
+                        help='files or modules to lint, "-" reads a list of paths from stdin')
+    parser.add_argument('--from-stdin', metavar='FILENAME',
+                        help='lint source read from stdin, reported as FILENAME')
+    parser.add_argument('--output-format', choices=sorted(REPORTERS), default='text')
+    parser.add_argument('--disable', action='append', default=[], metavar='MSG',
+                        help='message or checker to disable, may be repeated')
+    args = parser.parse_args(argv)
+
+    files = list(args.files)
+    if args.from_stdin:
+        if files:
+            parser.error('--from-stdin does not accept additional files')
+        files = [args.from_stdin]
+    elif '-' in files:
+        files.remove('-')
+        files += [line.strip() for line in sys.stdin if line.strip()]
+    if not files:
+        return 0  # e.g. pre-commit with no matching files
+
+    linter = make_linter(REPORTERS[args.output_format]())
+    if args.from_stdin:
+        linter.config.from_stdin = True  # set_option is ignored before pylint 2.13
+    for msg in args.disable:
+        linter.disable(msg)
+    linter.check(files)
+    return linter.msg_status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,491 @@
+"""
+Pure-Python decoding of serialized FileDescriptorProto and FileDescriptorSet
+
+Every _pb2 module embeds its serialized FileDescriptorProto. This decodes
+the parts of descriptor.proto the plugin needs (names, numbers, labels,
+types, oneofs, nesting, extensions and the map_entry option) into classes
+with the same attributes as google.protobuf.descriptor, so that the plugin
+can run without importing the protobuf runtime. Unknown fields are skipped.
+"""
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+WIRETYPE_VARINT = 0
+WIRETYPE_FIXED64 = 1
+WIRETYPE_LENGTH_DELIMITED = 2
+WIRETYPE_START_GROUP = 3
+WIRETYPE_END_GROUP = 4
+WIRETYPE_FIXED32 = 5
+
+
+class DecodeError(ValueError):
+    pass
+
+
+def _varint(buf, pos):
+    # type: (bytes, int) -> Tuple[int, int]
+    result = shift = 0
+    while True:
+        try:
+            b = buf[pos]
+        except IndexError:
+            raise DecodeError('truncated varint')
+        pos += 1
+        result |= (b & 0x7f) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise DecodeError('varint too long')
+
+
+def _signed(value):
+    # type: (int) -> int
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _skip_group(buf, pos, number):
+    # type: (bytes, int, int) -> int
+    while True:
+        key, pos = _varint(buf, pos)
+        if key & 7 == WIRETYPE_END_GROUP:
+            if key >> 3 != number:
+                raise DecodeError('mismatched end group')
+            return pos
+        pos = _read_value(buf, pos, key)[1]
+
+
+def _read_value(buf, pos, key):
+    # type: (bytes, int, int) -> Tuple[Union[int, bytes, None], int]
+    wire_type = key & 7
+    if wire_type == WIRETYPE_VARINT:
+        return _varint(buf, pos)
+    if wire_type == WIRETYPE_LENGTH_DELIMITED:
+        size, pos = _varint(buf, pos)
+        end = pos + size
+    elif wire_type == WIRETYPE_FIXED64:
+        end = pos + 8
+    elif wire_type == WIRETYPE_FIXED32:
+        end = pos + 4
+    elif wire_type == WIRETYPE_START_GROUP:
+        return None, _skip_group(buf, pos, key >> 3)
+    else:
+        raise DecodeError('unexpected wire type {}'.format(wire_type))
+    if end > len(buf):
+        raise DecodeError('truncated field')
+    return buf[pos:end], end
+
+
+def iter_fields(buf):
+    # type: (bytes) -> Iterator[Tuple[int, Union[int, bytes, None]]]
+    """
+    Yields (field number, value) for each field of a serialized message
+
+    Varints are ints, length-delimited and fixed-width fields are bytes and
+    groups are skipped with a value of None.
+    """
+    pos = 0
+    while pos < len(buf):
+        key, pos = _varint(buf, pos)
+        value, pos = _read_value(buf, pos, key)
+        yield key >> 3, value
+
+
+def _packed_varints(buf):
+    # type: (bytes) -> List[int]
+    values, pos = [], 0
+    while pos < len(buf):
+        value, pos = _varint(buf, pos)
+        values.append(value)
+    return values
+
+
+def _text(value):
+    # type: (Any) -> str
+    return bytes(value).decode('utf-8')
+
+
+MessageOptions = NamedTuple('MessageOptions', [('map_entry', bool)])
+
+
+class FieldDescriptor(object):
+    # Values of FieldDescriptorProto.Type and .Label, shared with
+    # google.protobuf.descriptor.FieldDescriptor
+    TYPE_DOUBLE = 1
+    TYPE_FLOAT = 2
+    TYPE_INT64 = 3
+    TYPE_UINT64 = 4
+    TYPE_INT32 = 5
+    TYPE_FIXED64 = 6
+    TYPE_FIXED32 = 7
+    TYPE_BOOL = 8
+    TYPE_STRING = 9
+    TYPE_GROUP = 10
+    TYPE_MESSAGE = 11
+    TYPE_BYTES = 12
+    TYPE_UINT32 = 13
+    TYPE_ENUM = 14
+    TYPE_SFIXED32 = 15
+    TYPE_SFIXED64 = 16
+    TYPE_SINT32 = 17
+    TYPE_SINT64 = 18
+
+    CPPTYPE_INT32 = 1
+    CPPTYPE_INT64 = 2
+    CPPTYPE_UINT32 = 3
+    CPPTYPE_UINT64 = 4
+    CPPTYPE_DOUBLE = 5
+    CPPTYPE_FLOAT = 6
+    CPPTYPE_BOOL = 7
+    CPPTYPE_ENUM = 8
+    CPPTYPE_STRING = 9
+    CPPTYPE_MESSAGE = 10
+
+    LABEL_OPTIONAL = 1
+    LABEL_REQUIRED = 2
+    LABEL_REPEATED = 3
+
+    def __init__(self, pool, scope, index, is_extension):
+        # type: (DescriptorPool, Union[Descriptor, FileDescriptor], int, bool) -> None
+        self.name = ''
+        self.full_name = ''
+        self.number = 0
+        self.index = index
+        self.label = self.LABEL_OPTIONAL
+        self.type = 0
+        self.is_extension = is_extension
+        self.extension_scope = scope if is_extension and isinstance(scope, Descriptor) else None
+        self.containing_oneof = None  # type: Optional[OneofDescriptor]
+        self.has_default_value = False
+        self.file = scope if isinstance(scope, FileDescriptor) else scope.file
+        self._pool = pool
+        self._scope = scope
+        self._type_name = ''
+        self._extendee = ''
+        self._oneof_index = None  # type: Optional[int]
+
+    @property
+    def cpp_type(self):
+        # type: () -> int
+        return _CPP_TYPES.get(self.type, 0)
+
+    @property
+    def containing_type(self):
+        # type: () -> Optional[Descriptor]
+        if self.is_extension:
+            return self._pool.find_message_type(self._extendee)
+        return self._scope  # type: ignore
+
+    @property
+    def message_type(self):
+        # type: () -> Optional[Descriptor]
+        if self.type not in (self.TYPE_MESSAGE, self.TYPE_GROUP):
+            return None
+        return self._pool.find_message_type(self._type_name)
+
+    @property
+    def enum_type(self):
+        # type: () -> Optional[EnumDescriptor]
+        if self.type != self.TYPE_ENUM:
+            return None
+        return self._pool.find_enum_type(self._type_name)
+
+
+_CPP_TYPES = {
+    FieldDescriptor.TYPE_DOUBLE: FieldDescriptor.CPPTYPE_DOUBLE,
+    FieldDescriptor.TYPE_FLOAT: FieldDescriptor.CPPTYPE_FLOAT,
+    FieldDescriptor.TYPE_INT64: FieldDescriptor.CPPTYPE_INT64,
+    FieldDescriptor.TYPE_UINT64: FieldDescriptor.CPPTYPE_UINT64,
+    FieldDescriptor.TYPE_INT32: FieldDescriptor.CPPTYPE_INT32,
+    FieldDescriptor.TYPE_FIXED64: FieldDescriptor.CPPTYPE_UINT64,
+    FieldDescriptor.TYPE_FIXED32: FieldDescriptor.CPPTYPE_UINT32,
+    FieldDescriptor.TYPE_BOOL: FieldDescriptor.CPPTYPE_BOOL,
+    FieldDescriptor.TYPE_STRING: FieldDescriptor.CPPTYPE_STRING,
+    FieldDescriptor.TYPE_GROUP: FieldDescriptor.CPPTYPE_MESSAGE,
+    FieldDescriptor.TYPE_MESSAGE: FieldDescriptor.CPPTYPE_MESSAGE,
+    FieldDescriptor.TYPE_BYTES: FieldDescriptor.CPPTYPE_STRING,
+    FieldDescriptor.TYPE_UINT32: FieldDescriptor.CPPTYPE_UINT32,
+    FieldDescriptor.TYPE_ENUM: FieldDescriptor.CPPTYPE_ENUM,
+    FieldDescriptor.TYPE_SFIXED32: FieldDescriptor.CPPTYPE_INT32,
+    FieldDescriptor.TYPE_SFIXED64: FieldDescriptor.CPPTYPE_INT64,
+    FieldDescriptor.TYPE_SINT32: FieldDescriptor.CPPTYPE_INT32,
+    FieldDescriptor.TYPE_SINT64: FieldDescriptor.CPPTYPE_INT64,
+}
+
+
+class OneofDescriptor(object):
+    def __init__(self, name, full_name, index, containing_type):
+        # type: (str, str, int, Descriptor) -> None
+        self.name = name
+        self.full_name = full_name
+        self.index = index
+        self.containing_type = containing_type
+        self.fields = []  # type: List[FieldDescriptor]
+
+
+class EnumValueDescriptor(object):
+    def __init__(self, name, index, number, type):
+        # type: (str, int, int, EnumDescriptor) -> None
+        self.name = name
+        self.index = index
+        self.number = number
+        self.type = type
+
+
+class EnumDescriptor(object):
+    def __init__(self, file, containing_type):
+        # type: (FileDescriptor, Optional[Descriptor]) -> None
+        self.name = ''
+        self.full_name = ''
+        self.file = file
+        self.containing_type = containing_type
+        self.values = []  # type: List[EnumValueDescriptor]
+        self.values_by_name = {}  # type: Dict[str, EnumValueDescriptor]
+        self.values_by_number = {}  # type: Dict[int, EnumValueDescriptor]
+
+
+class Descriptor(object):
+    def __init__(self, file, containing_type):
+        # type: (FileDescriptor, Optional[Descriptor]) -> None
+        self.name = ''
+        self.full_name = ''
+        self.file = file
+        self.containing_type = containing_type
+        self.fields = []  # type: List[FieldDescriptor]
+        self.fields_by_name = {}  # type: Dict[str, FieldDescriptor]
+        self.fields_by_number = {}  # type: Dict[int, FieldDescriptor]
+        self.nested_types = []  # type: List[Descriptor]
+        self.nested_types_by_name = {}  # type: Dict[str, Descriptor]
+        self.enum_types = []  # type: List[EnumDescriptor]
+        self.enum_types_by_name = {}  # type: Dict[str, EnumDescriptor]
+        self.enum_values_by_name = {}  # type: Dict[str, EnumValueDescriptor]
+        self.extensions = []  # type: List[FieldDescriptor]
+        self.extensions_by_name = {}  # type: Dict[str, FieldDescriptor]
+        self.oneofs = []  # type: List[OneofDescriptor]
+        self.oneofs_by_name = {}  # type: Dict[str, OneofDescriptor]
+        self.is_extendable = False
+        self.has_options = False
+        self._options = MessageOptions(map_entry=False)
+
+    def GetOptions(self):
+        # type: () -> MessageOptions
+        return self._options
+
+
+class FileDescriptor(object):
+    def __init__(self, pool, serialized_pb):
+        # type: (DescriptorPool, bytes) -> None
+        self.pool = pool
+        self.serialized_pb = serialized_pb
+        self.name = ''
+        self.package = ''
+        self.syntax = 'proto2'
+        self.dependency_names = []  # type: List[str]
+        self.public_dependency_names = []  # type: List[str]
+        self.message_types_by_name = {}  # type: Dict[str, Descriptor]
+        self.enum_types_by_name = {}  # type: Dict[str, EnumDescriptor]
+        self.extensions_by_name = {}  # type: Dict[str, FieldDescriptor]
+
+    @property
+    def dependencies(self):
+        # type: () -> List[FileDescriptor]
+        return [self.pool.files[n] for n in self.dependency_names if n in self.pool.files]
+
+    @property
+    def public_dependencies(self):
+        # type: () -> List[FileDescriptor]
+        return [self.pool.files[n] for n in self.public_dependency_names if n in self.pool.files]
+
+
+def _qualify(scope, name):
+    # type: (str, str) -> str
+    return '{}.{}'.format(scope, name) if scope else name
+
+
+class DescriptorPool(object):
+    """
+    Decoded files and the messages and enums they define, by full name
+
+    Type names are resolved when first read, so files can be added in any
+    order. Names that no added file defines resolve to a placeholder
+    message from the "unresolved.proto" file.
+    """
+    def __init__(self):
+        self.files = {}  # type: Dict[str, FileDescriptor]
+        self._symbols = {}  # type: Dict[str, Union[Descriptor, EnumDescriptor]]
+        self._unresolved = FileDescriptor(self, b'')
+        self._unresolved.name = 'unresolved.proto'
+
+    def add_serialized_file(self, serialized_pb):
+        # type: (bytes) -> FileDescriptor
+        """
+        Decode a FileDescriptorProto, returning the already decoded file of
+        the same name if there is one. Raises DecodeError if that file was
+        decoded from different bytes, such as another package's api.proto.
+        """
+        file = FileDescriptor(self, bytes(serialized_pb))
+        messages, enums, extensions, public = [], [], [], []
+        for number, value in iter_fields(file.serialized_pb):
+            if number == 1:
+                file.name = _text(value)
+            elif number == 2:
+                file.package = _text(value)
+            elif number == 3:
+                file.dependency_names.append(_text(value))
+            elif number == 4:
+                messages.append(value)
+            elif number == 5:
+                enums.append(value)
+            elif number == 7:
+                extensions.append(value)
+            elif number == 10:
+                public.extend(_packed_varints(value) if isinstance(value, bytes) else [value])
+            elif number == 12:
+                file.syntax = _text(value)
+        existing = self.files.get(file.name)
+        if existing is not None:
+            if existing.serialized_pb != file.serialized_pb:
+                raise DecodeError('a different {} was already added'.format(file.name))
+            return existing
+        file.public_dependency_names = [
+            file.dependency_names[i] for i in public if 0 <= i < len(file.dependency_names)
+        ]
+        for value in messages:
+            desc = self._message(value, file, None, file.package)
+            file.message_types_by_name[desc.name] = desc
+        for value in enums:
+            enum = self._enum(value, file, None, file.package)
+            file.enum_types_by_name[enum.name] = enum
+        for i, value in enumerate(extensions):
+            ext = self._field(value, file, i, file.package, is_extension=True)
+            file.extensions_by_name[ext.name] = ext
+        self.files[file.name] = file
+        return file
+
+    def add_serialized_file_set(self, serialized):
+        # type: (bytes) -> List[FileDescriptor]
+        return [
+            self.add_serialized_file(value)
+            for number, value in iter_fields(serialized) if number == 1
+        ]
+
+    def find_message_type(self, type_name):
+        # type: (str) -> Descriptor
+        desc = self._symbols.get(type_name.lstrip('.'))
+        if isinstance(desc, Descriptor):
+            return desc
+        return self._placeholder(type_name.lstrip('.'))
+
+    def find_symbol(self, full_name):
+        # type: (str) -> Optional[Union[Descriptor, EnumDescriptor]]
+        return self._symbols.get(full_name.lstrip('.'))
+
+    def find_enum_type(self, type_name):
+        # type: (str) -> Optional[EnumDescriptor]
+        enum = self._symbols.get(type_name.lstrip('.'))
+        return enum if isinstance(enum, EnumDescriptor) else None
+
+    def _placeholder(self, full_name):
+        # type: (str) -> Descriptor
+        desc = Descriptor(self._unresolved, None)
+        desc.full_name = full_name
+        desc.name = full_name.rpartition('.')[2]
+        self._symbols[full_name] = desc
+        return desc
+
+    def _message(self, buf, file, containing_type, scope):
+        # type: (bytes, FileDescriptor, Optional[Descriptor], str) -> Descriptor
+        desc = Descriptor(file, containing_type)
+        fields, nested, enums, extensions, oneofs = [], [], [], [], []
+        for number, value in iter_fields(buf):
+            if number == 1:
+                desc.name = _text(value)
+            elif number == 2:
+                fields.append(value)
+            elif number == 3:
+                nested.append(value)
+            elif number == 4:
+                enums.append(value)
+            elif number == 5:
+                desc.is_extendable = True
+            elif number == 6:
+                extensions.append(value)
+            elif number == 7:
+                desc.has_options = True
+                map_entry = any(n == 7 and v for n, v in iter_fields(value))
+                desc._options = MessageOptions(map_entry=map_entry)
+            elif number == 8:
+                oneofs.append(value)
+        desc.full_name = _qualify(scope, desc.name)
+        self._symbols[desc.full_name] = desc
+        for i, value in enumerate(oneofs):
+            name = next((_text(v) for n, v in iter_fields(value) if n == 1), '')
+            oneof = OneofDescriptor(name, _qualify(desc.full_name, name), i, desc)
+            desc.oneofs.append(oneof)
+            desc.oneofs_by_name[name] = oneof
+        for i, value in enumerate(fields):
+            field = self._field(value, desc, i, desc.full_name)
+            desc.fields.append(field)
+            desc.fields_by_name[field.name] = field
+            desc.fields_by_number[field.number] = field
+            if field._oneof_index is not None and field._oneof_index < len(desc.oneofs):
+                field.containing_oneof = desc.oneofs[field._oneof_index]
+                field.containing_oneof.fields.append(field)
+        for value in nested:
+            nested_desc = self._message(value, file, desc, desc.full_name)
+            desc.nested_types.append(nested_desc)
+            desc.nested_types_by_name[nested_desc.name] = nested_desc
+        for value in enums:
+            enum = self._enum(value, file, desc, desc.full_name)
+            desc.enum_types.append(enum)
+            desc.enum_types_by_name[enum.name] = enum
+            for enum_value in enum.values:
+                desc.enum_values_by_name[enum_value.name] = enum_value
+        for i, value in enumerate(extensions):
+            ext = self._field(value, desc, i, desc.full_name, is_extension=True)
+            desc.extensions.append(ext)
+            desc.extensions_by_name[ext.name] = ext
+        return desc
+
+    def _enum(self, buf, file, containing_type, scope):
+        # type: (bytes, FileDescriptor, Optional[Descriptor], str) -> EnumDescriptor
+        enum = EnumDescriptor(file, containing_type)
+        for number, value in iter_fields(buf):
+            if number == 1:
+                enum.name = _text(value)
+            elif number == 2:
+                name, value_number = '', 0
+                for n, v in iter_fields(value):
+                    if n == 1:
+                        name = _text(v)
+                    elif n == 2:
+                        value_number = _signed(v)
+                enum_value = EnumValueDescriptor(name, len(enum.values), value_number, enum)
+                enum.values.append(enum_value)
+                enum.values_by_name[name] = enum_value
+                enum.values_by_number.setdefault(value_number, enum_value)
+        enum.full_name = _qualify(scope, enum.name)
+        self._symbols[enum.full_name] = enum
+        return enum
+
+    def _field(self, buf, scope, index, scope_name, is_extension=False):
+        # type: (bytes, Union[Descriptor, FileDescriptor], int, str, bool) -> FieldDescriptor
+        field = FieldDescriptor(self, scope, index, is_extension)
+        for number, value in iter_fields(buf):
+            if number == 1:
+                field.name = _text(value)
+            elif number == 2:
+                field._extendee = _text(value)
+            elif number == 3:
+                field.number = value
+            elif number == 4:
+                field.label = value
+            elif number == 5:
+                field.type = value
+            elif number == 6:
+                field._type_name = _text(value)
+            elif number == 7:
+                field.has_default_value = True
+            elif number == 9:
+                field._oneof_index = value
+        field.full_name = _qualify(scope_name, field.name)
+        return field
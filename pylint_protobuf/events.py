@@ -0,0 +1,85 @@
+"""
+Instrumentation hooks for the module transform and the checker
+
+Subscribe a callback to one of the event names below to be called with an
+Event each time it occurs, e.g.
+
+    import pylint_protobuf
+
+    def on_transform_end(event):
+        print(event.data['module'], event.duration)
+
+    pylint_protobuf.subscribe(pylint_protobuf.TRANSFORM_END, on_transform_end)
+
+Event data always includes "module" (the _pb2 module name) for transform
+events and "node" (the astroid node being checked) for checker events. When
+no callback is subscribed to an event, emitting it costs one truthiness test.
+Exceptions raised by callbacks are not caught.
+
+transform_start      module, file, node
+transform_end        module, file, node, stubs, phases, cache_hit, exec_error
+exec_failure         module, file, error, exception
+cache_hit            module, cache
+cache_miss           module, cache
+check                check, node
+inference_abandoned  site, node, reason ("error" or "uninferable")
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+TRANSFORM_START = 'transform_start'
+TRANSFORM_END = 'transform_end'
+EXEC_FAILURE = 'exec_failure'
+CACHE_HIT = 'cache_hit'
+CACHE_MISS = 'cache_miss'
+CHECK = 'check'
+INFERENCE_ABANDONED = 'inference_abandoned'
+EVENTS = (
+    TRANSFORM_START, TRANSFORM_END, EXEC_FAILURE, CACHE_HIT, CACHE_MISS, CHECK,
+    INFERENCE_ABANDONED,
+)
+
+Event = NamedTuple('Event', [
+    ('name', str),
+    ('timestamp', float),  # time.perf_counter() when emitted
+    ('duration', Optional[float]),  # seconds, for events that end a timed span
+    ('data', Dict[str, Any]),
+])
+Callback = Callable[[Event], None]
+
+# Emitters test SUBSCRIBERS[name] before building any event data
+SUBSCRIBERS = {name: [] for name in EVENTS}  # type: Dict[str, List[Callback]]
+
+
+def subscribe(name, callback):
+    # type: (str, Callback) -> None
+    if name not in SUBSCRIBERS:
+        raise ValueError('unknown event {!r}, expected one of {}'.format(name, ', '.join(EVENTS)))
+    if callback not in SUBSCRIBERS[name]:
+        SUBSCRIBERS[name].append(callback)
+
+
+def unsubscribe(name, callback):
+    # type: (str, Callback) -> None
+    try:
+        SUBSCRIBERS[name].remove(callback)
+    except (KeyError, ValueError):
+        pass
+
+
+@contextmanager
+def subscribed(name, callback):
+    # type: (str, Callback) -> Iterator[None]
+    subscribe(name, callback)
+    try:
+        yield
+    finally:
+        unsubscribe(name, callback)
+
+
+def emit(name, duration=None, **data):
+    # type: (str, Optional[float], Any) -> None
+    event = Event(name, time.perf_counter(), duration, data)
+    for callback in list(SUBSCRIBERS[name]):
+        callback(event)
@@ -0,0 +1,324 @@
+"""
+Compute the set of files to lint from a list of changed paths.
+
+Consumers of a generated ``_pb2`` module have to be re-checked whenever that
+module changes, even if their own source did not. That includes files that
+get its messages through other modules: a package re-exporting them, with a
+``*`` import, an ``import X as X`` alias or ``__all__``, or another ``_pb2``
+module whose messages use them. Files importing any other consumer are not
+affected. A reverse-dependency index from modules to the files importing
+them is persisted between runs and refreshed for files whose mtime has
+changed. Files are keyed by absolute path, so that the index can be used
+from any directory.
+
+Usage::
+
+    git diff --name-only origin/main | python -m pylint_protobuf.incremental
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import astroid
+
+INDEX_VERSION = 3
+DEFAULT_INDEX = '.pylint-protobuf-index.json'
+SKIP_DIRS = {'__pycache__', '.git', '.hg', '.tox', '.nox', '.venv', 'venv', 'node_modules'}
+
+Entry = Dict[str, object]
+
+
+def is_pb2_module(modname):
+    # type: (str) -> bool
+    return modname.endswith('_pb2')
+
+
+def _normpath(path):
+    # type: (str) -> str
+    return os.path.normpath(os.path.abspath(path))
+
+
+def module_name(path, roots):
+    # type: (str, Iterable[str]) -> Optional[str]
+    """
+    Dotted module name of path relative to the most specific root containing it
+    """
+    path = os.path.abspath(path)
+    best = None  # type: Optional[str]
+    for root in roots:
+        root = os.path.abspath(root)
+        if os.path.commonpath([root, path]) != root:
+            continue
+        rel = os.path.relpath(path, root)
+        if best is None or len(rel) < len(best):
+            best = rel
+    if best is None:
+        return None
+    parts = best[:-len('.py')].split(os.sep)
+    if parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join(parts)
+
+
+def _proto_source(path):
+    # type: (str) -> Optional[str]
+    """
+    Read the original .proto path from the header protoc writes to each _pb2.py
+    """
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for _, line in zip(range(5), f):
+            if line.startswith('# source: '):
+                return line[len('# source: '):].strip()
+    return None
+
+
+def parse_module(path, modname):
+    # type: (str, Optional[str]) -> Optional[astroid.Module]
+    with open(path, encoding='utf-8', errors='replace') as f:
+        source = f.read()
+    try:
+        # no transforms: parsing a _pb2 module must not execute it
+        return astroid.parse(source, modname or '', path, apply_transforms=False)
+    except (astroid.AstroidSyntaxError, ValueError):
+        return None
+
+
+def _imports(mod):
+    # type: (astroid.Module) -> Iterable[Tuple[astroid.NodeNG, List[str]]]
+    """
+    Yields each import statement with the modules it imports, including each
+    name imported from a package in case it is a submodule
+    """
+    for node in mod.nodes_of_class((astroid.Import, astroid.ImportFrom)):
+        if isinstance(node, astroid.Import):
+            yield node, [name for name, _ in node.names]
+            continue
+        base = node.modname
+        if node.level:
+            try:
+                base = mod.relative_to_absolute_name(node.modname, node.level)
+            except astroid.TooManyLevelsError:
+                continue
+        modnames = [base] if base else []
+        if not is_pb2_module(base):
+            prefix = base + '.' if base else ''
+            modnames += [prefix + name for name, _ in node.names if name != '*']
+        yield node, modnames
+
+
+def imported_modules(mod):
+    # type: (astroid.Module) -> List[str]
+    return sorted({modname for _, modnames in _imports(mod) for modname in modnames})
+
+
+def _all_names(mod):
+    # type: (astroid.Module) -> Set[str]
+    names = set()  # type: Set[str]
+    for node in mod.body:
+        if isinstance(node, astroid.Assign):
+            targets = node.targets
+        elif isinstance(node, astroid.AugAssign):
+            targets = [node.target]
+        else:
+            continue
+        if not any(getattr(t, 'name', None) == '__all__' for t in targets):
+            continue
+        if isinstance(node.value, (astroid.List, astroid.Tuple)):
+            names.update(elt.value for elt in node.value.elts
+                         if isinstance(elt, astroid.Const) and isinstance(elt.value, str))
+    return names
+
+
+def reexported_modules(mod):
+    # type: (astroid.Module) -> List[str]
+    """
+    Modules whose names mod re-exports at module level: with a * import, an
+    import of a name as itself, or a name listed in __all__
+    """
+    public = _all_names(mod)
+    reexported = set()  # type: Set[str]
+    for node, modnames in _imports(mod):
+        if node.scope() is not mod:
+            continue
+        for name, alias in node.names:
+            if name == '*' or alias == name or (alias or name.split('.')[0]) in public:
+                reexported.update(modnames)
+                break
+    return sorted(reexported)
+
+
+class DependencyIndex(object):
+    def __init__(self, roots, files=None):
+        # type: (List[str], Optional[Dict[str, Entry]]) -> None
+        self.roots = roots
+        self.files = files or {}  # type: Dict[str, Entry]
+
+    @classmethod
+    def load(cls, path, roots):
+        # type: (str, List[str]) -> DependencyIndex
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(roots)
+        if data.get('version') != INDEX_VERSION or data.get('roots') != roots:
+            return cls(roots)  # stale format or layout, rebuild from scratch
+        return cls(roots, data['files'])
+
+    def save(self, path):
+        # type: (str) -> None
+        data = {'version': INDEX_VERSION, 'roots': self.roots, 'files': self.files}
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+
+    def _walk(self):
+        # type: () -> Iterable[str]
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+                for fn in filenames:
+                    if fn.endswith('.py'):
+                        yield _normpath(os.path.join(dirpath, fn))
+
+    def refresh(self):
+        # type: () -> int
+        """
+        Rescan files that are new or modified since the index was written
+
+        Returns the number of files rescanned.
+        """
+        seen = set()  # type: Set[str]
+        rescanned = 0
+        for path in self._walk():
+            if path in seen:
+                continue  # nested roots
+            seen.add(path)
+            mtime = os.stat(path).st_mtime
+            entry = self.files.get(path)
+            if entry is not None and entry['mtime'] == mtime:
+                continue
+            modname = module_name(path, self.roots)
+            mod = parse_module(path, modname)
+            self.files[path] = {
+                'mtime': mtime,
+                'module': modname,
+                'imports': imported_modules(mod) if mod is not None else [],
+                'reexports': reexported_modules(mod) if mod is not None else [],
+                'source': _proto_source(path) if modname and is_pb2_module(modname) else None,
+            }
+            rescanned += 1
+        for path in set(self.files) - seen:
+            del self.files[path]
+        return rescanned
+
+    def reverse_dependencies(self):
+        # type: () -> Dict[str, Set[str]]
+        rdeps = {}  # type: Dict[str, Set[str]]
+        for path, entry in self.files.items():
+            for modname in entry['imports']:
+                rdeps.setdefault(modname, set()).add(path)
+        return rdeps
+
+    def _pb2_modules_for(self, changed_path):
+        # type: (str) -> Set[str]
+        path = _normpath(changed_path)
+        if path.endswith('.py'):
+            entry = self.files.get(path)
+            if entry is not None and entry['module'] and is_pb2_module(entry['module']):
+                return {entry['module']}
+            modname = module_name(path, self.roots)  # could have been deleted
+            return {modname} if modname and is_pb2_module(modname) else set()
+        if path.endswith('.proto'):
+            proto = path.replace(os.sep, '/')
+            return {
+                entry['module'] for entry in self.files.values()
+                if entry['source'] and proto.endswith('/' + entry['source'])
+            }
+        return set()
+
+    def dependents(self, modnames):
+        # type: (Iterable[str]) -> Set[str]
+        """
+        Files importing any of modnames, and the files importing the modules
+        among those that pass their names on: _pb2 modules and re-exporters
+        """
+        rdeps = self.reverse_dependencies()
+        queue = list(modnames)
+        visited = set(queue)
+        found = set()  # type: Set[str]
+        while queue:
+            modname = queue.pop()
+            for path in rdeps.get(modname, ()):
+                found.add(path)
+                entry = self.files[path]
+                importer = entry['module']
+                if not importer or importer in visited:
+                    continue
+                if is_pb2_module(importer) or modname in entry['reexports']:
+                    visited.add(importer)
+                    queue.append(importer)
+        return found
+
+    def lint_set(self, changed_paths):
+        # type: (Iterable[str]) -> Tuple[List[str], List[str]]
+        """
+        Returns (files to lint, files added only because of a changed _pb2)
+        """
+        direct = set()  # type: Set[str]
+        changed_pb2 = set()  # type: Set[str]
+        for changed in changed_paths:
+            pb2_modules = self._pb2_modules_for(changed)
+            changed_pb2 |= pb2_modules
+            path = _normpath(changed)
+            if path.endswith('.py') and not pb2_modules and os.path.exists(path):
+                direct.add(path)
+        expansion = {
+            path for path in self.dependents(changed_pb2)
+            if not is_pb2_module(self.files[path]['module'] or '') and path not in direct
+        }
+        return sorted(direct | expansion), sorted(expansion)
+
+
+def main(argv=None):
+    # type: (Optional[List[str]]) -> int
+    parser = argparse.ArgumentParser(
+        prog='python -m pylint_protobuf.incremental',
+        description='Print the files to lint given a list of changed paths.',
+    )
+    parser.add_argument('changed', nargs='*',
+                        help='changed paths, read from stdin when omitted or "-"')
+    parser.add_argument('--index', default=DEFAULT_INDEX,
+                        help='reverse dependency index file (default: %(default)s)')
+    parser.add_argument('--root', action='append', dest='roots', metavar='DIR',
+                        help='source root used to resolve module names, may be repeated '
+                             '(default: .)')
+    parser.add_argument('--rebuild', action='store_true', help='ignore any existing index')
+    args = parser.parse_args(argv)
+
+    changed = args.changed
+    if not changed or changed == ['-']:
+        changed = [line.strip() for line in sys.stdin if line.strip()]
+    roots = [_normpath(r) for r in args.roots or ['.']]
+
+    index = DependencyIndex(roots) if args.rebuild else DependencyIndex.load(args.index, roots)
+    rescanned = index.refresh()
+    index.save(args.index)
+
+    lint, expansion = index.lint_set(changed)
+    for path in lint:
+        print(os.path.relpath(path))
+    print(
+        'pylint-protobuf: {} changed paths, {} files to lint ({} added as dependents of '
+        'changed _pb2 modules, {} of {} indexed files rescanned)'.format(
+            len(changed), len(lint), len(expansion), rescanned, len(index.files)),
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
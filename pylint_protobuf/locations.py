@@ -0,0 +1,129 @@
+"""
+Index of the _pb2 modules under a set of source roots.
+
+Importing a _pb2 module makes astroid look for it in each sys.path entry in
+turn, and the module names derived from the .proto paths of dependencies
+miss whenever protoc was run from another directory. The index maps module
+names and .proto sources to the _pb2.py files under the roots. It is built
+once per run and can be persisted, in which case only directories whose
+mtime has changed are listed again.
+"""
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .incremental import SKIP_DIRS, _proto_source
+
+INDEX_VERSION = 1
+
+Entry = Dict[str, object]
+
+
+class LocationIndex(object):
+    def __init__(self, roots, dirs=None):
+        # type: (List[str], Optional[Dict[str, Entry]]) -> None
+        self.roots = roots
+        # directory -> {'mtime', 'dirs': [subdirectory names], 'pb2': {file name: .proto source}}
+        self.dirs = dirs or {}  # type: Dict[str, Entry]
+        self.modules = {}  # type: Dict[str, str]
+        self.protos = {}  # type: Dict[str, str]
+
+    @classmethod
+    def load(cls, path, roots):
+        # type: (str, List[str]) -> LocationIndex
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(roots)
+        if data.get('version') != INDEX_VERSION or data.get('roots') != roots:
+            return cls(roots)
+        return cls(roots, data['dirs'])
+
+    def save(self, path):
+        # type: (str) -> None
+        data = {'version': INDEX_VERSION, 'roots': self.roots, 'dirs': self.dirs}
+        tmp = '{}.{}.tmp'.format(path, os.getpid())  # workers may save concurrently
+        with open(tmp, 'w') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+
+    def _list(self, dirpath):
+        # type: (str) -> Entry
+        dirs, pb2 = [], {}  # type: Tuple[List[str], Dict[str, Optional[str]]]
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS and not entry.name.startswith('.'):
+                        dirs.append(entry.name)
+                elif entry.name.endswith('_pb2.py'):
+                    pb2[entry.name] = _proto_source(entry.path)
+        return {'mtime': os.stat(dirpath).st_mtime, 'dirs': sorted(dirs), 'pb2': pb2}
+
+    def _walk(self, root, listed):
+        # type: (str, Set[str]) -> Iterator[Tuple[str, Entry]]
+        stack = [root]
+        while stack:
+            dirpath = stack.pop()
+            entry = self.dirs.get(dirpath)
+            if dirpath not in listed:
+                try:
+                    mtime = os.stat(dirpath).st_mtime
+                except OSError:
+                    continue
+                if entry is None or entry['mtime'] != mtime:
+                    entry = self.dirs[dirpath] = self._list(dirpath)
+                listed.add(dirpath)
+            yield dirpath, entry
+            stack.extend(os.path.join(dirpath, d) for d in reversed(entry['dirs']))
+
+    def refresh(self):
+        # type: () -> int
+        """
+        Lists the directories that are new or changed since the index was
+        written, and rebuilds the lookup tables
+
+        Returns the number of directories listed.
+        """
+        before = {path: entry['mtime'] for path, entry in self.dirs.items()}
+        listed = set()  # type: Set[str]
+        self.modules, self.protos = {}, {}
+        for root in self.roots:
+            for dirpath, entry in self._walk(root, listed):
+                rel = os.path.relpath(dirpath, root)
+                package = '' if rel == os.curdir else rel.replace(os.sep, '.') + '.'
+                for fn, source in sorted(entry['pb2'].items()):
+                    modname = package + fn[:-len('.py')]
+                    path = os.path.join(dirpath, fn)
+                    # like sys.path, the first root wins
+                    self.modules.setdefault(modname, path)
+                    if source:
+                        self.protos.setdefault(source, modname)
+        for path in set(self.dirs) - listed:
+            del self.dirs[path]
+        return sum(1 for path in listed if before.get(path) != self.dirs[path]['mtime'])
+
+    def module_path(self, modname):
+        # type: (str) -> Optional[str]
+        return self.modules.get(modname)
+
+    def proto_module(self, proto):
+        # type: (str) -> Optional[str]
+        """
+        The name of the _pb2 module generated from a .proto, as named in the
+        dependencies of a FileDescriptorProto
+        """
+        return self.protos.get(proto)
+
+
+def build_index(roots, path=None):
+    # type: (List[str], Optional[str]) -> LocationIndex
+    """
+    Builds the index of roots, refreshing and saving it at path if given
+    """
+    roots = [os.path.abspath(root) for root in roots]
+    index = LocationIndex.load(path, roots) if path else LocationIndex(roots)
+    index.refresh()
+    if path:
+        index.save(path)
+    return index
@@ -0,0 +1,129 @@
+"""
+Memory accounting for transformed _pb2 modules
+
+When enabled, tracemalloc is started and the traced memory is sampled around
+each module transform. The retained bytes are the growth in traced memory,
+so they include the executed module namespace, the stub trees and anything
+imported while executing the module. The peak during a transform needs
+tracemalloc.reset_peak, from Python 3.9, and is None before.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import astroid
+
+from .events import Event, TRANSFORM_START, TRANSFORM_END, subscribe, unsubscribe
+from .trace import stub_counts
+
+# imported by configure, only when memory accounting is enabled
+tracemalloc = None  # type: Any
+
+
+def stub_file_descriptor(stubs):
+    # type: (List[Tuple[str, Any]]) -> Any
+    """
+    The file descriptor of the first message or enum in a module's stubs,
+    which were built from it whichever way the module was loaded
+    """
+    for _, node in stubs:
+        if getattr(node, '_is_protobuf_class', False):
+            return node._protobuf_descriptor.file
+    return None
+
+
+def count_descriptors(file_desc):
+    # type: (Any) -> int
+    """
+    Count the descriptors reachable from a file descriptor: the file, its
+    messages, fields, extensions, enums and enum values
+    """
+    if file_desc is None or not hasattr(file_desc, 'message_types_by_name'):
+        return 0
+    count = 1
+    stack = list(file_desc.message_types_by_name.values())
+    enums = list(file_desc.enum_types_by_name.values())
+    count += len(file_desc.extensions_by_name)
+    while stack:
+        desc = stack.pop()
+        count += 1 + len(desc.fields) + len(desc.extensions)
+        stack.extend(desc.nested_types)
+        enums.extend(desc.enum_types)
+    for enum_desc in enums:
+        count += 1 + len(enum_desc.values)
+    return count
+
+
+class ModuleMemory(object):
+    def __init__(self, limit=0):
+        # type: (int) -> None
+        self.limit = limit
+        self.records = []  # type: List[Dict[str, Any]]
+        self._started = False
+        self._before = []  # type: List[int]
+
+    @property
+    def enabled(self):
+        # type: () -> bool
+        return self.limit > 0
+
+    def configure(self, limit):
+        # type: (int) -> None
+        self.limit = limit
+        self.records = []
+        self._before = []
+        if not self.enabled:
+            unsubscribe(TRANSFORM_START, self.on_transform_start)
+            unsubscribe(TRANSFORM_END, self.on_transform_end)
+            return
+        subscribe(TRANSFORM_START, self.on_transform_start)
+        subscribe(TRANSFORM_END, self.on_transform_end)
+        global tracemalloc
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+
+    def stop(self):
+        # type: () -> None
+        unsubscribe(TRANSFORM_START, self.on_transform_start)
+        unsubscribe(TRANSFORM_END, self.on_transform_end)
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def on_transform_start(self, event):
+        # type: (Event) -> None
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        self._before.append(current)
+
+    def on_transform_end(self, event):
+        # type: (Event) -> None
+        current, peak = tracemalloc.get_traced_memory()
+        before = self._before.pop()
+        # without reset_peak, the peak is the highest since tracing started
+        peak_bytes = max(peak - before, 0) if hasattr(tracemalloc, 'reset_peak') else None
+        mod = event.data['node']  # type: astroid.Module
+        messages, enums, stub_nodes = stub_counts(event.data['stubs'])
+        self.records.append({
+            'module': mod.name,
+            'retained_bytes': current - before,
+            'peak_bytes': peak_bytes,
+            'module_nodes': sum(1 for _ in mod.nodes_of_class(astroid.node_classes.NodeNG)),
+            'stub_nodes': stub_nodes,
+            'messages': messages,
+            'enums': enums,
+            'reachable_descriptors': count_descriptors(stub_file_descriptor(event.data['stubs'])),
+        })
+
+    def top(self, limit=None):
+        # type: (Optional[int]) -> List[Dict[str, Any]]
+        records = sorted(self.records, key=lambda r: -r['retained_bytes'])
+        return records[:limit or self.limit]
+
+    def merge(self, records):
+        # type: (List[Dict[str, Any]]) -> None
+        self.records.extend(records)
+
+
+MEMORY = ModuleMemory()
@@ -0,0 +1,209 @@
+"""
+OpenMetrics text file export of lint run statistics
+
+Enabled by the protobuf-metrics option naming a file that is replaced at the
+end of the run, e.g. in the directory read by node-exporter's textfile
+collector.
+"""
+import bisect
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .events import (
+    Event, TRANSFORM_END, EXEC_FAILURE, CACHE_HIT, CACHE_MISS, CHECK, INFERENCE_ABANDONED,
+    subscribe, unsubscribe,
+)
+from .stats import STATS
+from .trace import stub_counts
+
+PREFIX = 'pylint_protobuf_'
+BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)  # seconds
+FAMILIES = (
+    ('modules_transformed', 'counter', 'Protobuf modules transformed'),
+    ('messages_stubbed', 'counter', 'Message classes stubbed into transformed modules'),
+    ('enums_stubbed', 'counter', 'Enum classes stubbed into transformed modules'),
+    ('exec_failures', 'counter', 'Protobuf modules that raised when executed'),
+    ('cache_hits', 'counter', 'Transform cache hits'),
+    ('cache_misses', 'counter', 'Transform cache misses'),
+    ('inference_calls', 'counter', 'Inference calls made by the checker'),
+    ('uninferable_nodes', 'counter', 'Nodes skipped because inference failed'),
+    ('lint_messages', 'counter', 'Messages emitted by the protobuf checker'),
+    ('transform_seconds', 'histogram', 'Time spent transforming each protobuf module'),
+    ('check_seconds', 'histogram', 'Time spent in each protobuf check'),
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+Samples = Dict[str, Dict[Labels, Any]]
+
+
+class Histogram(object):
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)  # not cumulative, the last is +Inf
+        self.sum = 0.0
+
+    @property
+    def count(self):
+        # type: () -> int
+        return sum(self.buckets)
+
+    def observe(self, value):
+        # type: (float) -> None
+        self.buckets[bisect.bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+
+    def merge(self, other):
+        # type: (Histogram) -> None
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.sum += other.sum
+
+
+def _labels(**labels):
+    # type: (str) -> Labels
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value):
+    # type: (str) -> str
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _format_labels(labels, extra=()):
+    # type: (Labels, Labels) -> str
+    pairs = labels + extra
+    if not pairs:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(k, _escape(v)) for k, v in pairs) + '}'
+
+
+def _format_value(value):
+    # type: (float) -> str
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class RunMetrics(object):
+    def __init__(self, path=None):
+        # type: (Optional[str]) -> None
+        self.path = path
+        self.samples = {}  # type: Samples
+        self.reset()
+
+    @property
+    def enabled(self):
+        # type: () -> bool
+        return bool(self.path)
+
+    def reset(self):
+        # type: () -> None
+        self.samples = {name: {} for name, _, _ in FAMILIES}
+
+    def configure(self, path, messages=()):
+        # type: (Optional[str], Iterable[Tuple[str, str]]) -> None
+        """
+        Pre-seeds lint_messages with zeros for messages, given as (msgid, symbol)
+        """
+        self.path = path
+        self.reset()
+        callbacks = (
+            (TRANSFORM_END, self.on_transform_end),
+            (EXEC_FAILURE, self.on_exec_failure),
+            (CACHE_HIT, self.on_cache_lookup),
+            (CACHE_MISS, self.on_cache_lookup),
+            (CHECK, self.on_check),
+            (INFERENCE_ABANDONED, self.on_inference_abandoned),
+        )
+        for name, callback in callbacks:
+            if self.enabled:
+                subscribe(name, callback)
+            else:
+                unsubscribe(name, callback)
+        if self.enabled:
+            for msgid, symbol in messages:
+                self.inc('lint_messages', 0, msgid=msgid, symbol=symbol)
+
+    def inc(self, name, amount=1, **labels):
+        # type: (str, int, str) -> None
+        series = self.samples[name]
+        key = _labels(**labels)
+        series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        # type: (str, float, str) -> None
+        self.samples[name].setdefault(_labels(**labels), Histogram()).observe(value)
+
+    def merge(self, other):
+        # type: (Samples) -> None
+        for name, series in other.items():
+            for key, value in series.items():
+                if isinstance(value, Histogram):
+                    self.samples[name].setdefault(key, Histogram()).merge(value)
+                else:
+                    self.samples[name][key] = self.samples[name].get(key, 0) + value
+
+    def on_transform_end(self, event):
+        # type: (Event) -> None
+        messages, enums, _ = stub_counts(event.data['stubs'])
+        self.inc('modules_transformed')
+        self.inc('messages_stubbed', messages)
+        self.inc('enums_stubbed', enums)
+        self.observe('transform_seconds', event.duration)
+
+    def on_exec_failure(self, event):
+        # type: (Event) -> None
+        self.inc('exec_failures')
+
+    def on_cache_lookup(self, event):
+        # type: (Event) -> None
+        name = 'cache_hits' if event.name == CACHE_HIT else 'cache_misses'
+        self.inc(name, cache=event.data['cache'])
+
+    def on_check(self, event):
+        # type: (Event) -> None
+        self.observe('check_seconds', event.duration, check=event.data['check'])
+
+    def on_inference_abandoned(self, event):
+        # type: (Event) -> None
+        self.inc('uninferable_nodes', site=event.data['site'], reason=event.data['reason'])
+
+    def lines(self):
+        # type: () -> List[str]
+        samples = dict(self.samples)
+        samples['inference_calls'] = {
+            _labels(site=site): entry['calls']
+            for site, entry in STATS.as_dict()['inference'].items()
+        }
+        out = []
+        for name, kind, help_text in FAMILIES:
+            family = PREFIX + name
+            out.append('# TYPE {} {}'.format(family, kind))
+            out.append('# HELP {} {}'.format(family, help_text))
+            series = samples[name]
+            if kind == 'counter':
+                if not series:
+                    series = {(): 0}
+                for labels, value in sorted(series.items()):
+                    out.append('{}_total{} {}'.format(
+                        family, _format_labels(labels), _format_value(value)))
+                continue
+            for labels, hist in sorted(series.items()):
+                cumulative = 0
+                for bound, count in zip(BUCKETS + (float('inf'),), hist.buckets):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    out.append('{}_bucket{} {}'.format(
+                        family, _format_labels(labels, (('le', le),)), cumulative))
+                out.append('{}_count{} {}'.format(family, _format_labels(labels), hist.count))
+                out.append('{}_sum{} {}'.format(
+                    family, _format_labels(labels), _format_value(hist.sum)))
+        out.append('# EOF')
+        return out
+
+    def write(self):
+        # type: () -> None
+        # Replace the file in one step so that collectors never read a partial file
+        tmp = '{}.{}.tmp'.format(self.path, os.getpid())
+        with open(tmp, 'w') as f:
+            f.write('\n'.join(self.lines()) + '\n')
+        os.replace(tmp, self.path)
+
+
+METRICS = RunMetrics()
@@ -0,0 +1,134 @@
+"""
+Build imported _pb2 modules from their header instead of parsing them whole.
+
+Generated modules start with their imports and the serialized
+FileDescriptorProto, followed by descriptor, message and enum definitions
+that the transform replaces anyway (tens of thousands of nodes of
+FieldDescriptor calls from older protoc). With builtin descriptors only the
+header, up to the end of the statement holding the serialized descriptor,
+is read and parsed, and the result is put in the astroid cache before
+anything imports the module. A module that is linted itself is rebuilt
+whole in place, with build_whole_module, before it is checked.
+"""
+import tokenize
+from typing import Callable, Iterator, List, Optional, Union
+
+import astroid
+from astroid.builder import AstroidBuilder
+from astroid.manager import AstroidManager
+
+from .stats import STATS
+
+SERIALIZED_NAMES = ('AddSerializedFile', 'serialized_pb')
+# generic services are defined in the module body and not decoded
+FULL_PARSE_IMPORTS = ('service_reflection',)
+
+
+def descriptor_header(readline):
+    # type: (Callable[[], str]) -> Optional[str]
+    """
+    Returns the source up to the end of the statement that holds the
+    serialized descriptor, or None if there is no such statement
+    """
+    lines = []  # type: List[str]
+
+    def read():
+        line = readline()
+        lines.append(line)
+        return line
+
+    found = False
+    try:
+        for tok in tokenize.generate_tokens(read):
+            if tok.type == tokenize.NAME and tok.string in SERIALIZED_NAMES:
+                found = True
+            elif found and tok.type == tokenize.NEWLINE:
+                header = ''.join(lines[:tok.end[0]])
+                if any(name in header for name in FULL_PARSE_IMPORTS):
+                    return None
+                return header
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return None
+
+
+def read_header(path):
+    # type: (str) -> Optional[str]
+    try:
+        with tokenize.open(path) as f:
+            return descriptor_header(f.readline)
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+
+
+def imported_pb2_modules(node):
+    # type: (Union[astroid.Import, astroid.ImportFrom]) -> Iterator[str]
+    """
+    Yields the absolute names of the _pb2 modules an import statement imports
+    """
+    if isinstance(node, astroid.Import):
+        for name, _ in node.names:
+            if name.endswith('_pb2'):
+                yield name
+        return
+    try:
+        modname = node.root().relative_to_absolute_name(node.modname, node.level)
+    except astroid.TooManyLevelsError:
+        return
+    if modname.endswith('_pb2'):
+        yield modname
+        return
+    for name, _ in node.names:
+        if name.endswith('_pb2'):
+            yield '{}.{}'.format(modname, name) if modname else name
+
+
+def prebuild_module(modname, manager=None, path=None):
+    # type: (str, Optional[AstroidManager], Optional[str]) -> Optional[astroid.Module]
+    """
+    Builds and caches the module from its header, returning None if it is
+    already known, is not Python source or has no serialized descriptor.
+    The module is looked up on the path unless its file is given.
+    """
+    manager = manager or astroid.MANAGER
+    if modname in manager.astroid_cache:
+        return None
+    if path is None:
+        try:
+            path = manager.file_from_module_name(modname, None).location
+        except astroid.AstroidBuildingError:
+            return None
+    if path is None or not path.endswith('.py'):
+        return None
+    with STATS.timed('transform', 'header'):
+        header = read_header(path)
+    if header is None:
+        return None
+    try:
+        mod = AstroidBuilder(manager).string_build(header, modname, path)
+    except astroid.AstroidBuildingError:
+        return None
+    mod._protobuf_header_only = True
+    # pylint tokenizes the file of a linted module, not just its header
+    mod.file_bytes = None
+    return mod
+
+
+def build_whole_module(mod, manager=None):
+    # type: (astroid.Module, Optional[AstroidManager]) -> None
+    """
+    Replaces the contents of a module built from its header with those of
+    the whole module, in place, so that the node that is linted and the
+    one that importers already hold are both complete
+    """
+    if not getattr(mod, '_protobuf_header_only', False):
+        return
+    manager = manager or astroid.MANAGER
+    # the header module stays cached, the whole one is transformed as usual
+    whole = AstroidBuilder(manager).file_build(mod.file, mod.name)
+    for nodes in [whole.body] + list(whole.locals.values()):
+        for node in nodes:
+            if node.parent is whole:
+                node.parent = mod
+    mod.__dict__.update(whole.__dict__)
+    del mod._protobuf_header_only
@@ -0,0 +1,100 @@
+"""
+cProfile capture limited to the plugin's own code paths
+
+Enabled by the protobuf-profile option giving a path prefix. The profiler
+only runs inside transform_module and the checker visitors, and each process
+writes <prefix>.<pid>.pstats so that -j workers do not overwrite each other.
+The combined top functions are printed to stderr when pylint exits.
+"""
+import atexit
+import os
+import sys
+from functools import wraps
+from typing import Any, Callable, List, Optional, Set, TextIO
+
+TOP_FUNCTIONS = 25
+
+
+class ScopedProfiler(object):
+    def __init__(self):
+        self.prefix = None  # type: Optional[str]
+        self.profile = None  # type: Optional[Any]
+        self.worker_files = set()  # type: Set[str]
+        self._pid = None  # type: Optional[int]
+        self._depth = 0
+
+    @property
+    def enabled(self):
+        # type: () -> bool
+        return self.profile is not None
+
+    @property
+    def path(self):
+        # type: () -> str
+        return '{}.{}.pstats'.format(self.prefix, os.getpid())
+
+    def configure(self, prefix):
+        # type: (Optional[str]) -> None
+        self.prefix = prefix or None
+        self.worker_files = set()
+        self._depth = 0
+        if self.prefix is None:
+            self.profile = None
+            atexit.unregister(self.report)
+        elif self.profile is None or self._pid != os.getpid():
+            import cProfile  # only paid for when profiling
+            # a forked -j worker inherits the parent's (empty) profile
+            self.profile = cProfile.Profile()
+            self._pid = os.getpid()
+            atexit.unregister(self.report)
+            atexit.register(self.report)  # not run by multiprocessing workers
+
+    def scoped(self, func):
+        # type: (Callable) -> Callable
+        """
+        Profile calls to func, and anything it calls, when enabled
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = self.profile
+            if profile is None:
+                return func(*args, **kwargs)
+            if self._depth == 0:
+                profile.enable()
+            self._depth += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    profile.disable()
+        return wrapper
+
+    def dump(self):
+        # type: () -> Optional[str]
+        """
+        Write the stats collected so far, returning the path if any were
+        """
+        if self.profile is None or not self.profile.getstats():
+            return None
+        self.profile.dump_stats(self.path)
+        return self.path
+
+    def files(self):
+        # type: () -> List[str]
+        own = self.dump()
+        return sorted(self.worker_files | ({own} if own else set()))
+
+    def report(self, stream=None):
+        # type: (Optional[TextIO]) -> None
+        stream = stream or sys.stderr
+        files = self.files()
+        if not files:
+            return
+        import pstats
+        stats = pstats.Stats(*files, stream=stream)
+        print('pylint-protobuf profile: {}'.format(', '.join(files)), file=stream)
+        stats.sort_stats('tottime').print_stats(TOP_FUNCTIONS)
+
+
+PROFILER = ScopedProfiler()
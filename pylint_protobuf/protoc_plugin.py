@@ -0,0 +1,66 @@
+"""
+protoc-gen-pylint-protobuf: write lint stubs at code generation time
+
+    $ protoc --python_out=gen --pylint-protobuf_out=gen foo.proto
+
+Reads a CodeGeneratorRequest from stdin and answers with a
+CodeGeneratorResponse holding a foo_pb2.pylint.json artifact for each file
+to generate (see pylint_protobuf.stubs). Both messages are read and written
+with the builtin decoder and a small encoder, so the protobuf runtime is not
+needed.
+"""
+import json
+import sys
+from typing import BinaryIO, List, Optional, Union
+
+from .descriptors import DecodeError, DescriptorPool, _text, iter_fields
+from .stubs import _encode_varint, build_stubs, stubs_name
+
+# CodeGeneratorResponse.Feature.FEATURE_PROTO3_OPTIONAL
+FEATURE_PROTO3_OPTIONAL = 1
+
+
+def _encode_field(number, value):
+    # type: (int, Union[int, str, bytes]) -> bytes
+    if isinstance(value, int):
+        return _encode_varint(number << 3) + _encode_varint(value)
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    return _encode_varint(number << 3 | 2) + _encode_varint(len(value)) + value
+
+
+def generate(request):
+    # type: (bytes) -> bytes
+    """
+    Returns the serialized CodeGeneratorResponse for a serialized
+    CodeGeneratorRequest
+    """
+    response = _encode_field(2, FEATURE_PROTO3_OPTIONAL)
+    to_generate = []  # type: List[str]
+    pool = DescriptorPool()
+    try:
+        for number, value in iter_fields(request):
+            if number == 1:
+                to_generate.append(_text(value))
+            elif number == 15:
+                pool.add_serialized_file(value)
+        for proto in to_generate:
+            content = json.dumps(build_stubs(pool.files[proto]), indent=1, sort_keys=True) + '\n'
+            generated = _encode_field(1, stubs_name(proto)) + _encode_field(15, content)
+            response += _encode_field(15, generated)
+    except (DecodeError, KeyError) as e:
+        return _encode_field(1, '{}: {}'.format(type(e).__name__, e))
+    return response
+
+
+def main(stdin=None, stdout=None):
+    # type: (Optional[BinaryIO], Optional[BinaryIO]) -> int
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    stdout.write(generate(stdin.read()))
+    stdout.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Presentation of pylint_protobuf.stats in pylint reports and JSON output
+"""
+import io
+import json
+from typing import Any
+
+from pylint.exceptions import EmptyReportError
+from pylint.reporters import JSONReporter
+from pylint.reporters.ureports.nodes import Section, Table
+
+from .stats import STATS, SECTIONS, COUNTS_TITLE, SLOW_NODES
+from .memory import MEMORY
+
+
+def report_stats(sect, stats, old_stats):
+    # type: (Section, Any, Any) -> None
+    """
+    Make a report of time spent in each protobuf check and transform phase,
+    and of the counts
+    """
+    data = STATS.as_dict()
+    if not any(data.values()):
+        raise EmptyReportError()
+    for section, title in SECTIONS.items():
+        entries = data[section]
+        if not entries:
+            continue
+        lines = ['name', 'calls', 'time (ms)']
+        for name, entry in sorted(entries.items(), key=lambda kv: -kv[1]['time']):
+            lines += [name, str(int(entry['calls'])), '%.2f' % (entry['time'] * 1000)]
+        sect.append(Section(title, children=[Table(children=lines, cols=3, rheaders=1)]))
+    if data['counts']:
+        lines = ['name', 'count']
+        for name, n in sorted(data['counts'].items()):
+            lines += [name, str(n)]
+        sect.append(Section(COUNTS_TITLE, children=[Table(children=lines, cols=2, rheaders=1)]))
+
+
+def report_slow_nodes(sect, stats, old_stats):
+    # type: (Section, Any, Any) -> None
+    """
+    Make a report of the source locations with the most inference time
+    """
+    entries = SLOW_NODES.entries()
+    if not entries:
+        raise EmptyReportError()
+    lines = ['location', 'expression', 'receiver', 'visit', 'time (ms)']
+    for entry in entries:
+        lines += [
+            entry['location'], entry['expression'], entry['kind'], entry['visit'],
+            '%.2f' % (entry['time'] * 1000),
+        ]
+    sect.append(Table(children=lines, cols=5, rheaders=1))
+
+
+def report_memory(sect, stats, old_stats):
+    # type: (Section, Any, Any) -> None
+    """
+    Make a report of the _pb2 modules retaining the most memory
+    """
+    records = MEMORY.top()
+    if not records:
+        raise EmptyReportError()
+    lines = [
+        'module', 'retained (KiB)', 'peak (KiB)', 'stub nodes', 'module nodes',
+        'reachable descriptors',
+    ]
+    for r in records:
+        peak = '-' if r['peak_bytes'] is None else '%.1f' % (r['peak_bytes'] / 1024)
+        lines += [
+            r['module'], '%.1f' % (r['retained_bytes'] / 1024), peak,
+            str(r['stub_nodes']), str(r['module_nodes']), str(r['reachable_descriptors']),
+        ]
+    total = sum(r['retained_bytes'] for r in MEMORY.records)
+    lines += [
+        'total ({} modules)'.format(len(MEMORY.records)), '%.1f' % (total / 1024),
+        '', '', '', '',
+    ]
+    sect.append(Table(children=lines, cols=6, rheaders=1))
+
+
+class ProtobufJSONReporter(JSONReporter):
+    """
+    JSON reporter that adds the checker statistics alongside the messages
+
+    Outputs {"messages": [...], "protobuf": {section: {name: {"calls", "time"}}}}
+    where messages are as printed by the "json" reporter, and the counts are
+    under "protobuf": {"counts": {name: count}}. When enabled, the
+    slowest inference sites and per-module memory use are included as lists
+    under "slow_nodes" and "memory".
+    """
+    name = 'protobuf-json'
+
+    def display_messages(self, layout):
+        out, self.out = self.out, io.StringIO()
+        try:
+            super().display_messages(layout)
+            messages = json.loads(self.out.getvalue() or '[]')
+        finally:
+            self.out = out
+        protobuf = STATS.as_dict()
+        if SLOW_NODES.enabled:
+            protobuf['slow_nodes'] = SLOW_NODES.entries()
+        if MEMORY.enabled:
+            protobuf['memory'] = MEMORY.top()
+        print(json.dumps({'messages': messages, 'protobuf': protobuf}, indent=4), file=self.out)
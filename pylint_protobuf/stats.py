@@ -0,0 +1,166 @@
+"""
+Cumulative wall time and call counts for the checker and module transform,
+and counts of events that take no time of their own
+"""
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from .events import SUBSCRIBERS, CHECK, emit
+
+SECTIONS = {
+    'check': 'Protobuf checks',
+    'inference': 'Protobuf inference',
+    'transform': 'Protobuf transform phases',
+    'module': 'Protobuf modules transformed',
+}
+COUNTS_TITLE = 'Protobuf counts'
+
+StatsDict = Dict[str, Dict[str, Dict[str, float]]]
+
+
+class Stats(object):
+    def __init__(self):
+        self._data = {}  # type: Dict[str, Dict[str, List[float]]]
+        self._counts = {}  # type: Dict[str, int]
+        # checks and inference are only timed when something reads the
+        # times; the transform is timed per module, which is cheap
+        self.time_checks = False
+        self.reset()
+
+    def reset(self):
+        # type: () -> None
+        self._data = {section: {} for section in SECTIONS}
+        self._counts = {}
+
+    def add(self, section, name, elapsed, calls=1):
+        # type: (str, str, float, int) -> None
+        entry = self._data[section].setdefault(name, [0, 0.0])
+        entry[0] += calls
+        entry[1] += elapsed
+
+    def count(self, name, n=1):
+        # type: (str, int) -> None
+        self._counts[name] = self._counts.get(name, 0) + n
+
+    @contextmanager
+    def timed(self, section, name):
+        # type: (str, str) -> Iterator[None]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(section, name, time.perf_counter() - start)
+
+    def times(self, section):
+        # type: (str) -> Dict[str, float]
+        return {name: elapsed for name, (_, elapsed) in self._data[section].items()}
+
+    def total(self, section):
+        # type: (str) -> float
+        return sum(elapsed for _, elapsed in self._data[section].values())
+
+    def counts(self):
+        # type: () -> Dict[str, int]
+        return dict(self._counts)
+
+    def as_dict(self):
+        # type: () -> StatsDict
+        """
+        The sections by name, and the counts under "counts"
+        """
+        data = {
+            section: {
+                name: {'calls': calls, 'time': elapsed}
+                for name, (calls, elapsed) in entries.items()
+            }
+            for section, entries in self._data.items()
+        }  # type: Dict[str, Any]
+        data['counts'] = self.counts()
+        return data
+
+    def merge(self, other):
+        # type: (StatsDict) -> None
+        for section, entries in other.items():
+            if section == 'counts':
+                for name, n in entries.items():
+                    self.count(name, n)
+                continue
+            for name, entry in entries.items():
+                self.add(section, name, entry['time'], entry['calls'])
+
+
+STATS = Stats()
+
+
+class SlowNodes(object):
+    """
+    Keep the limit source locations with the most inference time
+    """
+    def __init__(self, limit=0):
+        # type: (int) -> None
+        self.limit = limit
+        self._heap = []  # type: List[Tuple[float, int, Dict[str, Any]]]
+        self._tiebreak = itertools.count()
+
+    @property
+    def enabled(self):
+        # type: () -> bool
+        return self.limit > 0
+
+    def reset(self, limit=None):
+        # type: (int) -> None
+        if limit is not None:
+            self.limit = limit
+        self._heap = []
+
+    def would_keep(self, elapsed):
+        # type: (float) -> bool
+        return len(self._heap) < self.limit or elapsed > self._heap[0][0]
+
+    def add(self, entry):
+        # type: (Dict[str, Any]) -> None
+        item = (entry['time'], next(self._tiebreak), entry)
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, item)
+        elif item[0] > self._heap[0][0]:
+            heapq.heapreplace(self._heap, item)
+
+    def entries(self):
+        # type: () -> List[Dict[str, Any]]
+        return [entry for _, _, entry in sorted(self._heap, key=lambda item: -item[0])]
+
+    def merge(self, entries):
+        # type: (List[Dict[str, Any]]) -> None
+        for entry in entries:
+            self.add(entry)
+
+
+SLOW_NODES = SlowNodes()
+
+
+def timed_check(func):
+    # type: (Callable) -> Callable
+    """
+    Record calls to a checker method in the "check" section under its name
+    """
+    name = func.__name__
+    @wraps(func)
+    def wrapper(self, *args):
+        if not (STATS.time_checks or SUBSCRIBERS[CHECK]):
+            return func(self, *args)
+        start = time.perf_counter()
+        try:
+            return func(self, *args)
+        finally:
+            elapsed = time.perf_counter() - start
+            STATS.add('check', name, elapsed)
+            if SUBSCRIBERS[CHECK]:
+                # checks take the node first or after the descriptor
+                node = next((a for a in args if hasattr(a, 'lineno')), None)
+                emit(CHECK, elapsed, check=name, node=node)
+    return wrapper
+
@@ -0,0 +1,119 @@
+"""
+Lint stubs generated with the _pb2 modules.
+
+protoc-gen-pylint-protobuf writes foo_pb2.pylint.json next to each
+foo_pb2.py, holding the stubs that the transform would otherwise template
+from the module's descriptors on every run. A module whose artifact matches
+its serialized descriptor is not executed or templated; its descriptor is
+decoded and the stub sources are parsed.
+
+The stubs refer to message types from other files by the names protoc
+imports their _pb2 modules as, so they are only used for modules that still
+bind those names. They are also only used with the templates and the
+protobuf release that they were written with, as the helper members of the
+well-known types depend on the release.
+"""
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from .descriptors import _read_value, _varint
+from .transform import STUBS_SUFFIX, TEMPLATES_VERSION
+from .transform import dependency_qualifiers, module_alias, module_name, stub_sources
+from .wkt import installed_version
+
+STUBS_VERSION = 1
+
+Artifact = Dict[str, Any]
+
+# protoc gives plugins the source_code_info of a file and the json_name of
+# every field, which the descriptors embedded in _pb2 modules leave out
+_DROPPED = {('file', 9), ('field', 10)}
+# (message, field number) -> message of the field's value
+_NESTED = {
+    ('file', 4): 'message', ('file', 7): 'field',
+    ('message', 2): 'field', ('message', 3): 'message', ('message', 6): 'field',
+}
+
+
+def stubs_name(proto):
+    # type: (str) -> str
+    """
+    The path of the artifact for a .proto file, relative to the output
+    directory, as protoc names the _pb2 module
+    """
+    return module_name(proto).replace('.', '/') + STUBS_SUFFIX
+
+
+def _encode_varint(value):
+    # type: (int) -> bytes
+    out = bytearray()
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _canonical(buf, message):
+    # type: (bytes, str) -> bytes
+    out, pos = [], 0  # type: List[bytes], int
+    while pos < len(buf):
+        start = pos
+        key, pos = _varint(buf, pos)
+        value, pos = _read_value(buf, pos, key)
+        field = (message, key >> 3)
+        if field in _DROPPED:
+            continue
+        if field in _NESTED and isinstance(value, bytes):
+            value = _canonical(value, _NESTED[field])
+            out.append(_encode_varint(key) + _encode_varint(len(value)) + value)
+        else:
+            out.append(buf[start:pos])
+    return b''.join(out)
+
+
+def descriptor_digest(serialized):
+    # type: (bytes) -> str
+    """
+    Digests a FileDescriptorProto without the fields that protoc only passes
+    to plugins, so that the descriptor a plugin gets and the one embedded in
+    the _pb2 module digest the same
+    """
+    return hashlib.sha256(_canonical(bytes(serialized), 'file')).hexdigest()
+
+
+@lru_cache()
+def templates_key():
+    # type: () -> str
+    """
+    Identifies the templates and the installed protobuf release
+    """
+    return '{}:protobuf-{}'.format(TEMPLATES_VERSION, installed_version())
+
+
+def build_stubs(file_desc):
+    # type: (Any) -> Artifact
+    qualifiers = dependency_qualifiers(file_desc, module_alias)
+    return {
+        'version': STUBS_VERSION,
+        'proto': file_desc.name,
+        'sha256': descriptor_digest(file_desc.serialized_pb),
+        'templates': templates_key(),
+        'dependencies': file_desc.dependency_names,
+        'qualifiers': qualifiers,
+        'stubs': stub_sources(file_desc, qualifiers),
+    }
+
+
+def read_stubs(path):
+    # type: (str) -> Optional[Artifact]
+    try:
+        with open(path) as f:
+            artifact = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(artifact, dict) or artifact.get('version') != STUBS_VERSION:
+        return None
+    return artifact
@@ -0,0 +1,86 @@
+"""
+Opt-in trace of the cost of each transformed _pb2 module
+
+Enabled by the protobuf-trace option or the PYLINT_PROTOBUF_TRACE environment
+variable, either naming a file that one JSON object per module is appended to.
+"""
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import astroid
+
+from .events import Event, TRANSFORM_END, subscribe, unsubscribe
+
+TRACE_ENV = 'PYLINT_PROTOBUF_TRACE'
+
+
+def stub_counts(nodes):
+    # type: (List[Tuple[str, Any]]) -> Tuple[int, int, int]
+    """
+    Returns (messages, enums, astroid nodes) in the stubs installed into a module
+    """
+    messages = enums = stub_nodes = 0
+    for _, node in nodes:
+        for child in node.nodes_of_class(astroid.node_classes.NodeNG):
+            stub_nodes += 1
+            if getattr(child, '_is_protobuf_class', False):
+                if child._protobuf_descriptor.is_enum:
+                    enums += 1
+                else:
+                    messages += 1
+    return messages, enums, stub_nodes
+
+
+class TransformTrace(object):
+    def __init__(self, path=None):
+        # type: (Optional[str]) -> None
+        self.path = path
+
+    @property
+    def enabled(self):
+        # type: () -> bool
+        return bool(self.path)
+
+    def configure(self, path):
+        # type: (Optional[str]) -> None
+        self.path = path or os.environ.get(TRACE_ENV)
+        if self.enabled:
+            subscribe(TRANSFORM_END, self.on_transform_end)
+        else:
+            unsubscribe(TRANSFORM_END, self.on_transform_end)
+
+    def write(self, record):
+        # type: (Dict[str, Any]) -> None
+        # Appending whole lines keeps records from -j worker processes intact
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+
+    def on_transform_end(self, event):
+        # type: (Event) -> None
+        data = event.data
+        stubs = data['stubs']
+        messages, enums, stub_nodes = stub_counts(stubs)
+        stub_bytes = sum(
+            len(node.as_string()) for _, node in stubs if isinstance(node, astroid.ClassDef))
+        phases = data['phases']
+        self.write({
+            'module': data['module'],
+            'file': data['file'],
+            'messages': messages,
+            'enums': enums,
+            'stub_bytes': stub_bytes,
+            'stub_nodes': stub_nodes,
+            'exec_time': phases.get('exec', 0.0),
+            'decode_time': phases.get('decode', 0.0),
+            'worker_time': phases.get('worker', 0.0),
+            'template_time': phases.get('template', 0.0),
+            'parse_time': phases.get('parse', 0.0),
+            'total_time': event.duration,
+            'cache_hit': data['cache_hit'],
+            'exec_error': data['exec_error'],
+        })
+
+
+TRACE = TransformTrace()
+TRACE.configure(None)  # from the environment until the checker is opened
@@ -1,44 +1,143 @@
 from keyword import iskeyword
 from functools import lru_cache
-from typing import Any, List, Tuple, Set, Dict, Union, MutableMapping, Iterator
+from typing import Any, Callable, List, Tuple, Set, Dict, Union, MutableMapping, Iterator, Optional
+import os
+import re
 import textwrap
+import time
 
 import astroid
+from astroid.builder import AstroidBuilder
+
+from . import descriptors
+from .descriptors import FieldDescriptor
+from .events import (
+    SUBSCRIBERS, emit, TRANSFORM_START, TRANSFORM_END, EXEC_FAILURE, CACHE_HIT, CACHE_MISS,
+)
+from .prebuild import imported_pb2_modules, prebuild_module
+from .profiling import PROFILER
+from .stats import STATS
+from .wkt import wkt_members
+
+# google.protobuf is only imported by _load_protobuf, on the first _pb2 module,
+# and not at all with builtin descriptors
+Descriptor = descriptors.Descriptor  # type: Any
+EnumDescriptor = descriptors.EnumDescriptor  # type: Any
+ScalarMap = MessageMap = None  # type: Any
+BUILTIN_DESCRIPTORS = False
+PRUNE_MODULES = False
+FOLD_DUPLICATES = False
+_protobuf_available = None  # type: Optional[bool]
+_POOL = descriptors.DescriptorPool()
+# pylint_protobuf.locations.LocationIndex, imported only when configured
+_LOCATIONS = None  # type: Any
+# pylint_protobuf.workers.WorkerPool, imported only when configured
+_WORKERS = None  # type: Any
+# stubs installed for each serialized descriptor, by digest, when folding
+_FOLDED = {}  # type: Dict[bytes, List[Tuple[str, Any]]]
+# written next to foo_pb2.py as foo_pb2.pylint.json by protoc-gen-pylint-protobuf
+STUBS_SUFFIX = '.pylint.json'
+# bump whenever the stubs templated from a descriptor change, including with
+# the wkt_members table, so that artifacts written before are not used
+TEMPLATES_VERSION = 1
+
+# Public members of google.protobuf.internal.containers.ScalarMap and
+# MessageMap, for when the runtime is not imported
+SCALAR_MAP_MEMBERS = (
+    'GetEntryClass', 'InvalidateIterators', 'MergeFrom', 'clear', 'get', 'items',
+    'keys', 'pop', 'popitem', 'setdefault', 'update', 'values',
+)
+MESSAGE_MAP_MEMBERS = SCALAR_MAP_MEMBERS + ('get_or_create',)
+
+
+def use_builtin_descriptors(enabled):
+    # type: (bool) -> None
+    """
+    Decode the descriptors serialized in _pb2 modules instead of executing
+    the modules with google.protobuf
+    """
+    global BUILTIN_DESCRIPTORS
+    BUILTIN_DESCRIPTORS = enabled
+
+
+def use_pruned_modules(enabled):
+    # type: (bool) -> None
+    """
+    Drop the generated descriptor code from _pb2 modules once their stubs
+    are installed
+    """
+    global PRUNE_MODULES
+    PRUNE_MODULES = enabled
+
+
+def use_folded_duplicates(enabled):
+    # type: (bool) -> None
+    """
+    Share the stubs of the first _pb2 module with a serialized descriptor
+    with every later module that has an identical one
+    """
+    global FOLD_DUPLICATES
+    # with -j, this is called for every file, and modules transformed for
+    # earlier files stay in the astroid cache
+    if enabled != FOLD_DUPLICATES:
+        _FOLDED.clear()
+    FOLD_DUPLICATES = enabled
+
+
+def use_location_index(index):
+    # type: (Any) -> None
+    """
+    Look up imported _pb2 modules and the modules of .proto dependencies in
+    a pylint_protobuf.locations.LocationIndex, or on the path if None
+    """
+    global _LOCATIONS
+    _LOCATIONS = index
+
+
+def use_worker_pool(pool):
+    # type: (Any) -> None
+    """
+    Decode the descriptors that a pylint_protobuf.workers.WorkerPool sends
+    back from importing _pb2 modules, or stop using one if None
+    """
+    global _WORKERS
+    _WORKERS = pool
+
+
+def _load_protobuf():
+    # type: () -> bool
+    """
+    Import the protobuf runtime once, returning False if it is not installed
+    """
+    global Descriptor, EnumDescriptor, ScalarMap, MessageMap, _protobuf_available
+    if _protobuf_available is not None:
+        return _protobuf_available
+    try:
+        from google.protobuf.descriptor import Descriptor, EnumDescriptor
+        from google.protobuf.internal.containers import ScalarMap, MessageMap
+    except ImportError:
+        import sys
+        import warnings
+        try:
+            from google.protobuf import __version__ as _protobuf_version
+        except ImportError:
+            _protobuf_version = None
+        if (_protobuf_version is not None and _protobuf_version <= '3.15.0'
+                and sys.version_info >= (3, 9)):
+            warnings.warn(
+                "google.protobuf (earlier than 3.15.x) does not support Python 3.9"
+                " (see https://github.com/protocolbuffers/protobuf/issues/7978)"
+            )
+        _protobuf_available = False
+        return False
+
+    _protobuf_available = True
+    return True
 
-try:
-    from google.protobuf.descriptor import (
-        Descriptor,
-        EnumDescriptor,
-        FieldDescriptor,
-    )
-except ImportError:  # pragma: nocover
-    import sys
-    import warnings
-    from google.protobuf import __version__ as _protobuf_version
-    if _protobuf_version <= '3.15.0' and sys.version_info >= (3, 9):
-        warnings.warn(
-            "google.protobuf (earlier than 3.15.x) does not support Python 3.9"
-            " (see https://github.com/protocolbuffers/protobuf/issues/7978)"
-        )
-    class Descriptor:
-        pass
-    class EnumDescriptor:
-        pass
-    class FieldDescriptor:
-        pass
-
-try:
-    from google.protobuf.internal.containers import ScalarMap, MessageMap
-except ImportError:  # pragma: nocover
-    class MessageMap:
-        pass
-    class ScalarMap:
-        pass
-
-try:
-    from google.protobuf.internal.well_known_types import WKTBASES
-except ImportError:
-    WKTBASES = {}
+
+def _use_builtin_descriptors():
+    # type: () -> bool
+    return BUILTIN_DESCRIPTORS or _WORKERS is not None or not _load_protobuf()
 
 
 PROTOBUF_IMPLICIT_ATTRS = [
@@ -135,22 +234,25 @@ def full_name(fd):
     return '.'.join(field_type_path(fd))
 
 
-def _nonprotected_members(cls):
-    # type: (type) -> Set[str]
-    return set(m for m in dir(cls) if not m.startswith('_'))
+def _same_descriptor(a, b):
+    # type: (Any, Any) -> bool
+    # modules loaded from stub artifacts have builtin descriptors, which
+    # may be compared with runtime ones from executed modules
+    return a is b or (a is not None and b is not None and a.full_name == b.full_name)
 
 
 class SimpleDescriptor(object):
     def __init__(self, desc):
         # type: (Union[EnumDescriptor, Descriptor]) -> None
-        if isinstance(desc, EnumDescriptor):  # do something about this variance
+        # do something about this variance
+        if isinstance(desc, (EnumDescriptor, descriptors.EnumDescriptor)):
             self._is_protobuf_enum = True
             self._enum_desc = desc
         else:
             self._is_protobuf_enum = False
             self._desc = desc  # type: Descriptor
         self._cls_hash = str(id(self))  # err...
-        self.bases = []
+        self.base_members = set()  # type: Set[str]
 
     def is_nested(self, fd):
         # type: (FieldDescriptor) -> bool
@@ -158,11 +260,11 @@ class SimpleDescriptor(object):
 
     def is_typeof_field(self, fd):
         # type: (FieldDescriptor) -> bool
-        return fd.message_type is self._desc
+        return _same_descriptor(fd.message_type, self._desc)
 
     def is_extended_by(self, fd):
         # type: (FieldDescriptor) -> bool
-        return fd.is_extension and fd.containing_type is self._desc
+        return fd.is_extension and _same_descriptor(fd.containing_type, self._desc)
 
     @property
     def proto3(self):
@@ -194,6 +296,13 @@ class SimpleDescriptor(object):
         else:
             return self._desc.full_name
 
+    @property
+    def file(self):
+        if self._is_protobuf_enum:
+            return self._enum_desc.file
+        else:
+            return self._desc.file
+
     @property
     def options(self):
         if self._desc.has_options:
@@ -222,9 +331,7 @@ class SimpleDescriptor(object):
         if self._is_protobuf_enum:
             return set(self._enum_desc.values_by_name) | set(PROTOBUF_ENUM_IMPLICIT_ATTRS)
         else:
-            base_fields = set(PROTOBUF_IMPLICIT_ATTRS)  # TODO: move this into bases
-            for base_cls in self.bases:
-                base_fields |= _nonprotected_members(base_cls)
+            base_fields = set(PROTOBUF_IMPLICIT_ATTRS) | self.base_members
             desc = self._desc  # type: Descriptor
             return set(desc.fields_by_name) | \
                    set(desc.enum_values_by_name) | \
@@ -313,7 +420,7 @@ def _template_enum(desc, descriptor_registry):
     ).format(
         name=desc.name,
         docstring="descriptor={}".format(desc.identifier),
-        slots=repr(tuple(desc.field_names)),
+        slots=repr(tuple(sorted(desc.field_names))),
         body=textwrap.indent(body, '    '),
     )
 
@@ -338,20 +445,24 @@ def transform_enum(desc, descriptor_registry):
 
     # NOTE: Only called on top-level enum definitions, so we don't need to
     # recurse like with transform_message
-    cls_def = astroid.extract_node(_template_enum(desc, descriptor_registry))  # type: astroid.ClassDef
+    with STATS.timed('transform', 'template'):
+        cls_str = _template_enum(desc, descriptor_registry)
+    with STATS.timed('transform', 'parse'):
+        cls_def = astroid.extract_node(cls_str)  # type: astroid.ClassDef
 
     simple_desc = descriptor_registry[_get_descriptor_id(cls_def)]  # FIXME: guard?
     cls_def._is_protobuf_class = True
     cls_def._protobuf_descriptor = simple_desc
 
     names = []  # type: List[Tuple[str, astroid.Assign]]
-    for type_wrapper in desc.values:
-        name, number = type_wrapper.name, type_wrapper.number
-        names.append((name, astroid.extract_node('{} = {}'.format(name, number))))
+    with STATS.timed('transform', 'parse'):
+        for type_wrapper in desc.values:
+            name, number = type_wrapper.name, type_wrapper.number
+            names.append((name, astroid.extract_node('{} = {}'.format(name, number))))
     return [(cls_def.name, cls_def)] + names
 
 
-def _template_composite_field(parent_name, name, field_type, is_nested=False):
+def _template_composite_field(parent_name, name, field_type, is_nested=False, type_path=None):
     # TODO: add some marker for it being a producer of repeated fields?
     # it's tricky to work with inferred results
     # as it stands the result of the call (or explicitly infer_call_result on the BoundMethod)
@@ -367,38 +478,54 @@ def _template_composite_field(parent_name, name, field_type, is_nested=False):
 
     # looks like <Entry>CompositeContainer should be defined outside of __init__ if the type
     # is not nested
-    qualifier = parent_name+'.' if is_nested else ''
+    if type_path is None:
+        type_path = (parent_name + '.' if is_nested else '') + field_type
     return textwrap.dedent("""
     class {field_type}CompositeContainer(list):
         def add(self, **kwargs):
-            return {qualifier}{field_type}()
+            return {type_path}()
     self.{name} = {field_type}CompositeContainer()  # repeated composite_fields
-    """.format(name=name, field_type=field_type, qualifier=qualifier))
+    """.format(name=name, field_type=field_type, type_path=type_path))
 
 
-def _to_module_name(fn):
+def module_name(proto):
     # type: (str) -> str
     """
-    Try to guess imported name from file descriptor path
+    The name of the _pb2 module that protoc generates for a .proto file
     """
-    fn = fn.replace('/', '_dot_')
-    fn = fn[:-len('.proto')]  # strip suffix
-    fn += '__pb2'  # XXX: might only be one underscore?
-    return fn
+    return proto[:-len('.proto')].replace('-', '_').replace('/', '.') + '_pb2'
 
 
-def _template_message(desc, descriptor_registry):
-    # type: (Descriptor, DescriptorRegistry) -> str
+def module_alias(proto):
+    # type: (str) -> str
+    """
+    The name that protoc imports the _pb2 module of a .proto file as
+    """
+    return module_name(proto).replace('_', '__').replace('.', '_dot_')
+
+
+# Names of the _pb2 modules of .proto files, by .proto file name
+Qualifiers = Dict[str, str]
+
+
+def _qualifier(proto, qualifiers):
+    # type: (str, Optional[Qualifiers]) -> str
+    if qualifiers and proto in qualifiers:
+        return qualifiers[proto]
+    return module_alias(proto)
+
+
+def _template_message(desc, descriptor_registry, qualifiers=None):
+    # type: (Descriptor, DescriptorRegistry, Optional[Qualifiers]) -> str
     """
     Returns cls_def string, list of fields, list of repeated fields
     """
     this_file = desc.file
     desc = SimpleDescriptor(desc)
-    if desc.full_name in WKTBASES:
-        desc.bases.append(WKTBASES[desc.full_name])
+    desc.base_members.update(wkt_members(desc.full_name))
     descriptor_registry[desc.identifier] = desc
 
-    slots = desc.field_names
+    slots = sorted(desc.field_names)  # the same stubs in every process
 
     # TODO: refactor field partitioning and iskeyword checks
     # NOTE: the "pass" statement is a hack to provide a body when args is empty
@@ -422,12 +549,15 @@ def _template_message(desc, descriptor_registry):
         if is_repeated(fd) and is_composite(fd) and not is_map_field(fd)
     }
     repeated_composite_fields = [
-        (fd.name, fd.message_type.name, desc.is_nested(fd))
+        (fd.name, fd.message_type.name, desc.is_nested(fd), fd.message_type)
         for fd in rcfields
     ]
     initialisers += [
-        _template_composite_field(desc.name, field_name, field_type, is_nested)
-        for field_name, field_type, is_nested in repeated_composite_fields
+        _template_composite_field(desc.name, field_name, field_type, is_nested, type_path=(
+            None if msg_type.file is this_file
+            else '{}.{}'.format(_qualifier(msg_type.file.name, qualifiers), full_name(msg_type))
+        ))
+        for field_name, field_type, is_nested, msg_type in repeated_composite_fields
         if not iskeyword(field_name)
     ]
 
@@ -448,7 +578,7 @@ def _template_message(desc, descriptor_registry):
         if not iskeyword(field_name)
     ]
     externals = [
-        (f, f.name, _to_module_name(msg_type.file.name), full_name(msg_type))  # TODO: look up name instead of heuristic?
+        (f, f.name, _qualifier(msg_type.file.name, qualifiers), full_name(msg_type))
         for f, msg_type in external_fields
         if msg_type.file is not this_file
     ]
@@ -477,20 +607,21 @@ def _template_message(desc, descriptor_registry):
         # for map <key, value> fields
         # This mirrors the _IsMessageMapField check
         value_type = desc.fields_by_name['value']
-        if value_type.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
-            base_class = MessageMap
-        else:
-            base_class = ScalarMap
         # Rather than (key, value), use the attributes of the correct
         # MutableMapping type as the "slots"
-        slots = tuple(m for m in dir(base_class) if not m.startswith("_"))
+        if value_type.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+            base_class, slots = MessageMap, MESSAGE_MAP_MEMBERS
+        else:
+            base_class, slots = ScalarMap, SCALAR_MAP_MEMBERS
+        if base_class is not None:
+            slots = tuple(m for m in dir(base_class) if not m.startswith("_"))
         helpers = 'def __getitem__(self, idx):\n    pass\n'
         helpers += 'def __delitem__(self, idx):\n    pass\n'
 
     body = ''.join([
         _template_enum(d, descriptor_registry) for d in desc.enum_types
     ] + [
-        _template_message(d, descriptor_registry) for d in desc.nested_types
+        _template_message(d, descriptor_registry, qualifiers) for d in desc.nested_types
     ])
 
     cls_str = (
@@ -511,9 +642,10 @@ def _template_message(desc, descriptor_registry):
     return cls_str
 
 
-def transform_message(desc, desc_registry):
-    # type: (Any, DescriptorRegistry) -> List[Tuple[str, astroid.ClassDef]]
-    cls_str = _template_message(desc, desc_registry)
+def transform_message(desc, desc_registry, qualifiers=None):
+    # type: (Any, DescriptorRegistry, Optional[Qualifiers]) -> List[Tuple[str, astroid.ClassDef]]
+    with STATS.timed('transform', 'template'):
+        cls_str = _template_message(desc, desc_registry, qualifiers)
 
     def visit_classdef(cls_def):
         # type: (astroid.ClassDef) -> astroid.ClassDef
@@ -528,79 +660,629 @@ def transform_message(desc, desc_registry):
 
     # Now we can do stuff bottom-up instead of top-down...
     astroid.MANAGER.register_transform(astroid.ClassDef, visit_classdef)
-    cls = astroid.extract_node(cls_str)  # type: astroid.ClassDef
+    with STATS.timed('transform', 'parse'):
+        cls = astroid.extract_node(cls_str)  # type: astroid.ClassDef
     astroid.MANAGER.unregister_transform(astroid.ClassDef, visit_classdef)
 
     return [(cls.name, cls)]
 
 
-def transform_descriptor_to_class(cls):
-    # type: (Any) -> List[Tuple[str, Union[astroid.ClassDef, astroid.Name]]]
+def transform_descriptor_to_class(cls, qualifiers=None):
+    # type: (Any, Optional[Qualifiers]) -> List[Tuple[str, Union[astroid.ClassDef, astroid.Name]]]
     try:
         desc = cls.DESCRIPTOR
     except AttributeError:
         raise NotImplementedError()
+    return transform_descriptor(desc, qualifiers)
+
+
+def transform_descriptor(desc, qualifiers=None):
+    # type: (Any, Optional[Qualifiers]) -> List[Tuple[str, Union[astroid.ClassDef, astroid.Name]]]
     desc_registry = {}  # type: DescriptorRegistry
-    if isinstance(desc, EnumDescriptor):
+    if isinstance(desc, (EnumDescriptor, descriptors.EnumDescriptor)):
         return transform_enum(desc, desc_registry)
-    elif isinstance(desc, Descriptor):
-        return transform_message(desc, desc_registry)
+    elif isinstance(desc, (Descriptor, descriptors.Descriptor)):
+        return transform_message(desc, desc_registry, qualifiers)
     else:
         raise NotImplementedError()
 
 
 @lru_cache()
 def _exec_module(mod):
-    # type: (astroid.Module) -> dict
-    l = {}
+    # type: (astroid.Module) -> Tuple[dict, Optional[str]]
+    ns = _module_globals(mod)
+    start = time.perf_counter()
     try:
-        exec(mod.as_string(), {}, l)
-    except Exception:
-        # Could raise SyntaxError, KeyError, ImportError etc. Would like to
-        # move away from this approach. Had some troubles previously with
-        # relative imports in a non-package context (see
-        # https://github.com/nelfin/pylint_protobuf/issues/51).
-        pass
-    return l
+        exec(_module_code(mod), ns)
+    except Exception as e:
+        # Could raise SyntaxError, KeyError, ImportError etc.
+        error = '{}: {}'.format(type(e).__name__, e)
+        if SUBSCRIBERS[EXEC_FAILURE]:
+            emit(EXEC_FAILURE, time.perf_counter() - start,
+                 module=mod.name, file=mod.file, error=error, exception=e)
+        return ns, error
+    finally:
+        STATS.add('transform', 'exec', time.perf_counter() - start)
+    return ns, None
+
+
+def _module_globals(mod):
+    # type: (astroid.Module) -> Dict[str, Any]
+    """
+    The globals the module would be imported with, so that relative imports
+    resolve against its package (see
+    https://github.com/nelfin/pylint_protobuf/issues/51)
+    """
+    package = mod.name if mod.package else mod.name.rpartition('.')[0]
+    ns = {'__name__': mod.name, '__package__': package}  # type: Dict[str, Any]
+    if _source_path(mod) is not None:
+        ns['__file__'] = mod.file
+    return ns
+
+
+def _source_path(mod):
+    # type: (astroid.Module) -> Optional[str]
+    path = mod.file
+    if path and path.endswith('.py') and os.path.isfile(path):
+        return path
+    return None
+
+
+def _module_code(mod):
+    # type: (astroid.Module) -> Any
+    """
+    Compiles the module from the bytes of its file, or from the astroid tree
+    for modules built from a string
+    """
+    path = _source_path(mod)
+    if path is None:
+        return compile(mod.as_string(), mod.name or '<string>', 'exec', dont_inherit=True)
+    st = os.stat(path)
+    return _compile_file(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache()
+def _compile_file(path, mtime_ns, size):
+    # type: (str, int, int) -> Any
+    """
+    Compiles a file once for as long as its stat is unchanged, however many
+    modules are built from it
+    """
+    with open(path, 'rb') as f:
+        return compile(f.read(), path, 'exec', dont_inherit=True)
+
+
+def serialized_descriptor(mod):
+    # type: (astroid.Module) -> Optional[bytes]
+    """
+    Returns the FileDescriptorProto bytes that the module passes to
+    AddSerializedFile, or to FileDescriptor as serialized_pb
+    """
+    const = _serialized_const(mod)
+    if const is None:
+        return None
+    if isinstance(const.value, str):
+        return const.value.encode('latin1')
+    return const.value
+
+
+def _serialized_const(mod):
+    # type: (astroid.Module) -> Optional[astroid.Const]
+    for stmt in mod.body:
+        call = getattr(stmt, 'value', None)
+        if not isinstance(call, astroid.Call):
+            continue
+        if (isinstance(call.func, astroid.Attribute)
+                and call.func.attrname == 'AddSerializedFile' and call.args):
+            arg = call.args[0]
+        else:
+            arg = next((kw.value for kw in call.keywords or () if kw.arg == 'serialized_pb'), None)
+        if isinstance(arg, astroid.Call) and arg.args:  # _b('...') from older protoc
+            arg = arg.args[0]
+        if isinstance(arg, astroid.Const) and isinstance(arg.value, (bytes, str)):
+            return arg
+    return None
+
+
+@lru_cache()
+def _decode_module(mod):
+    # type: (astroid.Module) -> Tuple[dict, Optional[str]]
+    """
+    Like _exec_module, but the namespace only maps DESCRIPTOR and the names
+    of top-level messages and enums to descriptors decoded from the module
+    """
+    start = time.perf_counter()
+    try:
+        serialized = serialized_descriptor(mod)
+        if serialized is None:
+            raise descriptors.DecodeError('no serialized FileDescriptorProto found')
+        file_desc = _POOL.add_serialized_file(serialized)
+    except descriptors.DecodeError as e:
+        error = '{}: {}'.format(type(e).__name__, e)
+        if SUBSCRIBERS[EXEC_FAILURE]:
+            emit(EXEC_FAILURE, time.perf_counter() - start,
+                 module=mod.name, file=mod.file, error=error, exception=e)
+        return {}, error
+    finally:
+        STATS.add('transform', 'decode', time.perf_counter() - start)
+    _decode_dependencies(mod, file_desc)
+    return _file_namespace(file_desc), None
+
+
+def _file_namespace(file_desc):
+    # type: (descriptors.FileDescriptor) -> Dict[str, Any]
+    ns = {'DESCRIPTOR': file_desc}  # type: Dict[str, Any]
+    ns.update(file_desc.message_types_by_name)
+    ns.update(file_desc.enum_types_by_name)
+    return ns
+
+
+@lru_cache()
+def _worker_module(mod):
+    # type: (astroid.Module) -> Tuple[dict, Optional[str]]
+    """
+    Like _decode_module, with the descriptors sent back by a helper process
+    that imported the module. Modules that the helper cannot import, such as
+    ones not on its path, are decoded instead.
+    """
+    start = time.perf_counter()
+    try:
+        proto, error = _WORKERS.load(mod.name)
+        for name, serialized in _WORKERS.take_files().items():
+            try:
+                _POOL.add_serialized_file(serialized)
+            except descriptors.DecodeError as e:
+                if name == proto:
+                    proto, error = None, '{}: {}'.format(type(e).__name__, e)
+    finally:
+        STATS.add('transform', 'worker', time.perf_counter() - start)
+    if proto is None or proto not in _POOL.files:
+        if SUBSCRIBERS[EXEC_FAILURE]:
+            emit(EXEC_FAILURE, time.perf_counter() - start,
+                 module=mod.name, file=mod.file, error=error, exception=None)
+        return _decode_module(mod)
+    return _file_namespace(_POOL.files[proto]), None
+
+
+def _decode_dependencies(mod, file_desc):
+    # type: (astroid.Module, descriptors.FileDescriptor) -> None
+    """
+    Add imported .proto files to the pool from their _pb2 modules, where
+    they can be found, so that field types in them resolve
+    """
+    for dependency in file_desc.dependency_names:
+        if dependency in _POOL.files or not dependency.endswith('.proto'):
+            continue
+        modname = _dependency_module(dependency)
+        if not load_indexed_module(modname):
+            prebuild_module(modname)
+        try:
+            dependency_mod = mod.import_module(modname)
+        except astroid.AstroidBuildingError:
+            continue
+        _decode_module(dependency_mod)
+
+
+def _dependency_module(proto):
+    # type: (str) -> str
+    if _LOCATIONS is not None:
+        modname = _LOCATIONS.proto_module(proto)
+        if modname is not None:
+            return modname
+    return module_name(proto)
+
+
+def load_indexed_module(modname):
+    # type: (str) -> bool
+    """
+    Builds and caches a module found in the location index, so that
+    importing it does not search the path. Returns False if it is not indexed.
+    """
+    path = _LOCATIONS.module_path(modname) if _LOCATIONS is not None else None
+    if path is None:
+        return False
+    manager = astroid.MANAGER
+    if modname in manager.astroid_cache:
+        return True
+    if _use_builtin_descriptors() and prebuild_module(modname, path=path) is not None:
+        return True
+    try:
+        manager.ast_from_file(path, modname, source=True)
+    except astroid.AstroidBuildingError:
+        return False
+    return True
+
+
+def _module_loader():
+    # type: () -> Any
+    if _WORKERS is not None:
+        return _worker_module
+    return _decode_module if _use_builtin_descriptors() else _exec_module
+
+
+def load_module(mod):
+    # type: (astroid.Module) -> Tuple[dict, Optional[str]]
+    """
+    Returns the namespace of the module and any error loading it, from
+    executing it or from its decoded descriptors
+    """
+    return _module_loader()(mod)
 
 
 def mod_node_to_class(mod, name):
     # type: (astroid.Module, str) -> Any
-    ns = _exec_module(mod)
+    ns, _ = _exec_module(mod)
     return ns[name]
 
 
 def resolve_imports(mod):
-    # type: (astroid.Module) -> List[str]
+    # type: (astroid.Module) -> Dict[str, str]
     """
-    UNUSED: proposed to look up imported names rather than guess (see external fields clauses)
+    Maps the absolute names of the _pb2 modules that mod imports at module
+    level to the names they are bound to
     """
-    import_names = []
-    for node in mod.nodes_of_class((astroid.Import, astroid.ImportFrom)):
-        for original, alias in node.names:
-            name = alias or original
-            if name.endswith('_pb2'):
-                import_names.append(name)
-    return import_names
+    bound = {}  # type: Dict[str, str]
+    for node in mod.body:
+        if isinstance(node, astroid.Import):
+            for name, alias in node.names:
+                if name.endswith('_pb2'):
+                    bound.setdefault(name, alias or name)
+        elif isinstance(node, astroid.ImportFrom):
+            try:
+                base = mod.relative_to_absolute_name(node.modname, node.level)
+            except astroid.TooManyLevelsError:
+                continue
+            for name, alias in node.names:
+                if name.endswith('_pb2'):
+                    bound.setdefault('{}.{}'.format(base, name) if base else name, alias or name)
+    return bound
+
+
+def external_qualifiers(mod, file_desc):
+    # type: (astroid.Module, Any) -> Qualifiers
+    """
+    Maps the .proto files that a module depends on, and the files they
+    publicly import, to the names the module imports their _pb2 modules as
+    """
+    bound = resolve_imports(mod)
+    aliases = set(bound.values())
+
+    def qualifier(proto):
+        # type: (str) -> Optional[str]
+        alias = module_alias(proto)  # as generated by protoc
+        return alias if alias in aliases else bound.get(_dependency_module(proto))
+    return dependency_qualifiers(file_desc, qualifier)
 
 
+def dependency_qualifiers(file_desc, qualifier):
+    # type: (Any, Callable[[str], Optional[str]]) -> Qualifiers
+    """
+    Maps each dependency of a file that qualifier names, and the files it
+    publicly imports, to that name
+    """
+    qualifiers = {}  # type: Qualifiers
+    for dependency in file_desc.dependencies:
+        name = qualifier(dependency.name)
+        if name is None:
+            continue
+        qualifiers.setdefault(dependency.name, name)
+        public = list(dependency.public_dependencies)
+        while public:
+            public_file = public.pop()
+            if public_file.name not in qualifiers:
+                qualifiers[public_file.name] = name
+                public.extend(public_file.public_dependencies)
+    return qualifiers
+
+
+@PROFILER.scoped
 def transform_module(mod):
     # type: (astroid.Module) -> astroid.Module
-    for name in mod.wildcard_import_names():
+    if SUBSCRIBERS[TRANSFORM_START]:
+        emit(TRANSFORM_START, module=mod.name, file=mod.file, node=mod)
+    if not (SUBSCRIBERS[TRANSFORM_END] or SUBSCRIBERS[CACHE_HIT] or SUBSCRIBERS[CACHE_MISS]):
+        with STATS.timed('module', mod.name):
+            _transform_module(mod)
+        return mod
+    phase_times = STATS.times('transform')
+    loader = _module_loader()
+    misses = loader.cache_info().misses
+    start = time.perf_counter()
+    with STATS.timed('module', mod.name):
+        stubs, exec_error = _transform_module(mod)
+    duration = time.perf_counter() - start
+    cache_hit = loader.cache_info().misses == misses
+    phases = {
+        phase: elapsed - phase_times.get(phase, 0.0)
+        for phase, elapsed in STATS.times('transform').items()
+    }
+    if phases.get('fold'):
+        cache = 'fold'
+    elif phases.get('stubs'):
+        cache = 'stubs'
+    else:
+        cache = {_decode_module: 'decode', _worker_module: 'worker'}.get(loader, 'exec')
+    emit(CACHE_HIT if cache_hit else CACHE_MISS, module=mod.name, cache=cache)
+    emit(TRANSFORM_END, duration, module=mod.name, file=mod.file, node=mod, stubs=stubs,
+         phases=phases, cache_hit=cache_hit, exec_error=exec_error)
+    return mod
+
+
+def _module_extensions(file_desc):
+    # type: (descriptors.FileDescriptor) -> List[Tuple[str, astroid.Assign]]
+    """
+    The module-level extensions and their field numbers, which builder-style
+    and header-only modules do not assign
+    """
+    with STATS.timed('transform', 'parse'):
+        return [
+            (name, astroid.extract_node(source))
+            for name, source in _extension_sources(file_desc)
+        ]
+
+
+def _extension_sources(file_desc):
+    # type: (Any) -> List[Tuple[str, str]]
+    names = []  # type: List[Tuple[str, str]]
+    for name, ext in sorted(file_desc.extensions_by_name.items()):
+        number_name = '{}_FIELD_NUMBER'.format(name.upper())
+        names.append((name, '{0} = DESCRIPTOR.extensions_by_name[{0!r}]'.format(name)))
+        names.append((number_name, '{} = {}'.format(number_name, ext.number)))
+    return names
+
+
+def stub_sources(file_desc, qualifiers=None):
+    # type: (Any, Optional[Qualifiers]) -> List[Tuple[str, str]]
+    """
+    The source of the stubs for a file's module-level names, as
+    (name, source) pairs, with descriptors identified by full name rather
+    than by the SimpleDescriptor registered while templating
+    """
+    sources = []  # type: List[Tuple[str, str]]
+    for desc in file_desc.message_types_by_name.values():
+        registry = {}  # type: DescriptorRegistry
+        source = _template_message(desc, registry, qualifiers)
+        sources.append((desc.name, _stable_ids(source, registry)))
+    for enum in file_desc.enum_types_by_name.values():
+        registry = {}
+        source = _template_enum(enum, registry)
+        sources.append((enum.name, _stable_ids(source, registry)))
+        sources += [
+            (value.name, '{} = {}'.format(value.name, value.number)) for value in enum.values
+        ]
+    return sources + _extension_sources(file_desc)
+
+
+def _stable_ids(source, registry):
+    # type: (str, DescriptorRegistry) -> str
+    for identifier, desc in registry.items():
+        source = source.replace(
+            repr('descriptor=' + identifier), repr('descriptor=' + desc.full_name))
+    return source
+
+
+def load_stub_artifact(mod):
+    # type: (astroid.Module) -> Optional[List[Tuple[str, Any]]]
+    """
+    Installs the stubs that protoc-gen-pylint-protobuf wrote next to the
+    module, returning None if there are none or they were generated from
+    another descriptor or for other imports
+    """
+    path = _source_path(mod)
+    if path is None or not os.path.isfile(path[:-len('.py')] + STUBS_SUFFIX):
+        return None
+    from .stubs import read_stubs, descriptor_digest, templates_key
+    # only counted when the stubs are used, which the "stubs" cache event reports
+    start = time.perf_counter()
+    artifact = read_stubs(path[:-len('.py')] + STUBS_SUFFIX)
+    serialized = serialized_descriptor(mod)
+    if artifact is None or serialized is None or artifact.get('templates') != templates_key():
+        return None
+    if artifact['sha256'] != descriptor_digest(serialized):
+        return None
+    if not set(artifact['qualifiers'].values()) <= set(resolve_imports(mod).values()):
+        return None
+    try:
+        _POOL.add_serialized_file(serialized)
+    except descriptors.DecodeError:
+        return None
+    checked = time.perf_counter() - start
+    # module-level values that the module assigns itself are kept
+    stubs = [(name, source) for name, source in artifact['stubs']
+             if source.startswith('class ') or name not in mod.locals]
+    with STATS.timed('transform', 'parse'):
+        # one tree for all of the stubs, and none of the transforms of
+        # astroid's brain modules, which plain classes do not need
+        tree = AstroidBuilder(astroid.MANAGER, apply_transforms=False).string_build(
+            '\n'.join(source for _, source in stubs), mod.name)
+    if len(tree.body) != len(stubs):
+        return None
+    STATS.add('transform', 'stubs', checked)
+    for cls_def in tree.nodes_of_class(astroid.ClassDef):
+        _link_stub_descriptor(cls_def)
+    installed = [(local_name, node) for (local_name, _), node in zip(stubs, tree.body)]
+    for local_name, node in installed:
+        node.parent = mod
+        mod.locals[local_name] = [node]
+    return installed
+
+
+def _link_stub_descriptor(cls_def):
+    # type: (astroid.ClassDef) -> None
+    full_name = _get_descriptor_id(cls_def)
+    desc = _POOL.find_symbol(full_name) if full_name else None
+    if desc is not None:
+        simple_desc = SimpleDescriptor(desc)
+        if not simple_desc.is_enum:
+            simple_desc.base_members.update(wkt_members(full_name))
+        cls_def._is_protobuf_class = True
+        cls_def._protobuf_descriptor = simple_desc
+
+
+def _fold_key(mod):
+    # type: (astroid.Module) -> Optional[bytes]
+    serialized = serialized_descriptor(mod)
+    if not serialized:
+        return None
+    import hashlib
+    return hashlib.sha256(serialized).digest()
+
+
+def _transform_module(mod):
+    # type: (astroid.Module) -> Tuple[List[Tuple[str, Any]], Optional[str]]
+    key = _fold_key(mod) if FOLD_DUPLICATES else None
+    if key in _FOLDED:
+        with STATS.timed('transform', 'fold'):
+            installed = fold_module(mod, _FOLDED[key])
+        STATS.count('folded_modules')
+        exec_error = None  # type: Optional[str]
+    else:
+        installed = load_stub_artifact(mod)
+        exec_error = None
+        if installed is None:
+            installed, exec_error = _install_stubs(mod)
+        if key is not None and exec_error is None:
+            _FOLDED[key] = installed
+    if PRUNE_MODULES and exec_error is None:
+        with STATS.timed('transform', 'prune'):
+            prune_module(mod)
+    return installed, exec_error
+
+
+def fold_module(mod, installed):
+    # type: (astroid.Module, List[Tuple[str, Any]]) -> List[Tuple[str, Any]]
+    """
+    Installs the stubs already built for an identical module. The nodes are
+    shared rather than copied, which is what makes folding cheap, so they stay
+    parented to the first module: root() of a folded class is that module, and
+    names in the stubs resolve through its imports of the same descriptors.
+    """
+    for local_name, node in installed:
+        mod.locals[local_name] = [node]
+    return list(installed)
+
+
+def _install_stubs(mod):
+    # type: (astroid.Module) -> Tuple[List[Tuple[str, Any]], Optional[str]]
+    installed = []  # type: List[Tuple[str, Any]]
+    if _use_builtin_descriptors():
+        ns, exec_error = _module_loader()(mod)
+        names = list(ns)  # builder-style modules define these at runtime
+        transform = transform_descriptor
+        if 'DESCRIPTOR' in ns:
+            for local_name, node in _module_extensions(ns['DESCRIPTOR']):
+                node.parent = mod
+                mod.locals[local_name] = [node]
+                installed.append((local_name, node))
+    else:
+        ns, exec_error = _exec_module(mod)
+        names = mod.wildcard_import_names()
+        transform = transform_descriptor_to_class
+    qualifiers = external_qualifiers(mod, ns['DESCRIPTOR']) if 'DESCRIPTOR' in ns else {}
+    for name in names:
         try:
-            cls = mod_node_to_class(mod, name)
+            cls = ns[name]
         except KeyError:
             continue
         try:
-            for local_name, node in transform_descriptor_to_class(cls):
+            for local_name, node in transform(cls, qualifiers):
                 node.parent = mod
                 mod.locals[local_name] = [node]
+                installed.append((local_name, node))
         except NotImplementedError:
             pass
-    return mod
+    return installed, exec_error
+
+
+# protoc names the descriptors of a module _MESSAGE, _MESSAGE_NESTED, _ENUM...
+_DESCRIPTOR_VARIABLE = re.compile(r'_[A-Z0-9_]+$')
+
+
+def _keep_statement(mod, stmt):
+    # type: (astroid.Module, astroid.node_classes.NodeNG) -> bool
+    if isinstance(stmt, (astroid.Import, astroid.ImportFrom)):
+        return True
+    if not isinstance(stmt, astroid.Assign):
+        return False
+    if not all(isinstance(t, astroid.AssignName) for t in stmt.targets):
+        return False
+    return any(
+        not _DESCRIPTOR_VARIABLE.match(target.name) and target in mod.locals.get(target.name, ())
+        for target in stmt.targets
+    )
+
+
+def _module_statement(mod, node):
+    # type: (astroid.Module, astroid.node_classes.NodeNG) -> astroid.node_classes.NodeNG
+    while node.parent is not None and node.parent is not mod:
+        node = node.parent
+    return node
+
+
+def prune_module(mod):
+    # type: (astroid.Module) -> int
+    """
+    Removes the generated code that the stubs replace from a transformed
+    module, returning the number of statements removed. Imports and the
+    names that were not replaced by stubs are kept, with the serialized
+    descriptor emptied.
+    """
+    const = _serialized_const(mod)
+    if const is not None:
+        const.value = type(const.value)()
+    pruned = set(stmt for stmt in mod.body if not _keep_statement(mod, stmt))
+    if not pruned:
+        return 0
+    mod.body = [stmt for stmt in mod.body if stmt not in pruned]
+    for name, nodes in list(mod.locals.items()):
+        kept = [node for node in nodes if _module_statement(mod, node) not in pruned]
+        if kept:
+            mod.locals[name] = kept
+        else:
+            del mod.locals[name]
+    return len(pruned)
+
+
+def prebuild_imports(node):
+    # type: (Union[astroid.Import, astroid.ImportFrom]) -> None
+    """
+    Build the imported _pb2 modules that are in the location index and,
+    with builtin descriptors, the others from their headers, before they
+    are imported
+    """
+    # imports are looked up as usual when executing modules with
+    # google.protobuf, without an index
+    if not (BUILTIN_DESCRIPTORS or _WORKERS is not None or _LOCATIONS is not None
+            or _protobuf_available is False):
+        return
+    modnames = list(imported_pb2_modules(node))
+    if not modnames:
+        return
+    if _WORKERS is not None:
+        _prefetch_imports(node.root())
+    for modname in modnames:
+        if not load_indexed_module(modname) and _use_builtin_descriptors():
+            prebuild_module(modname)
+
+
+def _prefetch_imports(mod):
+    # type: (astroid.Module) -> None
+    """
+    Queue every _pb2 module that mod imports, so that the helper processes
+    get them in one batch with the first that is loaded
+    """
+    if getattr(mod, '_protobuf_prefetched', False):
+        return
+    mod._protobuf_prefetched = True
+    for node in mod.nodes_of_class((astroid.Import, astroid.ImportFrom)):
+        _WORKERS.prefetch(list(imported_pb2_modules(node)))
 
 
 def is_some_protobuf_module(node):
     # type: (astroid.Module) -> bool
     modname = node.name
-    return modname.endswith('_pb2')
+    if not modname.endswith('_pb2'):
+        return False
+    if not BUILTIN_DESCRIPTORS and _WORKERS is None:
+        _load_protobuf()
+    return True
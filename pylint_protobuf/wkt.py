@@ -0,0 +1,147 @@
+"""
+Helper members of the well-known types, precomputed per protobuf release.
+
+google.protobuf mixes helpers such as Timestamp.ToDatetime and Any.Pack into
+the well-known type classes. Their names are read from the table in
+wkt_members, so that linting never has to import the runtime for them. Each
+entry applies from its release until the next entry; to check a release,
+install it and run::
+
+    python -m pylint_protobuf.wkt
+
+which records the release and adds an entry if its members differ.
+"""
+import argparse
+import os
+import re
+import sys
+import textwrap
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .wkt_members import CHECKED_RELEASES, WKT_MEMBERS
+
+Release = Tuple[int, int]
+Members = Dict[str, Tuple[str, ...]]
+
+TABLE = os.path.join(os.path.dirname(__file__), 'wkt_members.py')
+HEADER = '''\
+# Generated by `python -m pylint_protobuf.wkt`, do not edit.
+# Public members of google.protobuf.internal.well_known_types.WKTBASES, keyed
+# by the first (major, minor) protobuf release they apply to.
+'''
+
+
+def parse_release(version):
+    # type: (str) -> Optional[Release]
+    match = re.match(r'(\d+)\.(\d+)', version)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def installed_version():
+    # type: () -> Optional[str]
+    """
+    The installed protobuf version, read from its metadata without importing it
+    """
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python < 3.8
+        return None
+    try:
+        return version('protobuf')
+    except PackageNotFoundError:
+        return None
+
+
+def installed_release():
+    # type: () -> Optional[Release]
+    version = installed_version()
+    return parse_release(version) if version is not None else None
+
+
+def members_for(release):
+    # type: (Optional[Release]) -> Members
+    """
+    Returns the table for release, the newest one if release is unknown
+    """
+    releases = sorted(WKT_MEMBERS)
+    if release is not None:
+        releases = [r for r in releases if r <= release] or releases[:1]
+    return WKT_MEMBERS[releases[-1]]
+
+
+@lru_cache(maxsize=None)
+def _installed_members():
+    # type: () -> Members
+    return members_for(installed_release())
+
+
+def wkt_members(full_name):
+    # type: (str) -> Tuple[str, ...]
+    """
+    Returns the helper members of a well-known type, or () for other messages
+    """
+    if not full_name.startswith('google.protobuf.'):
+        return ()
+    return _installed_members().get(full_name, ())
+
+
+def introspect():
+    # type: () -> Tuple[str, Members]
+    from google.protobuf import __version__
+    from google.protobuf.internal.well_known_types import WKTBASES
+    return __version__, {
+        full_name: tuple(sorted(m for m in dir(cls) if not m.startswith('_')))
+        for full_name, cls in sorted(WKTBASES.items())
+    }
+
+
+def render(tables, checked):
+    # type: (Dict[Release, Members], List[str]) -> str
+    lines = [HEADER, 'CHECKED_RELEASES = (']
+    lines += textwrap.wrap(' '.join(repr(v) + ',' for v in checked), 92,
+                           initial_indent='    ', subsequent_indent='    ')
+    lines += [')', '', 'WKT_MEMBERS = {']
+    for release, members in sorted(tables.items()):
+        lines.append('    {!r}: {{'.format(release))
+        for full_name, names in sorted(members.items()):
+            lines.append('        {!r}: ('.format(full_name))
+            lines += textwrap.wrap(' '.join(repr(n) + ',' for n in names), 84,
+                                   initial_indent='            ', subsequent_indent='            ')
+            lines.append('        ),')
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    # type: (Optional[List[str]]) -> int
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--check', action='store_true',
+                        help='exit with status 1 if the installed release differs from the table')
+    args = parser.parse_args(argv)
+
+    version, members = introspect()
+    release = parse_release(version)
+    if release is None:
+        parser.error('cannot parse protobuf version {!r}'.format(version))
+    tables = dict(WKT_MEMBERS)
+    if members_for(release) == members:
+        print('protobuf {}: matches the table'.format(version))
+        if args.check or version in CHECKED_RELEASES:
+            return 0
+    else:
+        print('protobuf {}: differs from the table'.format(version))
+        if args.check:
+            return 1
+        tables[release] = members
+    checked = sorted(set(CHECKED_RELEASES) | {version},
+                     key=lambda v: [int(p) for p in re.findall(r'\d+', v)])
+    with open(TABLE, 'w') as f:
+        f.write(render(tables, checked))
+    print('wrote ' + TABLE)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
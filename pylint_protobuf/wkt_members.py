@@ -0,0 +1,39 @@
+# Generated by `python -m pylint_protobuf.wkt`, do not edit.
+# Public members of google.protobuf.internal.well_known_types.WKTBASES, keyed
+# by the first (major, minor) protobuf release they apply to.
+
+CHECKED_RELEASES = (
+    '3.10.0', '3.14.0', '3.19.6', '3.20.3', '4.21.12', '4.25.8', '5.29.5', '6.31.1',
+)
+
+WKT_MEMBERS = {
+    (3, 10): {
+        'google.protobuf.Any': (
+            'Is', 'Pack', 'TypeName', 'Unpack',
+        ),
+        'google.protobuf.Duration': (
+            'FromJsonString', 'FromMicroseconds', 'FromMilliseconds',
+            'FromNanoseconds', 'FromSeconds', 'FromTimedelta', 'ToJsonString',
+            'ToMicroseconds', 'ToMilliseconds', 'ToNanoseconds', 'ToSeconds',
+            'ToTimedelta',
+        ),
+        'google.protobuf.FieldMask': (
+            'AllFieldsFromDescriptor', 'CanonicalFormFromMask', 'FromJsonString',
+            'Intersect', 'IsValidForDescriptor', 'MergeMessage', 'ToJsonString',
+            'Union',
+        ),
+        'google.protobuf.ListValue': (
+            'add_list', 'add_struct', 'append', 'extend', 'items',
+        ),
+        'google.protobuf.Struct': (
+            'get_or_create_list', 'get_or_create_struct', 'items', 'keys', 'update',
+            'values',
+        ),
+        'google.protobuf.Timestamp': (
+            'FromDatetime', 'FromJsonString', 'FromMicroseconds',
+            'FromMilliseconds', 'FromNanoseconds', 'FromSeconds', 'GetCurrentTime',
+            'ToDatetime', 'ToJsonString', 'ToMicroseconds', 'ToMilliseconds',
+            'ToNanoseconds', 'ToSeconds',
+        ),
+    },
+}
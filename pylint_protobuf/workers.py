@@ -0,0 +1,254 @@
+"""
+Helper processes that import _pb2 modules for the linter.
+
+Executing generated modules in the linter process registers their files in
+the shared descriptor pool, where a clash is an error, runs whatever else
+the module does on import, and a crash in native protobuf code takes pylint
+down with it. With protobuf-descriptors=worker, the modules are imported by
+long-lived helper processes instead, which send back the serialized
+FileDescriptorProto of each module and of the files it depends on, to be
+decoded like builtin descriptors.
+
+Requests are batched: loading a module also asks for the other _pb2 modules
+queued with prefetch(), and each response lists every _pb2 module the helper
+imported on the way, so that dependencies need no request of their own. A
+helper answers each module separately, so when one exits the module it was
+importing is known; that module gets an error and the rest are retried in a
+new helper. A helper that takes longer than timeout seconds to answer for
+a module is killed and treated the same way. Helpers are replaced after
+max_modules modules to bound their memory.
+
+This file is also the helper's main script. It is run by path so that the
+helper imports nothing but the standard library and the modules it is
+asked for.
+"""
+import atexit
+import os
+import pickle
+import queue
+import subprocess
+import sys
+import threading
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+BATCH_SIZE = 32
+
+# modname -> (name of its .proto file, error)
+Result = Tuple[Optional[str], Optional[str]]
+
+
+class Worker(object):
+    def __init__(self, timeout=None):
+        # type: (Optional[float]) -> None
+        self.process = None  # type: Optional[subprocess.Popen]
+        self.modules = 0
+        self.timeout = timeout
+        self.timed_out = False
+        self.responses = queue.Queue()  # type: queue.Queue
+
+    def start(self):
+        # type: () -> None
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        self.modules = 0
+        self.timed_out = False
+        # responses are read on a thread so that waiting for one can time out
+        self.responses = queue.Queue()
+        reader = threading.Thread(
+            target=_read_responses, args=(self.process.stdout, self.responses))
+        reader.daemon = True
+        reader.start()
+
+    def send(self, modnames):
+        # type: (List[str]) -> None
+        if self.process is None:
+            self.start()
+        pickle.dump({'path': sys.path, 'modules': modnames}, self.process.stdin)
+        self.process.stdin.flush()
+
+    def receive(self):
+        # type: () -> Optional[Dict[str, Any]]
+        """
+        Returns the next response, or None if the helper has exited or was
+        killed for taking longer than the timeout
+        """
+        try:
+            response = self.responses.get(timeout=self.timeout)
+        except queue.Empty:
+            self.timed_out = True
+            self.process.kill()
+            return None
+        if response is not None:
+            self.modules += 1
+        return response
+
+    def stop(self):
+        # type: () -> Optional[int]
+        process, self.process = self.process, None
+        if process is None:
+            return None
+        for stream in (process.stdin, process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        try:
+            return process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            return process.wait()
+
+
+def _read_responses(stream, responses):
+    # type: (IO[bytes], queue.Queue) -> None
+    while True:
+        try:
+            responses.put(pickle.load(stream))
+        except (EOFError, pickle.UnpicklingError, OSError, ValueError):
+            responses.put(None)
+            return
+
+
+class WorkerPool(object):
+    def __init__(self, processes=1, max_modules=0, timeout=0):
+        # type: (int, int, float) -> None
+        self.workers = [Worker(timeout or None) for _ in range(max(processes, 1))]
+        self.max_modules = max_modules
+        self.results = {}  # type: Dict[str, Result]
+        self.files = {}  # type: Dict[str, bytes]
+        self.pending = []  # type: List[str]
+        self.started = 0
+        self.requests = 0
+        atexit.register(self.close)
+
+    def prefetch(self, modnames):
+        # type: (List[str]) -> None
+        """
+        Queue modules to be loaded with the next request
+        """
+        for modname in modnames:
+            if modname not in self.results and modname not in self.pending:
+                self.pending.append(modname)
+
+    def load(self, modname):
+        # type: (str) -> Result
+        if modname not in self.results:
+            batch = [modname] + [m for m in self.pending if m != modname][:BATCH_SIZE - 1]
+            self.pending = [m for m in self.pending if m not in batch]
+            self._run(batch)
+        return self.results.get(modname, (None, 'not loaded by worker'))
+
+    def take_files(self):
+        # type: () -> Dict[str, bytes]
+        """
+        Returns and forgets the serialized files received since the last call
+        """
+        files, self.files = self.files, {}
+        return files
+
+    def _run(self, modnames):
+        # type: (List[str]) -> None
+        self.requests += 1
+        shares = [
+            (worker, modnames[i::len(self.workers)]) for i, worker in enumerate(self.workers)
+        ]
+        shares = [(worker, share) for worker, share in shares if share]
+        for worker, share in shares:
+            if worker.process is None:
+                self.started += 1
+            worker.send(share)
+        retry = []  # type: List[str]
+        for worker, share in shares:
+            retry += self._receive(worker, share)
+            if (worker.process is not None and self.max_modules
+                    and worker.modules >= self.max_modules):
+                worker.stop()
+        if retry:
+            self._run(retry)
+
+    def _receive(self, worker, modnames):
+        # type: (Worker, List[str]) -> List[str]
+        """
+        Reads the responses for modnames, returning the modules that were
+        not attempted because the helper exited
+        """
+        for i, modname in enumerate(modnames):
+            response = worker.receive()
+            if response is None:
+                timed_out, code = worker.timed_out, worker.stop()
+                if timed_out:
+                    error = 'worker timed out after {}s importing {}'.format(
+                        worker.timeout, modname)
+                else:
+                    error = 'worker exited with code {} importing {}'.format(code, modname)
+                self.results[modname] = (None, error)
+                return [m for m in modnames[i + 1:] if m not in self.results]
+            self.files.update(response['files'])
+            for name, proto in response['modules'].items():
+                self.results.setdefault(name, (proto, None))
+            self.results[modname] = (response['modules'].get(modname), response['error'])
+        return []
+
+    def close(self):
+        # type: () -> None
+        for worker in self.workers:
+            worker.stop()
+
+
+def _file_closure(file_desc, sent):
+    # type: (Any, set) -> Dict[str, bytes]
+    files = {}
+    stack = [file_desc]
+    while stack:
+        f = stack.pop()
+        if f.name in sent:
+            continue
+        sent.add(f.name)
+        files[f.name] = f.serialized_pb
+        stack.extend(f.dependencies)
+    return files
+
+
+def _import(modname, sent):
+    # type: (str, set) -> Dict[str, Any]
+    import importlib
+    before = set(sys.modules)
+    error = None
+    try:
+        importlib.import_module(modname)
+    except (Exception, SystemExit) as e:
+        error = '{}: {}'.format(type(e).__name__, e)
+    modules, files = {}, {}  # type: Dict[str, str], Dict[str, bytes]
+    for name in sorted(set(sys.modules) - before | {modname}):
+        file_desc = getattr(sys.modules.get(name), 'DESCRIPTOR', None)
+        if not name.endswith('_pb2') or not hasattr(file_desc, 'serialized_pb'):
+            continue
+        modules[name] = file_desc.name
+        files.update(_file_closure(file_desc, sent))
+    if error is None and modname not in modules:
+        error = 'ValueError: {} has no file DESCRIPTOR'.format(modname)
+    return {'error': error, 'modules': modules, 'files': files}
+
+
+def main(stdin, stdout):
+    # type: (IO[bytes], IO[bytes]) -> None
+    sent = set()  # type: set
+    while True:
+        try:
+            request = pickle.load(stdin)
+        except EOFError:
+            return
+        sys.path[:] = request['path']
+        for modname in request['modules']:
+            pickle.dump(_import(modname, sent), stdout)
+            stdout.flush()
+
+
+if __name__ == '__main__':
+    # keep the protocol on a private copy of stdout, away from anything the
+    # imported modules print
+    protocol = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+    main(sys.stdin.buffer, protocol)
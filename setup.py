@@ -36,5 +36,11 @@ setup(
         'pylint',
         'protobuf',
     ],
+    entry_points={
+        'console_scripts': [
+            'pylint-protobuf-check = pylint_protobuf.cli:main',
+            'protoc-gen-pylint-protobuf = pylint_protobuf.protoc_plugin:main',
+        ],
+    },
     zip_safe=False
 )
@@ -11,6 +11,13 @@ from pylint.lint import PyLinter
 from pylint.testutils import MinimalTestReporter
 
 import pylint_protobuf
+from pylint_protobuf.transform import _load_protobuf
+
+# the plugin imports google.protobuf on the first _pb2 module, and executing
+# well-known type modules imports well_known_types; do both before
+# proto_builder replaces sys.modules and the default descriptor pool
+_load_protobuf()
+import google.protobuf.internal.well_known_types  # noqa: E402
 
 
 @pytest.fixture(autouse=True)
@@ -96,3 +103,14 @@ def linter_factory():
                 _linter.enable(msg)
         return _linter
     return linter
+
+
+@pytest.fixture
+def set_option():
+    def set_option(linter, name, value):
+        # pylint<2.13 only sets the options of plugins with global_set_option
+        if hasattr(linter, 'global_set_option'):
+            linter.global_set_option(name, value)
+        else:
+            linter.set_option(name, value)
+    return set_option
@@ -0,0 +1,65 @@
+import io
+
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf import cli
+
+
+@pytest.fixture
+def person_pb2(proto_builder):
+    return proto_builder("""
+        message Person {
+          required string name = 1;
+        }
+    """, 'person')
+
+
+@pytest.fixture
+def client_source(person_pb2):
+    return (
+        'from person_pb2 import Person\n'
+        'p = Person(missing=1)\n'
+        'p.should_warn = 123\n'
+        'x = undefined_name\n'  # E0602 from the variables checker
+    )
+
+
+@pytest.fixture
+def client_mod(module_builder, client_source):
+    return module_builder(client_source, 'client')
+
+
+def test_only_protobuf_checker_registered():
+    linter = cli.make_linter()
+    names = {c.name for c in linter.get_checkers()}
+    assert pylint_protobuf.ProtobufDescriptorChecker.name in names
+    assert 'typecheck' not in names
+    assert 'variables' not in names
+
+
+def test_lint_files(client_mod, capsys):
+    assert cli.main([client_mod]) == 2
+    out, _ = capsys.readouterr()
+    assert '(protobuf-undefined-attribute)' in out
+    assert '(unexpected-keyword-arg)' in out
+    assert 'undefined-variable' not in out
+
+
+def test_file_list_from_stdin(client_mod, capsys, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO(client_mod + '\n'))
+    assert cli.main(['-']) == 2
+    out, _ = capsys.readouterr()
+    assert '(protobuf-undefined-attribute)' in out
+
+
+def test_source_from_stdin(client_source, capsys, monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.TextIOWrapper(io.BytesIO(client_source.encode())))
+    assert cli.main(['--from-stdin', 'client.py', '--disable', 'unexpected-keyword-arg']) == 2
+    out, _ = capsys.readouterr()
+    assert 'client.py:3:0: E5901' in out
+    assert '(unexpected-keyword-arg)' not in out
+
+
+def test_no_files_is_a_noop():
+    assert cli.main([]) == 0
@@ -0,0 +1,145 @@
+import sys
+
+import pytest
+from google.protobuf import descriptor_pb2
+
+import pylint_protobuf
+from pylint_protobuf import descriptors
+from pylint_protobuf.transform import use_builtin_descriptors
+
+
+@pytest.fixture
+def edge_pb2(proto_builder):
+    return proto_builder("""
+        enum Sign {
+          NEGATIVE = -1;
+          ZERO = 0;
+        }
+        message Outer {
+          optional group G = 1 { optional int32 x = 2; }
+          map<string, Outer> by_name = 3;
+          map<int32, string> labels = 4;
+          oneof choice {
+            int32 a = 5;
+            string b = 6;
+          }
+          optional Sign sign = 7 [default = NEGATIVE];
+          repeated Inner inners = 8;
+          extensions 100 to 200;
+          message Inner {
+            extend Outer {
+              optional int32 inner_ext = 101;
+            }
+          }
+        }
+        extend Outer {
+          optional string top_ext = 100;
+        }
+    """)
+
+
+def walk(file_desc):
+    def message(desc):
+        yield desc.full_name, desc.has_options and desc.GetOptions().map_entry
+        for f in desc.fields:
+            yield (f.full_name, f.number, f.label, f.type, f.cpp_type, f.index,
+                   f.message_type and f.message_type.full_name,
+                   f.enum_type and f.enum_type.full_name,
+                   f.containing_oneof and f.containing_oneof.name)
+        for ext in desc.extensions:
+            yield ext.full_name, ext.containing_type.full_name, ext.extension_scope.full_name
+        for nested in desc.nested_types:
+            yield from message(nested)
+        for enum in desc.enum_types:
+            yield enum.full_name, [(v.name, v.number) for v in enum.values]
+    yield file_desc.name, file_desc.package, file_desc.syntax
+    for desc in file_desc.message_types_by_name.values():
+        yield from message(desc)
+    for enum in file_desc.enum_types_by_name.values():
+        yield enum.full_name, [(v.name, v.number) for v in enum.values]
+    for ext in file_desc.extensions_by_name.values():
+        yield ext.full_name, ext.containing_type.full_name
+
+
+def test_decoded_file_matches_runtime(edge_pb2):
+    runtime = __import__(edge_pb2).DESCRIPTOR
+    pool = descriptors.DescriptorPool()
+    decoded = pool.add_serialized_file(runtime.serialized_pb)
+    assert list(walk(decoded)) == list(walk(runtime))
+
+
+def test_decoded_file_set(edge_pb2):
+    runtime = __import__(edge_pb2).DESCRIPTOR
+    file_set = descriptor_pb2.FileDescriptorSet()
+    runtime.CopyToProto(file_set.file.add())
+    pool = descriptors.DescriptorPool()
+    decoded, = pool.add_serialized_file_set(file_set.SerializeToString())
+    assert list(walk(decoded)) == list(walk(runtime))
+
+
+def test_public_dependencies():
+    pool = descriptors.DescriptorPool()
+    pool.add_serialized_file(
+        descriptor_pb2.FileDescriptorProto(name='c.proto').SerializeToString())
+    a = pool.add_serialized_file(descriptor_pb2.FileDescriptorProto(
+        name='a.proto', dependency=['b.proto', 'c.proto'], public_dependency=[1],
+    ).SerializeToString())
+    assert a.public_dependency_names == ['c.proto']
+    assert [f.name for f in a.public_dependencies] == ['c.proto']
+
+
+def test_same_name_different_file_raises():
+    pool = descriptors.DescriptorPool()
+    a = descriptor_pb2.FileDescriptorProto(name='api.proto', package='svc_a').SerializeToString()
+    b = descriptor_pb2.FileDescriptorProto(name='api.proto', package='svc_b').SerializeToString()
+    assert pool.add_serialized_file(a) is pool.add_serialized_file(a)
+    with pytest.raises(descriptors.DecodeError):
+        pool.add_serialized_file(b)
+    assert pool.files['api.proto'].package == 'svc_a'
+
+
+def test_unresolved_type_is_placeholder():
+    pool = descriptors.DescriptorPool()
+    assert pool.find_message_type('.other.Missing').name == 'Missing'
+    assert pool.find_message_type('.other.Missing').file.name == 'unresolved.proto'
+
+
+@pytest.mark.parametrize('data', [b'\x08', b'\x12\x05ab', b'\x0b\x10\x01\x14'])
+def test_truncated_or_malformed_input_raises(data):
+    with pytest.raises(descriptors.DecodeError):
+        list(descriptors.iter_fields(data))
+
+
+@pytest.fixture
+def client_mod(module_builder, edge_pb2):
+    return module_builder("""
+        import {0}
+        o = {0}.Outer(a=1)
+        o.missing = 1
+        o.inners.add()
+        o.by_name['x'].a = 2
+        s = {0}.Sign.Value('ZERO')
+        {0}.Outer(nope=1)
+    """.format(edge_pb2), 'builtin_client')
+
+
+@pytest.fixture
+def builtin_linter(linter_factory, set_option):
+    linter = linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-undefined-attribute', 'unexpected-keyword-arg'],
+    )
+    set_option(linter, 'protobuf-descriptors', 'builtin')
+    yield linter
+    use_builtin_descriptors(False)
+
+
+def test_builtin_descriptors_lint(client_mod, builtin_linter):
+    builtin_linter.check([client_mod])
+    messages = set((m.line, m.symbol) for m in builtin_linter.reporter.messages)
+    assert messages == {(4, 'protobuf-undefined-attribute'), (8, 'unexpected-keyword-arg')}
+
+
+def test_builtin_descriptors_do_not_execute_module(client_mod, edge_pb2, builtin_linter):
+    builtin_linter.check([client_mod])
+    assert edge_pb2 not in sys.modules
@@ -0,0 +1,115 @@
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf import events
+
+
+@pytest.fixture
+def person_pb2(proto_builder):
+    return proto_builder("""
+        message Person {
+          required string name = 1;
+        }
+    """)
+
+
+@pytest.fixture
+def broken_pb2(module_builder):
+    return module_builder("""
+        import does_not_exist
+        class Foo(object):
+            pass
+    """, 'failing_exec_pb2')
+
+
+@pytest.fixture
+def linter(linter_factory):
+    return linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-descriptor-checker'],
+    )
+
+
+@pytest.fixture
+def recorded():
+    received = []
+    callbacks = {name: received.append for name in events.EVENTS}
+    for name, callback in callbacks.items():
+        events.subscribe(name, callback)
+    yield received
+    for name, callback in callbacks.items():
+        events.unsubscribe(name, callback)
+
+
+def named(received, name, **data):
+    return [
+        e for e in received
+        if e.name == name and all(e.data.get(k) == v for k, v in data.items())
+    ]
+
+
+def lint(linter, module_builder, source):
+    linter.check([module_builder(source, 'client')])
+
+
+def test_transform_events(linter, module_builder, person_pb2, recorded):
+    lint(linter, module_builder, """
+        import {0}
+        {0}.Person(name='x')
+    """.format(person_pb2))
+    start, = named(recorded, pylint_protobuf.TRANSFORM_START, module=person_pb2)
+    end, = named(recorded, pylint_protobuf.TRANSFORM_END, module=person_pb2)
+    miss, = named(recorded, pylint_protobuf.CACHE_MISS, module=person_pb2)
+    assert start.timestamp <= miss.timestamp <= end.timestamp
+    assert start.data['node'] is end.data['node']
+    assert end.duration > 0
+    assert end.data['exec_error'] is None
+    assert end.data['cache_hit'] is False
+    assert [name for name, _ in end.data['stubs']] == ['Person']
+    assert miss.data['cache'] == 'exec'
+
+
+def test_exec_failure_event(linter, module_builder, broken_pb2, recorded):
+    lint(linter, module_builder, """
+        import {0}
+        {0}.Foo
+    """.format(broken_pb2))
+    failure, = named(recorded, pylint_protobuf.EXEC_FAILURE, module=broken_pb2)
+    assert isinstance(failure.data['exception'], ImportError)
+    assert failure.data['error'] == "ModuleNotFoundError: No module named 'does_not_exist'"
+
+
+def test_check_events(linter, module_builder, person_pb2, recorded):
+    lint(linter, module_builder, """
+        import {0}
+        p = {0}.Person()
+        p.name = 'x'
+    """.format(person_pb2))
+    checks = named(recorded, pylint_protobuf.CHECK)
+    assert '_assignattr' in {e.data['check'] for e in checks}
+    assert all(e.duration >= 0 for e in checks)
+    assert all(e.data['node'] is not None for e in checks)
+
+
+def test_inference_abandoned_event(linter, module_builder, recorded):
+    lint(linter, module_builder, """
+        def f(x):
+            x.y = 1
+    """)
+    abandoned = named(recorded, pylint_protobuf.INFERENCE_ABANDONED, site='_assignattr')
+    assert abandoned
+    assert abandoned[0].data['reason'] == 'uninferable'
+
+
+def test_unsubscribe_stops_delivery():
+    received = []
+    with events.subscribed(events.CHECK, received.append):
+        events.emit(events.CHECK, 0.0, check='a', node=None)
+    events.emit(events.CHECK, 0.0, check='b', node=None)
+    assert [e.data['check'] for e in received] == ['a']
+    assert not events.SUBSCRIBERS[events.CHECK]
+
+
+def test_subscribe_unknown_event():
+    with pytest.raises(ValueError):
+        events.subscribe('no_such_event', lambda e: None)
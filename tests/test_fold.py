@@ -0,0 +1,101 @@
+import io
+import re
+
+import astroid
+import pytest
+from pylint.reporters.text import TextReporter
+
+import pylint_protobuf
+from pylint_protobuf.stats import STATS
+from pylint_protobuf.transform import use_folded_duplicates
+
+SHARED = """
+    message Outer {
+      optional int32 a = 1;
+      optional Inner inner = 2;
+      message Inner {
+        optional string b = 1;
+      }
+    }
+"""
+
+
+@pytest.fixture
+def vendored(proto_builder):
+    return [proto_builder(SHARED, package=package) for package in ('vendor_a', 'vendor_b')]
+
+
+@pytest.fixture
+def folding():
+    use_folded_duplicates(True)
+    yield
+    use_folded_duplicates(False)
+
+
+def test_identical_modules_share_stubs(vendored, folding):
+    STATS.reset()
+    a, b = (astroid.MANAGER.ast_from_module_name(name) for name in vendored)
+    assert a.locals['Outer'][0] is b.locals['Outer'][0]
+    assert STATS.as_dict()['transform']['fold']['calls'] == 1
+    assert STATS.as_dict()['counts'] == {'folded_modules': 1}
+
+
+def test_folded_stubs_stay_parented_to_first_module(vendored, folding):
+    a, b = (astroid.MANAGER.ast_from_module_name(name) for name in vendored)
+    outer = b.locals['Outer'][0]
+    assert outer.parent is a and outer.root() is a
+    inner = b.getattr('Outer')[0].getattr('Inner')[0]
+    assert inner.root() is a
+    instance = next(b.igetattr('Outer')).instantiate_class()
+    assert next(instance.igetattr('inner')).name == 'Inner'
+
+
+def test_modules_not_shared_without_folding(vendored):
+    a, b = (astroid.MANAGER.ast_from_module_name(name) for name in vendored)
+    assert a.locals['Outer'][0] is not b.locals['Outer'][0]
+
+
+@pytest.fixture
+def client_mod(module_builder, vendored):
+    a, b = (name.split('.')[-1] for name in vendored)
+    return module_builder("""
+        from vendor_a import {} as a
+        from vendor_b import {} as b
+        a.Outer().inner.b = 'x'
+        b.Outer().inner.c = 'y'
+        b.Outer(missing=1)
+    """.format(a, b), 'fold_client')
+
+
+@pytest.mark.parametrize('fold', ['n', 'y'])
+def test_folding_does_not_change_messages(client_mod, linter_factory, fold, set_option):
+    linter = linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-undefined-attribute', 'unexpected-keyword-arg'],
+    )
+    set_option(linter, 'protobuf-fold-duplicates', fold)
+    try:
+        linter.check([client_mod])
+    finally:
+        use_folded_duplicates(False)
+    messages = set((m.line, m.symbol) for m in linter.reporter.messages)
+    assert messages == {(5, 'protobuf-undefined-attribute'), (6, 'unexpected-keyword-arg')}
+    assert STATS.as_dict()['counts'] == ({'folded_modules': 1} if fold == 'y' else {})
+
+
+def test_folded_modules_in_report(client_mod, linter_factory, set_option):
+    linter = linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-descriptor-checker', 'RP5901'],
+    )
+    set_option(linter, 'protobuf-fold-duplicates', 'y')
+    set_option(linter, 'reports', True)
+    out = io.StringIO()
+    linter.set_reporter(TextReporter(out))
+    try:
+        linter.check([client_mod])
+    finally:
+        use_folded_duplicates(False)
+    linter.generate_reports()
+    assert 'Protobuf counts' in out.getvalue()
+    assert re.search(r'\|folded_modules\s*\|1\s*\|', out.getvalue())
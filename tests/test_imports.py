@@ -1,6 +1,7 @@
 import pytest
 
 import pylint_protobuf
+from pylint_protobuf.transform import module_alias
 from tests._testsupport import make_message, CheckerTestCase
 
 
@@ -35,6 +36,49 @@ def wkt_mod(proto_builder):
     """)
 
 
+@pytest.fixture
+def dep_file_mod(proto_builder):
+    return proto_builder("""
+        message Dep {}
+    """, 'imports_dep_file', preamble='syntax = "proto2";\npackage deps;\n')
+
+
+@pytest.fixture
+def underscored_mod(proto_builder, dep_file_mod):
+    return proto_builder("""
+        import "imports_dep_file.proto";
+
+        message UsesDep {
+            optional deps.Dep dep = 1;
+            repeated deps.Dep deps = 2;
+        }
+    """, 'imports_uses_dep')
+
+
+@pytest.fixture
+def public_import_mod(proto_builder, dep_file_mod):
+    proto_builder("""
+        import public "imports_dep_file.proto";
+    """, 'imports_public_file', preamble='syntax = "proto2";\npackage deps;\n')
+    return proto_builder("""
+        import "imports_public_file.proto";
+
+        message UsesPublicDep {
+            optional deps.Dep dep = 1;
+        }
+    """, 'imports_uses_public_dep')
+
+
+@pytest.mark.parametrize('proto,alias', [
+    ('a.proto', 'a__pb2'),
+    ('dir/my_file.proto', 'dir_dot_my__file__pb2'),
+    ('my-file.proto', 'my__file__pb2'),
+    ('foo.bar.proto', 'foo_dot_bar__pb2'),
+])
+def test_module_alias(proto, alias):
+    assert module_alias(proto) == alias
+
+
 class TestImportedProtoDefinitions(CheckerTestCase):
     CHECKER_CLASS = pylint_protobuf.ProtobufDescriptorChecker
 
@@ -63,6 +107,30 @@ class TestImportedProtoDefinitions(CheckerTestCase):
         msg = make_message('protobuf-undefined-attribute', node.targets[0], 'Parent', 'should_warn')
         self.assert_adds_messages(node, msg)
 
+    def test_field_from_file_with_underscores_warns(self, underscored_mod):
+        node = self.extract_node("""
+        from {} import UsesDep
+        UsesDep().dep.should_warn = 123  #@
+        """.format(underscored_mod))
+        msg = make_message('protobuf-undefined-attribute', node.targets[0], 'Dep', 'should_warn')
+        self.assert_adds_messages(node, msg)
+
+    def test_repeated_field_from_other_file_warns(self, underscored_mod):
+        node = self.extract_node("""
+        from {} import UsesDep
+        UsesDep().deps.add().should_warn = 123  #@
+        """.format(underscored_mod))
+        msg = make_message('protobuf-undefined-attribute', node.targets[0], 'Dep', 'should_warn')
+        self.assert_adds_messages(node, msg)
+
+    def test_field_from_public_import_warns(self, public_import_mod):
+        node = self.extract_node("""
+        from {} import UsesPublicDep
+        UsesPublicDep().dep.should_warn = 123  #@
+        """.format(public_import_mod))
+        msg = make_message('protobuf-undefined-attribute', node.targets[0], 'Dep', 'should_warn')
+        self.assert_adds_messages(node, msg)
+
     def test_imports_of_wellknown_types(self, wkt_mod):
         node = self.extract_node("""
             from {} import UsesTimestamp
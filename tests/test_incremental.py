@@ -0,0 +1,117 @@
+import os
+import textwrap
+
+import pytest
+
+from pylint_protobuf import incremental
+
+
+@pytest.fixture
+def tree(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+
+    def write(path, source):
+        p = tmpdir.join(path)
+        p.dirpath().ensure(dir=True)
+        p.write(textwrap.dedent(source))
+    write('protos/__init__.py', '')
+    write('protos/child_pb2.py', '# -*- coding: utf-8 -*-\n# source: protos/child.proto\n')
+    write('protos/parent_pb2.py', """\
+        # source: protos/parent.proto
+        from protos import child_pb2 as protos_dot_child__pb2
+    """)
+    write('app/__init__.py', '')
+    write('app/uses_child.py', 'from protos.child_pb2 import Child\n')
+    write('app/uses_parent.py', 'import protos.parent_pb2\n')
+    write('protos/helpers.py', 'from . import child_pb2\n')
+    write('app/unrelated.py', 'import os\n')
+    return tmpdir
+
+
+def relative(paths):
+    return [os.path.relpath(path) for path in paths]
+
+
+def lint_set(changed):
+    index = incremental.DependencyIndex(['.'])
+    index.refresh()
+    lint, expansion = index.lint_set(changed)
+    return relative(lint), relative(expansion)
+
+
+def test_index_records_pb2_imports(tree):
+    index = incremental.DependencyIndex(['.'])
+    index.refresh()
+    assert index.files[str(tree.join('app/uses_child.py'))]['imports'] == ['protos.child_pb2']
+    parent = index.files[str(tree.join('protos/parent_pb2.py'))]
+    assert parent['imports'] == ['protos', 'protos.child_pb2']
+    assert parent['source'] == 'protos/parent.proto'
+
+
+def test_changed_source_file_is_linted_alone(tree):
+    assert lint_set(['app/unrelated.py']) == (['app/unrelated.py'], [])
+
+
+def test_changed_pb2_expands_to_transitive_consumers(tree):
+    lint, expansion = lint_set(['protos/child_pb2.py'])
+    assert lint == ['app/uses_child.py', 'app/uses_parent.py', 'protos/helpers.py']
+    assert expansion == lint
+
+
+def test_changed_pb2_expands_through_reexports(tree):
+    tree.join('api').ensure(dir=True)
+    tree.join('api/__init__.py').write('from protos.child_pb2 import *\n')
+    tree.join('api/alias.py').write('from protos.child_pb2 import Child as Child\n')
+    tree.join('api/public.py').write(
+        'from protos import child_pb2\nimport os\n__all__ = ["child_pb2"]\n')
+    tree.join('app/uses_api.py').write('from api import Child\n')
+    tree.join('app/uses_alias.py').write('import api.alias\n')
+    tree.join('app/uses_public.py').write('from api.public import child_pb2\n')
+    tree.join('app/uses_helpers.py').write('from protos import helpers\n')
+    lint, _ = lint_set(['protos/child_pb2.py'])
+    assert lint == [
+        'api/__init__.py', 'api/alias.py', 'api/public.py',
+        'app/uses_alias.py', 'app/uses_api.py', 'app/uses_child.py', 'app/uses_parent.py',
+        'app/uses_public.py', 'protos/helpers.py',
+    ]
+
+
+def test_index_used_from_another_directory(tree):
+    index = incremental.DependencyIndex([str(tree)])
+    index.refresh()
+    index.save('index.json')
+    tree.join('app').chdir()
+    index = incremental.DependencyIndex.load(str(tree.join('index.json')), [str(tree)])
+    assert index.refresh() == 0
+    assert relative(index.lint_set(['../protos/parent_pb2.py'])[0]) == ['uses_parent.py']
+
+
+def test_changed_proto_maps_to_generated_module(tree):
+    lint, _ = lint_set(['protos/parent.proto'])
+    assert lint == ['app/uses_parent.py']
+
+
+def test_deleted_files_are_not_linted(tree):
+    tree.join('app/unrelated.py').remove()
+    assert lint_set(['app/unrelated.py']) == ([], [])
+
+
+def test_persisted_index_only_rescans_modified_files(tree):
+    index = incremental.DependencyIndex(['.'])
+    assert index.refresh() == 8
+    index.save('index.json')
+    index = incremental.DependencyIndex.load('index.json', ['.'])
+    assert index.refresh() == 0
+    tree.join('app/unrelated.py').write('from protos import parent_pb2\n')
+    tree.join('app/unrelated.py').setmtime(0)
+    assert index.refresh() == 1
+    lint = relative(index.lint_set(['protos/parent_pb2.py'])[0])
+    assert lint == ['app/unrelated.py', 'app/uses_parent.py']
+
+
+def test_main_prints_lint_set(tree, capsys):
+    assert incremental.main(['protos/child_pb2.py']) == 0
+    out, err = capsys.readouterr()
+    assert out.split() == ['app/uses_child.py', 'app/uses_parent.py', 'protos/helpers.py']
+    assert '3 added as dependents' in err
+    assert tree.join(incremental.DEFAULT_INDEX).check()
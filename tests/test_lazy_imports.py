@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import pylint_protobuf
+
+
+def imported_after(statement):
+    code = '{}; import sys; print(" ".join(sorted(sys.modules)))'.format(statement)
+    return subprocess.check_output([sys.executable, '-c', code], universal_newlines=True).split()
+
+
+def test_plugin_import_does_not_import_protobuf():
+    modules = imported_after('import pylint.lint; import pylint_protobuf')
+    assert 'pylint_protobuf.transform' in modules
+    assert not [m for m in modules if m.startswith('google.protobuf')]
+
+
+def test_protobuf_imported_on_first_pb2_module():
+    modules = imported_after(
+        'import astroid, pylint_protobuf; astroid.parse("", module_name="lazy_pb2")'
+    )
+    assert 'google.protobuf.descriptor' in modules
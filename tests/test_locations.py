@@ -0,0 +1,106 @@
+import os
+from subprocess import check_call
+
+import astroid
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf import transform
+from pylint_protobuf.locations import LocationIndex, build_index
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    write(tmp_path / 'src' / 'pkg' / 'sub' / 'a_pb2.py',
+          '# -*- coding: utf-8 -*-\n# source: protos/a.proto\n')
+    write(tmp_path / 'src' / 'b_pb2.py', '# source: b.proto\n')
+    write(tmp_path / 'src' / 'pkg' / 'client.py', 'import b_pb2\n')
+    write(tmp_path / 'src' / '.git' / 'c_pb2.py', '# source: c.proto\n')
+    return tmp_path
+
+
+def test_index_maps_modules_and_protos(tree):
+    index = build_index([str(tree / 'src')])
+    assert sorted(index.modules) == ['b_pb2', 'pkg.sub.a_pb2']
+    assert index.module_path('pkg.sub.a_pb2') == str(tree / 'src' / 'pkg' / 'sub' / 'a_pb2.py')
+    assert index.proto_module('protos/a.proto') == 'pkg.sub.a_pb2'
+    assert index.proto_module('c.proto') is None
+
+
+def test_first_root_wins(tree):
+    write(tree / 'other' / 'b_pb2.py', '# source: b.proto\n')
+    index = build_index([str(tree / 'other'), str(tree / 'src')])
+    assert index.module_path('b_pb2') == str(tree / 'other' / 'b_pb2.py')
+
+
+def test_persisted_index_lists_changed_directories(tree):
+    path = str(tree / 'index.json')
+    roots = [str(tree / 'src')]
+    build_index(roots, path)
+    index = LocationIndex.load(path, roots)
+    assert index.refresh() == 0
+    write(tree / 'src' / 'pkg' / 'sub' / 'd_pb2.py', '# source: d.proto\n')
+    index = LocationIndex.load(path, roots)
+    assert index.refresh() == 1
+    assert index.proto_module('d.proto') == 'pkg.sub.d_pb2'
+
+
+@pytest.fixture
+def vendored(tmp_path, monkeypatch):
+    # protoc run from the proto directory, and the output vendored into a
+    # package, so that the module names do not follow the .proto paths
+    protos = tmp_path / 'protos'
+    write(protos / 'locations_dep.proto',
+          'syntax = "proto2";\nmessage Dep { optional int32 x = 1; }\n')
+    write(protos / 'locations_main.proto', (
+        'syntax = "proto2";\nimport "locations_dep.proto";\n'
+        'message Main { optional Dep dep = 1; }\n'
+    ))
+    out = tmp_path / 'gen' / 'vendored'
+    out.mkdir(parents=True)
+    check_call(['protoc', '-I', str(protos), '--python_out', str(out),
+                'locations_dep.proto', 'locations_main.proto'])
+    monkeypatch.syspath_prepend(str(tmp_path / 'gen'))
+    return tmp_path / 'gen'
+
+
+@pytest.fixture
+def client_mod(module_builder, vendored):
+    return module_builder("""
+        from vendored import locations_main_pb2
+        locations_main_pb2.Main(dep=None)
+        locations_main_pb2.Main().missing
+    """, 'locations_client')
+
+
+def test_lint_with_index(client_mod, vendored, linter_factory, monkeypatch, set_option):
+    looked_up = []
+    file_from_module_name = astroid.MANAGER.file_from_module_name
+
+    def record(modname, contextfile, *args, **kwargs):
+        looked_up.append(modname)
+        return file_from_module_name(modname, contextfile, *args, **kwargs)
+    monkeypatch.setattr(astroid.MANAGER, 'file_from_module_name', record)
+
+    linter = linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-undefined-attribute'],
+    )
+    set_option(linter, 'protobuf-descriptors', 'builtin')
+    set_option(linter, 'protobuf-index-roots', [str(vendored)])
+    try:
+        linter.check([client_mod])
+    finally:
+        transform.use_builtin_descriptors(False)
+        transform.use_location_index(None)
+    messages = set((m.line, m.symbol) for m in linter.reporter.messages)
+    assert messages == {(4, 'protobuf-undefined-attribute')}
+    assert not {'vendored.locations_main_pb2', 'vendored.locations_dep_pb2'} & set(looked_up)
+    main = astroid.MANAGER.astroid_cache['vendored.locations_main_pb2'].locals['Main'][0]
+    dep_type = main._protobuf_descriptor.fields_by_name['dep'].message_type
+    assert dep_type.file.name == 'locations_dep.proto'
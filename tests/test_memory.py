@@ -0,0 +1,68 @@
+import sys
+import tracemalloc
+
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf.memory import MEMORY
+
+
+@pytest.fixture
+def person_pb2(proto_builder):
+    return proto_builder("""
+        message Person {
+          enum Kind {
+            A = 0;
+            B = 1;
+          }
+          required string name = 1;
+          optional Kind kind = 2;
+        }
+    """)
+
+
+@pytest.fixture
+def client_mod(module_builder, person_pb2):
+    return module_builder("""
+        from {} import Person
+        Person().name
+    """.format(person_pb2), 'client')
+
+
+@pytest.fixture
+def linter(linter_factory):
+    yield linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-descriptor-checker'],
+    )
+    MEMORY.configure(0)
+
+
+def test_memory_recorded_per_module(client_mod, person_pb2, linter, set_option):
+    set_option(linter, 'protobuf-memory', 10)
+    linter.check([client_mod])
+    record, = [r for r in MEMORY.records if r['module'] == person_pb2]
+    assert record['retained_bytes'] > 0
+    if sys.version_info >= (3, 9):
+        assert record['peak_bytes'] >= record['retained_bytes']
+    else:
+        assert record['peak_bytes'] is None
+    assert record['stub_nodes'] > 0
+    assert record['module_nodes'] > 0
+    assert (record['messages'], record['enums']) == (1, 1)
+    # file, Person, 2 fields, Kind, 2 values
+    assert record['reachable_descriptors'] == 7
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_top_limited(linter):
+    MEMORY.configure(2)
+    MEMORY.merge([{'module': str(i), 'retained_bytes': i} for i in range(5)])
+    assert [r['module'] for r in MEMORY.top()] == ['4', '3']
+    MEMORY.stop()
+
+
+def test_memory_disabled_by_default(client_mod, linter):
+    linter.check([client_mod])
+    assert not MEMORY.enabled
+    assert MEMORY.records == []
@@ -0,0 +1,118 @@
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf.metrics import METRICS, BUCKETS, RunMetrics
+
+
+@pytest.fixture
+def person_pb2(proto_builder):
+    return proto_builder("""
+        message Person {
+          enum Kind {
+            A = 0;
+          }
+          required string name = 1;
+        }
+    """)
+
+
+@pytest.fixture
+def client_mod(module_builder, person_pb2):
+    return module_builder("""
+        import {0}
+        p = {0}.Person()
+        p.foo = 1
+        p.bar = 2
+        def f(x):
+            x.y = 1
+    """.format(person_pb2), 'metrics_client')
+
+
+@pytest.fixture
+def linter(linter_factory):
+    yield linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-descriptor-checker'],
+    )
+    METRICS.configure(None)
+
+
+def read_samples(path):
+    samples = {}
+    with open(str(path)) as f:
+        lines = f.read().splitlines()
+    assert lines[-1] == '# EOF'
+    for line in lines:
+        if not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_metrics_written_at_close(client_mod, linter, tmpdir, set_option):
+    path = tmpdir.join('pylint.prom')
+    set_option(linter, 'protobuf-metrics', str(path))
+    linter.check([client_mod])
+    samples = read_samples(path)
+    assert samples['pylint_protobuf_modules_transformed_total'] >= 1
+    assert samples['pylint_protobuf_messages_stubbed_total'] >= 1
+    assert samples['pylint_protobuf_enums_stubbed_total'] >= 1
+    assert samples['pylint_protobuf_cache_misses_total{cache="exec"}'] >= 1
+    assignattr_calls = samples['pylint_protobuf_inference_calls_total{site="_assignattr"}']
+    assert assignattr_calls >= 3
+    assert samples['pylint_protobuf_uninferable_nodes_total'
+                   '{reason="uninferable",site="_assignattr"}'] == 1
+    assert samples['pylint_protobuf_lint_messages_total'
+                   '{msgid="E5901",symbol="protobuf-undefined-attribute"}'] == 2
+    assert samples['pylint_protobuf_lint_messages_total'
+                   '{msgid="E5902",symbol="protobuf-enum-value"}'] == 0
+    count = samples['pylint_protobuf_transform_seconds_count']
+    assert samples['pylint_protobuf_transform_seconds_bucket{le="+Inf"}'] == count
+    assert samples['pylint_protobuf_check_seconds_count{check="_assignattr"}'] == assignattr_calls
+
+
+def test_disabled_messages_not_counted(client_mod, linter, tmpdir, set_option):
+    path = tmpdir.join('pylint.prom')
+    set_option(linter, 'protobuf-metrics', str(path))
+    linter.disable('protobuf-undefined-attribute')
+    linter.check([client_mod])
+    samples = read_samples(path)
+    assert samples['pylint_protobuf_lint_messages_total'
+                   '{msgid="E5901",symbol="protobuf-undefined-attribute"}'] == 0
+
+
+def test_histogram_buckets_cumulative_after_merge():
+    a, b = RunMetrics('a'), RunMetrics('b')
+    a.observe('transform_seconds', BUCKETS[0] / 2)
+    b.observe('transform_seconds', BUCKETS[-1] * 2)
+    b.inc('cache_hits', cache='exec')
+    a.merge(b.samples)
+    samples = {}
+    for line in a.lines()[:-1]:
+        if not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            samples[name] = value
+    assert samples['pylint_protobuf_transform_seconds_bucket{le="%r"}' % BUCKETS[0]] == '1'
+    assert samples['pylint_protobuf_transform_seconds_bucket{le="%r"}' % BUCKETS[-1]] == '1'
+    assert samples['pylint_protobuf_transform_seconds_bucket{le="+Inf"}'] == '2'
+    assert samples['pylint_protobuf_transform_seconds_count'] == '2'
+    assert samples['pylint_protobuf_cache_hits_total{cache="exec"}'] == '1'
+    assert samples['pylint_protobuf_exec_failures_total'] == '0'
+
+
+def test_label_values_escaped():
+    m = RunMetrics('m')
+    m.inc('uninferable_nodes', site='a"b\\c', reason='x')
+    assert 'pylint_protobuf_uninferable_nodes_total{reason="x",site="a\\"b\\\\c"} 1' in m.lines()
+
+
+def test_parallel_workers_do_not_write(client_mod, linter, tmpdir, set_option):
+    path = tmpdir.join('pylint.prom')
+    set_option(linter, 'protobuf-metrics', str(path))
+    checker, = [c for c in linter.get_checkers() if c.name == 'protobuf-descriptor-checker']
+    checker.open()
+    set_option(linter, 'jobs', 2)
+    checker.close()
+    assert not path.exists()
+    checker.reduce_map_data(linter, [checker.get_map_data()])
+    assert path.exists()
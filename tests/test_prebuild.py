@@ -0,0 +1,110 @@
+import io
+import os
+import textwrap
+
+import astroid
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf.prebuild import descriptor_header, imported_pb2_modules
+from pylint_protobuf.transform import use_builtin_descriptors
+
+
+def header(source):
+    return descriptor_header(io.StringIO(textwrap.dedent(source)).readline)
+
+
+def test_header_ends_after_serialized_descriptor():
+    assert header("""
+        from google.protobuf import descriptor_pool as _descriptor_pool
+        DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\\n\\x08a.proto')
+        _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+    """).splitlines()[-1].startswith('DESCRIPTOR = ')
+
+
+def test_header_includes_whole_statement():
+    assert header("""
+        DESCRIPTOR = _descriptor.FileDescriptor(
+          name='a.proto',
+          serialized_pb=_b('\\n\\x07a.proto')
+        )
+        _A = _descriptor.Descriptor()
+    """).splitlines()[-1] == ')'
+
+
+@pytest.mark.parametrize('source', [
+    'import os\n',
+    'from google.protobuf import service_reflection\nDESCRIPTOR = x.AddSerializedFile(b"")\n',
+    'DESCRIPTOR = x.AddSerializedFile(b"\n',
+])
+def test_no_header(source):
+    assert header(source) is None
+
+
+@pytest.mark.parametrize('source,expected', [
+    ('import a_pb2, os', ['a_pb2']),
+    ('import pkg.a_pb2 as a', ['pkg.a_pb2']),
+    ('from pkg import a_pb2, b', ['pkg.a_pb2']),
+    ('from pkg.a_pb2 import A', ['pkg.a_pb2']),
+    ('from . import a_pb2', ['pkg.a_pb2']),
+    ('from os import path', []),
+])
+def test_imported_pb2_modules(source, expected):
+    node, = astroid.parse(source, module_name='pkg.mod', path=os.path.join('pkg', 'mod.py')).body
+    assert list(imported_pb2_modules(node)) == expected
+
+
+@pytest.fixture
+def ext_pb2(proto_builder):
+    return proto_builder("""
+        message Outer {
+          optional int32 a = 1;
+          extensions 100 to 200;
+        }
+        extend Outer {
+          optional string top_ext = 100;
+        }
+    """)
+
+
+@pytest.fixture
+def client_mod(module_builder, ext_pb2):
+    return module_builder("""
+        import {0}
+        {0}.Outer(a=1)
+        {0}.top_ext
+        {0}.TOP_EXT_FIELD_NUMBER
+        {0}.Outer().missing
+        {0}.missing
+    """.format(ext_pb2), 'prebuild_client')
+
+
+@pytest.fixture
+def builtin_linter(linter_factory, set_option):
+    linter = linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-undefined-attribute', 'no-member'],
+    )
+    set_option(linter, 'protobuf-descriptors', 'builtin')
+    yield linter
+    use_builtin_descriptors(False)
+
+
+def test_pb2_module_built_from_header(client_mod, ext_pb2, builtin_linter):
+    builtin_linter.check([client_mod])
+    messages = set((m.line, m.symbol) for m in builtin_linter.reporter.messages)
+    assert messages == {(6, 'protobuf-undefined-attribute'), (7, 'no-member')}
+    mod = astroid.MANAGER.astroid_cache[ext_pb2]
+    assert 'Outer' in mod.locals and '_OUTER' not in mod.locals
+
+
+def test_linted_pb2_module_checked_whole(client_mod, ext_pb2, builtin_linter, tmpdir):
+    with tmpdir.join(ext_pb2 + '.py').open('a') as f:
+        f.write('BODY = DESCRIPTOR == None\n')  # after the header
+    builtin_linter.enable('singleton-comparison')
+    builtin_linter.check([client_mod, ext_pb2])
+    messages = [m.symbol for m in builtin_linter.reporter.messages]
+    assert 'singleton-comparison' in messages
+    mod = astroid.MANAGER.astroid_cache[ext_pb2]
+    assert not getattr(mod, '_protobuf_header_only', False)
+    assert 'BODY' in mod.locals and 'Outer' in mod.locals
@@ -0,0 +1,60 @@
+import io
+import os
+import pstats
+
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf.profiling import PROFILER
+
+
+@pytest.fixture
+def person_pb2(proto_builder):
+    return proto_builder("""
+        message Person {
+          required string name = 1;
+        }
+    """)
+
+
+@pytest.fixture
+def client_mod(module_builder, person_pb2):
+    return module_builder("""
+        import {0}
+        p = {0}.Person()
+        p.name = 'x'
+    """.format(person_pb2), 'profiled_client')
+
+
+@pytest.fixture
+def linter(linter_factory):
+    yield linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-descriptor-checker'],
+    )
+    PROFILER.configure(None)
+
+
+def profiled_functions(path):
+    return {name for _, _, name in pstats.Stats(path).stats}
+
+
+def test_profile_written_per_process(client_mod, linter, tmpdir, set_option):
+    prefix = str(tmpdir.join('prof'))
+    set_option(linter, 'protobuf-profile', prefix)
+    linter.check([client_mod])
+    out = io.StringIO()
+    PROFILER.report(out)
+    path = '{}.{}.pstats'.format(prefix, os.getpid())
+    assert os.path.exists(path)
+    assert path in out.getvalue()
+    functions = profiled_functions(path)
+    assert 'transform_module' in functions
+    assert 'visit_assignattr' in functions
+    assert 'check' not in functions  # PyLinter.check is outside the scope
+
+
+def test_profiler_disabled_by_default(client_mod, linter, tmpdir):
+    linter.check([client_mod])
+    assert not PROFILER.enabled
+    assert PROFILER.files() == []
@@ -0,0 +1,74 @@
+import astroid
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf.transform import use_pruned_modules, serialized_descriptor
+
+
+@pytest.fixture
+def outer_pb2(proto_builder):
+    return proto_builder("""
+        enum Sign {
+          NEGATIVE = -1;
+          ZERO = 0;
+        }
+        message Outer {
+          optional int32 a = 1;
+          optional Inner inner = 2;
+          message Inner {
+            optional string b = 1;
+          }
+        }
+    """)
+
+
+@pytest.fixture
+def pruned(outer_pb2):
+    use_pruned_modules(True)
+    try:
+        yield astroid.MANAGER.ast_from_module_name(outer_pb2)
+    finally:
+        use_pruned_modules(False)
+
+
+def test_pruned_module_keeps_imports_and_stubs(pruned):
+    assert 'Outer' in pruned.locals and 'ZERO' in pruned.locals
+    assert 'DESCRIPTOR' in pruned.locals and '_descriptor' in pruned.locals
+    assert '_OUTER' not in pruned.locals and '_SIGN' not in pruned.locals
+    kept = (astroid.Import, astroid.ImportFrom, astroid.Assign)
+    assert all(isinstance(stmt, kept) for stmt in pruned.body)
+    assert serialized_descriptor(pruned) == b''
+
+
+def test_pruned_locals_are_in_body_or_stubs(pruned):
+    for name, nodes in pruned.locals.items():
+        for node in nodes:
+            stmt = node if node.parent is pruned else node.statement()
+            assert stmt.parent is pruned, name
+
+
+@pytest.fixture
+def client_mod(module_builder, outer_pb2):
+    return module_builder("""
+        import {0}
+        o = {0}.Outer(a=1)
+        o.inner.b = 'x'
+        o.inner.c = 'y'
+        {0}.Sign.Value('ZERO')
+        {0}.missing
+    """.format(outer_pb2), 'prune_client')
+
+
+@pytest.mark.parametrize('prune', ['n', 'y'])
+def test_pruning_does_not_change_messages(client_mod, linter_factory, prune, set_option):
+    linter = linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-undefined-attribute', 'no-member'],
+    )
+    set_option(linter, 'protobuf-prune-modules', prune)
+    try:
+        linter.check([client_mod])
+    finally:
+        use_pruned_modules(False)
+    messages = set((m.line, m.symbol) for m in linter.reporter.messages)
+    assert messages == {(5, 'protobuf-undefined-attribute'), (7, 'no-member')}
@@ -0,0 +1,135 @@
+import io
+import json
+
+import pytest
+from pylint.reporters.text import TextReporter
+
+import pylint_protobuf
+from pylint_protobuf.reporter import ProtobufJSONReporter
+from pylint_protobuf.stats import STATS, SLOW_NODES
+
+
+@pytest.fixture
+def person_pb2(proto_builder):
+    return proto_builder("""
+        message Person {
+          required string name = 1;
+        }
+    """)  # uniquely named so that astroid has not cached a transformed module
+
+
+@pytest.fixture
+def client_mod(module_builder, person_pb2):
+    return module_builder("""
+        from {} import Person
+        p = Person(name='x')
+        p.should_warn = 123
+    """.format(person_pb2), 'client')
+
+
+@pytest.fixture
+def linter(linter_factory):
+    return linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-descriptor-checker'],
+    )
+
+
+def test_stats_collected_per_check_phase_and_module(client_mod, person_pb2, linter, set_option):
+    set_option(linter, 'reports', True)
+    linter.check([client_mod])
+    data = STATS.as_dict()
+    assert data['check']['_assignattr']['calls'] >= 1
+    assert data['check']['_check_init_kwargs']['calls'] == 1
+    assert data['inference']['_get_inferred_values']['calls'] >= 1
+    assert set(data['transform']) == {'exec', 'template', 'parse'}
+    assert data['module'][person_pb2]['calls'] == 1
+
+
+def test_checks_not_timed_without_report(client_mod, person_pb2, linter):
+    linter.check([client_mod])
+    data = STATS.as_dict()
+    assert data['check'] == {} and data['inference'] == {}
+    assert data['module'][person_pb2]['calls'] == 1
+
+
+def test_stats_reset_on_open(client_mod, linter):
+    STATS.add('check', 'stale', 1.0)
+    linter.check([client_mod])
+    assert 'stale' not in STATS.as_dict()['check']
+
+
+def test_stats_merged_from_worker_map_data(linter):
+    checker = pylint_protobuf.ProtobufDescriptorChecker(linter)
+    STATS.reset()
+    STATS.add('check', '_assignattr', 0.5)
+    STATS.count('folded_modules')
+    SLOW_NODES.reset(limit=1)
+    SLOW_NODES.add({'time': 0.25, 'location': 'a.py:1'})
+    data = checker.get_map_data()
+    assert STATS.as_dict()['check'] == {}
+    checker.reduce_map_data(linter, [data, data])
+    assert STATS.as_dict()['check']['_assignattr'] == {'calls': 2, 'time': 1.0}
+    assert STATS.counts() == {'folded_modules': 2}
+    assert SLOW_NODES.entries() == [{'time': 0.25, 'location': 'a.py:1'}]
+
+
+def test_report_section(client_mod, linter, set_option):
+    linter.enable('RP5901')
+    set_option(linter, 'reports', True)
+    out = io.StringIO()
+    linter.set_reporter(TextReporter(out))
+    linter.check([client_mod])
+    linter.generate_reports()
+    assert 'Protobuf checker statistics' in out.getvalue()
+    assert '_assignattr' in out.getvalue()
+
+
+def test_json_reporter_includes_stats(client_mod, linter):
+    out = io.StringIO()
+    linter.set_reporter(ProtobufJSONReporter(out))
+    linter.check([client_mod])
+    linter.generate_reports()
+    output = json.loads(out.getvalue())
+    assert [m['symbol'] for m in output['messages']] == ['protobuf-undefined-attribute']
+    assert output['protobuf']['check']['_assignattr']['calls'] >= 1
+
+
+@pytest.fixture
+def slow_nodes_mod(module_builder, person_pb2):
+    return module_builder("""
+        import random
+        from {} import Person
+        p = Person(name='x')
+        p.name
+        q = p if random.random() else 1
+        q.name
+        undefined_name.attr
+        'abc'.upper()
+    """.format(person_pb2), 'slow_nodes_client')
+
+
+def test_slowest_nodes_classified(slow_nodes_mod, linter, set_option):
+    set_option(linter, 'protobuf-slow-nodes', 50)
+    linter.check([slow_nodes_mod])
+    entries = SLOW_NODES.entries()
+    assert [e['time'] for e in entries] == sorted((e['time'] for e in entries), reverse=True)
+    kinds = {(e['expression'], e['visit']): e['kind'] for e in entries}
+    assert kinds[('Person', 'visit_call')] == 'protobuf'
+    assert kinds[('p', 'visit_attribute')] == 'protobuf'
+    assert kinds[('q', 'visit_attribute')] == 'ambiguous'
+    assert kinds[('undefined_name', 'visit_attribute')] == 'uninferable'
+    assert kinds[("'abc'", 'visit_call')] == 'non-protobuf'
+    assert all(e['location'].split(':')[0].endswith('slow_nodes_client.py') for e in entries)
+
+
+def test_slowest_nodes_limited(slow_nodes_mod, linter, set_option):
+    set_option(linter, 'protobuf-slow-nodes', 2)
+    linter.check([slow_nodes_mod])
+    assert len(SLOW_NODES.entries()) == 2
+
+
+def test_slowest_nodes_disabled_by_default(slow_nodes_mod, linter):
+    linter.check([slow_nodes_mod])
+    assert not SLOW_NODES.enabled
+    assert SLOW_NODES.entries() == []
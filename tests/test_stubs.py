@@ -0,0 +1,161 @@
+import os
+import sys
+from subprocess import check_call
+
+import astroid
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf.events import CACHE_HIT, CACHE_MISS, subscribed
+from pylint_protobuf.memory import MEMORY
+from pylint_protobuf.stubs import read_stubs, templates_key
+from pylint_protobuf.transform import _exec_module
+
+DEP = 'syntax = "proto3";\npackage {dep};\nmessage Dep {{ int32 x = 1; }}\n'
+MAIN = (
+    'syntax = "proto3";\npackage {main};\nimport "{dep}.proto";\n'
+    '// comments end up in the source_code_info passed to plugins\n'
+    'message Main {{ {dep}.Dep dep = 1; repeated {dep}.Dep deps = 2;\n'
+    '  map<string, {dep}.Dep> by_name = 3;\n'
+    '  message Inner {{ int32 y = 1; }} Inner inner = 4; }}\n'
+)
+
+
+@pytest.fixture
+def plugin(tmp_path):
+    path = tmp_path / 'protoc-gen-pylint-protobuf'
+    root = os.path.dirname(os.path.dirname(pylint_protobuf.__file__))
+    path.write_text('#!/bin/sh\nPYTHONPATH={} exec {} -m pylint_protobuf.protoc_plugin\n'.format(
+        root, sys.executable))
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def names(request):
+    # astroid caches where modules were found, so each test has its own
+    prefix = request.node.name.translate({ord(c): ord('_') for c in '[]-'})
+    return prefix + '_dep', prefix + '_main'
+
+
+def generate(plugin, protos, out, names):
+    out.mkdir(exist_ok=True)
+    check_call([
+        'protoc', '--plugin=protoc-gen-pylint-protobuf=' + plugin, '-I', str(protos),
+        '--python_out', str(out), '--pylint-protobuf_out', str(out),
+    ] + ['{}.proto'.format(name) for name in names])
+
+
+@pytest.fixture
+def generated(plugin, names, tmp_path, monkeypatch):
+    dep, main = names
+    protos = tmp_path / 'protos'
+    protos.mkdir()
+    (protos / '{}.proto'.format(dep)).write_text(DEP.format(dep=dep))
+    (protos / '{}.proto'.format(main)).write_text(MAIN.format(dep=dep, main=main))
+    generate(plugin, protos, tmp_path / 'gen', names)
+    monkeypatch.syspath_prepend(str(tmp_path / 'gen'))
+    monkeypatch.setattr(sys, 'modules', sys.modules.copy())
+    return tmp_path / 'gen'
+
+
+def test_artifacts_are_reproducible(generated, plugin, names, tmp_path):
+    generate(plugin, tmp_path / 'protos', tmp_path / 'again', names)
+    for name in names:
+        artifact = '{}_pb2.pylint.json'.format(name)
+        assert (generated / artifact).read_bytes() == (tmp_path / 'again' / artifact).read_bytes()
+    dep, main = names
+    artifact = read_stubs(str(generated / '{}_pb2.pylint.json'.format(main)))
+    qualifier = '{}_pb2'.format(dep).replace('_', '__')
+    assert artifact['qualifiers'] == {'{}.proto'.format(dep): qualifier}
+
+
+def test_dotted_proto_name(plugin, names, tmp_path, monkeypatch):
+    # protoc generates foo.bar.proto as foo/bar_pb2.py
+    _, main = names
+    dotted = main + '.dep'
+    protos = tmp_path / 'protos'
+    protos.mkdir()
+    (protos / '{}.proto'.format(dotted)).write_text(DEP.format(dep=main + '_dep'))
+    (protos / '{}.proto'.format(main)).write_text(MAIN.format(dep=dotted, main=main).replace(
+        '{}.Dep'.format(dotted), '{}_dep.Dep'.format(main)))
+    generate(plugin, protos, tmp_path / 'gen', [dotted, main])
+    assert (tmp_path / 'gen' / main / 'dep_pb2.pylint.json').exists()
+    monkeypatch.syspath_prepend(str(tmp_path / 'gen'))
+    monkeypatch.setattr(sys, 'modules', sys.modules.copy())
+    _, caches = cache_used(main + '_pb2')
+    assert caches == ['stubs']
+
+
+def cache_used(modname):
+    events = []
+    with subscribed(CACHE_HIT, events.append), subscribed(CACHE_MISS, events.append):
+        mod = astroid.MANAGER.ast_from_module_name(modname)
+    return mod, [e.data['cache'] for e in events if e.data['module'] == modname]
+
+
+def test_module_loaded_from_stubs(generated, names):
+    mod, caches = cache_used(names[1] + '_pb2')
+    assert caches == ['stubs']
+    main = mod.locals['Main'][0]
+    assert main._protobuf_descriptor.full_name == names[1] + '.Main'
+    assert main.locals['Inner'][0]._protobuf_descriptor.full_name == names[1] + '.Main.Inner'
+
+
+def test_memory_counted_without_loading(generated, names):
+    MEMORY.configure(10)
+    misses = _exec_module.cache_info().misses
+    try:
+        _, caches = cache_used(names[1] + '_pb2')
+    finally:
+        records = MEMORY.records
+        MEMORY.stop()
+        MEMORY.configure(0)
+    assert caches == ['stubs']
+    assert _exec_module.cache_info().misses == misses
+    record, = [r for r in records if r['module'] == names[1] + '_pb2']
+    # file, Main, 4 fields, ByNameEntry, 2 fields, Inner, 1 field
+    assert record['reachable_descriptors'] == 11
+
+
+@pytest.mark.parametrize('key', ['sha256', 'templates'])
+def test_stale_stubs_ignored(generated, names, key):
+    path = generated / '{}_pb2.pylint.json'.format(names[1])
+    path.write_text(path.read_text().replace('"{}": "'.format(key), '"{}": "0'.format(key)))
+    mod, caches = cache_used(names[1] + '_pb2')
+    assert caches and caches != ['stubs']
+    assert 'Main' in mod.locals
+
+
+def test_stubs_of_another_protobuf_release_ignored(generated, names):
+    path = generated / '{}_pb2.pylint.json'.format(names[1])
+    key = templates_key()
+    path.write_text(path.read_text().replace(key, key.split(':')[0] + ':protobuf-0.0.0'))
+    _, caches = cache_used(names[1] + '_pb2')
+    assert caches and caches != ['stubs']
+
+
+@pytest.fixture
+def client_mod(generated, names, module_builder):
+    dep, main = names
+    return module_builder("""
+        import {}_pb2 as dep_pb2
+        import {}_pb2 as main_pb2
+        m = main_pb2.Main(dep=dep_pb2.Dep())
+        m.deps.add().x = 1
+        m.inner.missing = 1
+        main_pb2.Main(dep=1)
+    """.format(dep, main), names[1] + '_client')
+
+
+@pytest.mark.parametrize('dep_stubs', [True, False])
+def test_lint_with_stubs(generated, names, client_mod, linter_factory, dep_stubs):
+    if not dep_stubs:  # the dependency is executed, and its descriptors come from the runtime
+        os.remove(str(generated / '{}_pb2.pylint.json'.format(names[0])))
+    linter = linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-undefined-attribute', 'protobuf-type-error'],
+    )
+    linter.check([client_mod])
+    messages = set((m.line, m.symbol) for m in linter.reporter.messages)
+    assert messages == {(6, 'protobuf-undefined-attribute'), (7, 'protobuf-type-error')}
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf.trace import TRACE, TRACE_ENV
+
+
+@pytest.fixture
+def person_pb2(proto_builder):
+    return proto_builder("""
+        message Person {
+          enum Kind {
+            A = 0;
+          }
+          message Inner {}
+          required string name = 1;
+        }
+        enum Top {
+          B = 0;
+        }
+    """)
+
+
+@pytest.fixture
+def broken_pb2(module_builder):
+    return module_builder("""
+        import does_not_exist
+        class Foo(object):
+            pass
+    """, 'broken_pb2')
+
+
+@pytest.fixture
+def linter(linter_factory):
+    yield linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-descriptor-checker'],
+    )
+    TRACE.configure(None)
+
+
+def lint(linter, module_builder, pb2):
+    mod = module_builder("""
+        import {0}
+        {0}.Foo
+        {0}.Person
+    """.format(pb2), 'client')
+    linter.check([mod])
+
+
+def read_trace(path, modname):
+    with open(str(path)) as f:
+        records = [json.loads(line) for line in f]
+    return [r for r in records if r['module'] == modname]  # skip e.g. descriptor_pb2
+
+
+def test_trace_record_per_module(linter, module_builder, person_pb2, tmpdir, set_option):
+    trace_file = tmpdir.join('trace.jsonl')
+    set_option(linter, 'protobuf-trace', str(trace_file))
+    lint(linter, module_builder, person_pb2)
+    record, = read_trace(trace_file, person_pb2)
+    assert record['messages'] == 2
+    assert record['enums'] == 2
+    assert record['stub_bytes'] > 0
+    assert record['stub_nodes'] > 0
+    assert record['exec_time'] > 0
+    assert record['template_time'] > 0
+    assert record['parse_time'] > 0
+    assert record['cache_hit'] is False
+    assert record['exec_error'] is None
+
+
+def test_trace_records_exec_error(linter, module_builder, broken_pb2, tmpdir, monkeypatch):
+    trace_file = tmpdir.join('trace.jsonl')
+    monkeypatch.setenv(TRACE_ENV, str(trace_file))
+    lint(linter, module_builder, broken_pb2)
+    record, = read_trace(trace_file, broken_pb2)
+    assert record['messages'] == 0
+    assert record['exec_error'] == "ModuleNotFoundError: No module named 'does_not_exist'"
+
+
+def test_trace_disabled_by_default(linter, module_builder, person_pb2, tmpdir, monkeypatch):
+    monkeypatch.delenv(TRACE_ENV, raising=False)
+    monkeypatch.chdir(tmpdir)
+    lint(linter, module_builder, person_pb2)
+    assert not TRACE.enabled
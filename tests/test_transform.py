@@ -1,4 +1,5 @@
 import astroid
+import pytest
 
 from pylint_protobuf import transform
 
@@ -13,3 +14,41 @@ def test_issue51():
     mod = transform.transform_module(mod_node)
     assert isinstance(mod, astroid.Module)
 
+
+@pytest.fixture
+def relative_pkg(proto_builder, tmpdir):
+    proto_builder(
+        'message Dep { optional int32 x = 1; }', 'transform_rel_dep', package='transform_rel',
+    )
+    main = proto_builder(
+        'message Main { optional transform_rel_dep.Dep dep = 1; }', 'transform_rel_main',
+        package='transform_rel',
+        preamble='syntax = "proto2";\nimport "transform_rel_dep.proto";\n',
+    )
+    path = tmpdir.join('transform_rel', 'transform_rel_main_pb2.py')
+    source = path.read()
+    assert 'import transform_rel_dep_pb2 as' in source
+    path.write(source.replace(
+        'import transform_rel_dep_pb2 as', 'from . import transform_rel_dep_pb2 as'))
+    return main
+
+
+def test_relative_import_in_package(relative_pkg):
+    mod = astroid.MANAGER.ast_from_module_name(relative_pkg)
+    ns, error = transform._exec_module(mod)
+    assert error is None
+    assert 'Main' in mod.locals
+    assert ns['__name__'] == 'transform_rel.transform_rel_main_pb2'
+
+
+def test_file_compiled_once(proto_builder, tmpdir):
+    modname = proto_builder('message M { optional int32 x = 1; }')
+    path = str(tmpdir.join(modname + '.py'))
+    with open(path) as f:
+        source = f.read()
+    misses = transform._compile_file.cache_info().misses
+    for _ in range(2):
+        mod = astroid.parse(source, module_name=modname, path=path, apply_transforms=False)
+        _, error = transform._exec_module(mod)
+        assert error is None
+    assert transform._compile_file.cache_info().misses == misses + 1
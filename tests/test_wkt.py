@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from pylint_protobuf import wkt
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_table_matches_installed_runtime():
+    version, members = wkt.introspect()
+    assert wkt.members_for(wkt.parse_release(version)) == members
+
+
+@pytest.mark.parametrize('release', [None, (2, 6), (3, 10), (99, 0)])
+def test_every_release_has_a_table(release):
+    assert 'ToDatetime' in wkt.members_for(release)['google.protobuf.Timestamp']
+
+
+def test_other_messages_have_no_members():
+    assert wkt.wkt_members('google.protobuf.Empty') == ()
+    assert wkt.wkt_members('example.Timestamp') == ()
+
+
+def test_builtin_descriptors_lint_wkt_without_protobuf(tmp_path):
+    (tmp_path / 'wkt_client.py').write_text(textwrap.dedent("""
+        from google.protobuf import timestamp_pb2
+        t = timestamp_pb2.Timestamp()
+        t.GetCurrentTime()
+        t.missing
+    """))
+    code = textwrap.dedent("""
+        import sys
+        from pylint.lint import Run
+        Run(['--load-plugins=pylint_protobuf', '--protobuf-descriptors=builtin', '--disable=all',
+             '--enable=protobuf-undefined-attribute', '--score=n', 'wkt_client.py'], exit=False)
+        print([m for m in sys.modules if m.startswith('google.protobuf')])
+    """)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.check_output([sys.executable, '-c', code], cwd=str(tmp_path), env=env,
+                                  universal_newlines=True)
+    assert "wkt_client.py:5:0: E5901: Field 'missing'" in out
+    assert out.splitlines()[-1] == '[]'
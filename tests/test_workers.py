@@ -0,0 +1,101 @@
+import pytest
+
+import pylint_protobuf
+from pylint_protobuf.events import EXEC_FAILURE, subscribed
+from pylint_protobuf.transform import use_worker_pool
+from pylint_protobuf.workers import WorkerPool
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def protos(proto_builder):
+    dep = proto_builder('message Dep { optional int32 x = 1; }', 'workers_dep')
+    preamble = 'syntax = "proto2";\npackage workers_main;\nimport "workers_dep.proto";\n'
+    main = proto_builder("""
+        message Main { optional workers_dep.Dep dep = 1; }
+    """, 'workers_main', preamble=preamble)
+    return dep, main
+
+
+def test_dependencies_arrive_with_module(protos, pool):
+    dep, main = protos
+    assert pool.load(main) == ('workers_main.proto', None)
+    assert pool.load(dep) == ('workers_dep.proto', None)
+    assert sorted(pool.take_files()) == ['workers_dep.proto', 'workers_main.proto']
+    assert pool.requests == 1
+
+
+def test_crashed_worker_is_replaced(protos, module_builder, pool):
+    _, main = protos
+    crash = module_builder("""
+        import os
+        print('side effect')
+        os._exit(3)
+    """, 'workers_crash_pb2')
+    pool.prefetch([crash, main])
+    proto, error = pool.load(crash)
+    assert proto is None and 'code 3' in error
+    assert pool.results[main] == ('workers_main.proto', None)
+    assert pool.started == 2
+
+
+def test_hanging_import_times_out(protos, module_builder):
+    _, main = protos
+    hang = module_builder("""
+        import time
+        time.sleep(60)
+    """, 'workers_hang_pb2')
+    pool = WorkerPool(timeout=3)
+    try:
+        pool.prefetch([hang, main])
+        proto, error = pool.load(hang)
+    finally:
+        pool.close()
+    assert proto is None and 'timed out' in error
+    assert pool.results[main] == ('workers_main.proto', None)
+    assert pool.started == 2
+
+
+def test_worker_replaced_after_max_modules(protos):
+    dep, main = protos
+    pool = WorkerPool(max_modules=1)
+    try:
+        pool.load(dep)
+        pool.load(main)
+    finally:
+        pool.close()
+    assert pool.started == 2
+
+
+@pytest.fixture
+def client_mod(protos, module_builder):
+    _, main = protos
+    return module_builder("""
+        import {} as pb2
+        pb2.Main().dep.x = 1
+        pb2.Main().dep.missing = 1
+        pb2.Main().missing
+    """.format(main), 'workers_client')
+
+
+def test_lint_with_workers(client_mod, linter_factory, set_option):
+    linter = linter_factory(
+        register=pylint_protobuf.register,
+        disable=['all'], enable=['protobuf-undefined-attribute'],
+    )
+    set_option(linter, 'protobuf-descriptors', 'worker')
+    failures = []
+    try:
+        with subscribed(EXEC_FAILURE, failures.append):
+            linter.check([client_mod])
+    finally:
+        use_worker_pool(None)
+    assert not failures
+    messages = set((m.line, m.symbol) for m in linter.reporter.messages)
+    assert messages == {(4, 'protobuf-undefined-attribute'), (5, 'protobuf-undefined-attribute')}